@@ -1,4 +0,0 @@
-import logging
-
-logger = logging.getLogger(__name__)
-logger.info("Accounts app is loaded")
\ No newline at end of file
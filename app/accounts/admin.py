@@ -1,10 +1,43 @@
 # accounts/admin.py
 
 from django.contrib import admin
-from .models import Account
+from django.db.models import Q
+from core.pagination import EstimatedCountPaginator
+from .models import Account, ArchivedAccount
 
 @admin.register(Account)
 class AccountAdmin(admin.ModelAdmin):
     list_display = ('username', 'email', 'first_name', 'last_name', 'created_at')
     search_fields = ('username', 'email')
-    list_filter = ('created_at',)
\ No newline at end of file
+    list_filter = ('created_at',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Match usernames and emails by case-insensitive prefix first, as the
+        autocomplete endpoint does; an index serves that. Terms no username
+        or email starts with (e.g. an email domain) fall back to the usual
+        substring search.
+        """
+        term = search_term.strip()
+        if not term:
+            return queryset, False
+        matches = queryset.filter(
+            Q(username__istartswith=term) | Q(email__istartswith=term)
+        )
+        if matches.exists():
+            return matches, False
+        return super().get_search_results(request, queryset, search_term)
+
+
+@admin.register(ArchivedAccount)
+class ArchivedAccountAdmin(admin.ModelAdmin):
+    list_display = ('username', 'email', 'updated_at', 'archived_at')
+    search_fields = ('username', 'email')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def has_add_permission(self, request):
+        # Rows only arrive here through archive_cold_rows.
+        return False
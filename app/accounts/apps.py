@@ -1,10 +1,15 @@
 # accounts/apps.py
 
+import logging
 from django.apps import AppConfig
 
+logger = logging.getLogger(__name__)
+
 class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'accounts'
 
     def ready(self):
-        import accounts.signals
\ No newline at end of file
+        import accounts.archive
+        import accounts.signals  # noqa: F401
+        logger.debug("Accounts app is loaded")
@@ -0,0 +1,29 @@
+# accounts/archive.py
+"""
+Archival of dormant accounts: accounts not updated for
+``ARCHIVAL['ACCOUNT_DORMANT_DAYS']`` days move to ``ArchivedAccount``.
+A restored account counts as updated, so it stays hot for another period.
+"""
+from datetime import timedelta
+from django.utils import timezone
+from core.archive import Archive, get_archive_settings, register_archive
+from .models import Account, ArchivedAccount
+
+
+def dormant_accounts():
+    days = get_archive_settings()['ACCOUNT_DORMANT_DAYS']
+    return Account.objects.filter(updated_at__lt=timezone.now() - timedelta(days=days))
+
+
+def touch(account):
+    account.updated_at = timezone.now()
+
+
+account_archive = register_archive(Archive(
+    'accounts',
+    Account,
+    ArchivedAccount,
+    cold=dormant_accounts,
+    unique_fields=('username', 'email', 'phone_number'),
+    on_restore=touch,
+))
@@ -0,0 +1,240 @@
+# accounts/autocomplete.py
+"""
+Prefix autocomplete over account usernames and emails.
+
+Keys are kept in one sorted list so a prefix lookup is a binary search plus
+a short forward scan. The index is loaded lazily in a background thread and
+kept current from the ``post_save``/``post_delete`` signals once the change
+commits; until it is ready, or when a lookup runs over its latency budget,
+queries fall back to ``istartswith`` lookups, which the ``UPPER()``
+expression indexes of migration 0002 serve on PostgreSQL.
+"""
+import logging
+import threading
+import time
+from bisect import bisect_left, insort
+
+from django.conf import settings
+from .models import Account
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'LIMIT': 10,
+    'MAX_LIMIT': 50,
+    'LATENCY_BUDGET_MS': 20,
+}
+
+
+def get_autocomplete_settings():
+    options = DEFAULTS.copy()
+    options.update(getattr(settings, 'ACCOUNT_AUTOCOMPLETE', {}))
+    return options
+
+
+def _keys_for(username, email):
+    keys = {(username or '').lower(), (email or '').lower()}
+    keys.discard('')
+    return keys
+
+
+class PrefixIndex:
+    """
+    A sorted ``(key, pk)`` list over lowercased usernames and emails.
+    """
+
+    def __init__(self):
+        self._keys = []
+        self._accounts = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._accounts)
+
+    def load(self, rows):
+        """Replace the contents with ``(pk, username, email)`` rows."""
+        accounts = {}
+        keys = []
+        for pk, username, email in rows:
+            accounts[pk] = (username, email)
+            keys.extend((key, pk) for key in _keys_for(username, email))
+        keys.sort()
+        with self._lock:
+            self._accounts = accounts
+            self._keys = keys
+
+    def update(self, pk, username, email):
+        with self._lock:
+            old = self._accounts.get(pk)
+            if old == (username, email):
+                return
+            if old is not None:
+                self._remove_keys(pk, *old)
+            self._accounts[pk] = (username, email)
+            for key in _keys_for(username, email):
+                insort(self._keys, (key, pk))
+
+    def remove(self, pk):
+        with self._lock:
+            old = self._accounts.pop(pk, None)
+            if old is not None:
+                self._remove_keys(pk, *old)
+
+    def _remove_keys(self, pk, username, email):
+        for key in _keys_for(username, email):
+            i = bisect_left(self._keys, (key, pk))
+            if i < len(self._keys) and self._keys[i] == (key, pk):
+                del self._keys[i]
+
+    def match(self, prefix, limit=10, budget_ms=None):
+        """
+        Return ``(results, complete)`` for accounts whose username or email
+        starts with ``prefix``, in key order.
+
+        ``complete`` is False if the scan stopped because it ran over
+        ``budget_ms``.
+        """
+        prefix = prefix.lower()
+        deadline = (
+            time.perf_counter() + budget_ms / 1000 if budget_ms is not None else None
+        )
+        results = []
+        seen = set()
+        with self._lock:
+            i = bisect_left(self._keys, (prefix,))
+            while i < len(self._keys) and len(results) < limit:
+                key, pk = self._keys[i]
+                if not key.startswith(prefix):
+                    break
+                if pk not in seen:
+                    seen.add(pk)
+                    username, email = self._accounts[pk]
+                    results.append({'id': pk, 'username': username, 'email': email})
+                i += 1
+                if (
+                    deadline is not None
+                    and not i % 64
+                    and time.perf_counter() > deadline
+                ):
+                    return results, False
+        return results, True
+
+
+class AccountAutocomplete:
+    """
+    Top-N prefix completion with an in-memory index and a database fallback.
+    """
+
+    def __init__(self, budget_ms=20):
+        self.budget_ms = budget_ms
+        self.index = PrefixIndex()
+        self._ready = False
+        self._loading = False
+        self._pending = []
+        self._lock = threading.Lock()
+
+    def load(self):
+        started = time.perf_counter()
+        with self._lock:
+            self._loading = True
+            self._pending = []
+
+        rows = Account.objects.values_list('pk', 'username', 'email')
+        self.index.load(rows.iterator(chunk_size=5000))
+
+        with self._lock:
+            # Replay changes that raced with the table scan.
+            for pk, username, email in self._pending:
+                if username is None:
+                    self.index.remove(pk)
+                else:
+                    self.index.update(pk, username, email)
+            self._pending = []
+            self._loading = False
+            self._ready = True
+        elapsed = (time.perf_counter() - started) * 1000
+        logger.info(
+            f"Loaded autocomplete index for {len(self.index)} accounts "
+            f"in {elapsed:.0f} ms"
+        )
+
+    def _load_in_background(self):
+        with self._lock:
+            if self._loading or self._ready:
+                return
+            self._loading = True
+
+        def run():
+            from django.db import connection
+            try:
+                self.load()
+            except Exception as e:
+                logger.error(f"Error loading autocomplete index: {str(e)}")
+            finally:
+                connection.close()
+                with self._lock:
+                    self._loading = False
+
+        threading.Thread(target=run, name='account-autocomplete', daemon=True).start()
+
+    def update(self, account):
+        with self._lock:
+            if self._loading:
+                self._pending.append((account.pk, account.username, account.email))
+        self.index.update(account.pk, account.username, account.email)
+
+    def remove(self, pk):
+        with self._lock:
+            if self._loading:
+                self._pending.append((pk, None, None))
+        self.index.remove(pk)
+
+    def complete(self, prefix, limit=10):
+        prefix = prefix.strip()
+        if not prefix:
+            return []
+
+        if self._ready:
+            results, complete = self.index.match(prefix, limit, self.budget_ms)
+            if complete:
+                return results
+        else:
+            self._load_in_background()
+
+        return self._complete_from_database(prefix, limit)
+
+    def _complete_from_database(self, prefix, limit):
+        prefix = prefix.lower()
+        fields = ('pk', 'username', 'email')
+        accounts = Account.objects.values_list(*fields)
+        by_username = accounts.filter(username__istartswith=prefix)
+        by_email = accounts.filter(email__istartswith=prefix)
+        rows = (
+            list(by_username.order_by('username')[:limit])
+            + list(by_email.order_by('email')[:limit])
+        )
+
+        matches = {}
+        for pk, username, email in rows:
+            key = min(k for k in _keys_for(username, email) if k.startswith(prefix))
+            matches[pk] = (key, {'id': pk, 'username': username, 'email': email})
+
+        ranked = sorted(matches.values(), key=lambda m: m[0])
+        return [entry for _, entry in ranked][:limit]
+
+
+_autocomplete = None
+_autocomplete_lock = threading.Lock()
+
+
+def get_account_autocomplete():
+    """Return the process-wide autocomplete service."""
+    global _autocomplete
+    if _autocomplete is None:
+        with _autocomplete_lock:
+            if _autocomplete is None:
+                options = get_autocomplete_settings()
+                _autocomplete = AccountAutocomplete(
+                    budget_ms=options['LATENCY_BUDGET_MS']
+                )
+    return _autocomplete
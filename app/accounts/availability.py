@@ -0,0 +1,242 @@
+# accounts/availability.py
+"""
+Username/email availability checks backed by per-process Bloom filters.
+
+A Bloom filter never gives false negatives, so a value it has not seen is
+definitely free and can be answered without touching the database. Only
+"maybe taken" answers fall through to a unique-index lookup.
+"""
+import hashlib
+import logging
+import math
+import threading
+import time
+from collections import deque
+
+from django.conf import settings
+from .models import Account, ArchivedAccount
+
+logger = logging.getLogger(__name__)
+
+# Values saved this long before a rebuild starts are replayed into the new
+# filters, covering transactions that were still open when the scan began.
+REPLAY_WINDOW = 60
+
+DEFAULTS = {
+    'FALSE_POSITIVE_RATE': 0.01,
+    'REBUILD_INTERVAL': 3600,
+    'CAPACITY_HEADROOM': 1.5,
+    'MIN_CAPACITY': 10000,
+}
+
+
+def get_availability_settings():
+    options = DEFAULTS.copy()
+    options.update(getattr(settings, 'ACCOUNT_AVAILABILITY', {}))
+    return options
+
+
+class BloomFilter:
+    """
+    A fixed-size Bloom filter over strings.
+
+    Sized for ``capacity`` items at the given false-positive rate; adding more
+    items than that still works but the false-positive rate climbs.
+    """
+
+    def __init__(self, capacity, false_positive_rate=0.01):
+        capacity = max(int(capacity), 1)
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.num_bits = max(
+            int(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2)), 8
+        )
+        self.num_hashes = max(int(round(self.num_bits / capacity * math.log(2))), 1)
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value):
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+    @property
+    def saturated(self):
+        return self.count > self.capacity
+
+
+class AvailabilityIndex:
+    """
+    Bloom filters for ``Account.username`` and ``Account.email``, including
+    archived accounts.
+
+    The filters are built lazily in a background thread and rebuilt
+    periodically, since deleted or renamed accounts cannot be removed from a
+    Bloom filter. Until the first build finishes every check goes to the
+    database.
+    """
+
+    def __init__(self, false_positive_rate=0.01, rebuild_interval=3600,
+                 capacity_headroom=1.5, min_capacity=10000):
+        self.false_positive_rate = false_positive_rate
+        self.rebuild_interval = rebuild_interval
+        self.capacity_headroom = capacity_headroom
+        self.min_capacity = min_capacity
+        # (filters, built_at), replaced as one so readers need no lock.
+        self._built = None
+        self._recent = deque()
+        self._lock = threading.Lock()
+        self._rebuilding = False
+        self._metrics = {
+            'filter_negatives': 0,
+            'database_checks': 0,
+            'false_positives': 0,
+            'rebuilds': 0,
+        }
+
+    def build(self):
+        """Build fresh filters from the accounts table."""
+        started = time.perf_counter()
+        scan_started = time.monotonic()
+
+        # Archived accounts keep their usernames and emails.
+        count = Account.objects.count() + ArchivedAccount.objects.count()
+        capacity = max(int(count * self.capacity_headroom), self.min_capacity)
+        filters = {
+            'username': BloomFilter(capacity, self.false_positive_rate),
+            'email': BloomFilter(capacity, self.false_positive_rate),
+        }
+        for model in (Account, ArchivedAccount):
+            rows = model.objects.values_list('username', 'email')
+            for username, email in rows.iterator(chunk_size=5000):
+                filters['username'].add(username.lower())
+                filters['email'].add(email.lower())
+
+        with self._lock:
+            # Replay anything saved around the time the table was scanned.
+            for saved_at, field, value in self._recent:
+                if saved_at >= scan_started - REPLAY_WINDOW:
+                    filters[field].add(value)
+            self._built = (filters, time.monotonic())
+            self._metrics['rebuilds'] += 1
+
+        elapsed = (time.perf_counter() - started) * 1000
+        logger.info(
+            f"Built availability filters for {count} accounts in {elapsed:.0f} ms"
+        )
+
+    def _rebuild_in_background(self):
+        with self._lock:
+            if self._rebuilding:
+                return
+            self._rebuilding = True
+
+        def run():
+            from django.db import connection
+            try:
+                self.build()
+            except Exception as e:
+                logger.error(f"Error building availability filters: {str(e)}")
+            finally:
+                connection.close()
+                with self._lock:
+                    self._rebuilding = False
+
+        threading.Thread(target=run, name='account-availability', daemon=True).start()
+
+    def _current_filters(self):
+        filters, built_at = self._built or (None, None)
+        stale = (
+            filters is None
+            or time.monotonic() - built_at > self.rebuild_interval
+            or any(f.saturated for f in filters.values())
+        )
+        if stale:
+            self._rebuild_in_background()
+        return filters
+
+    def add(self, username=None, email=None):
+        """Record values that are now taken."""
+        now = time.monotonic()
+        with self._lock:
+            while self._recent and self._recent[0][0] < now - REPLAY_WINDOW:
+                self._recent.popleft()
+            for field, value in (('username', username), ('email', email)):
+                if not value:
+                    continue
+                value = value.lower()
+                self._recent.append((now, field, value))
+                if self._built is not None:
+                    self._built[0][field].add(value)
+
+    def is_available(self, field, value):
+        """Return True if no account uses ``value`` for ``field``."""
+        value = value.strip().lower()
+        filters = self._current_filters()
+        if filters is not None and value not in filters[field]:
+            self._metrics['filter_negatives'] += 1
+            return True
+
+        self._metrics['database_checks'] += 1
+        # Stored values keep the case they were saved with. The UPPER()
+        # indexes (migrations 0002 and 0006) serve iexact on PostgreSQL.
+        lookup = {f'{field}__iexact': value}
+        taken = (
+            Account.objects.filter(**lookup).exists()
+            or ArchivedAccount.objects.filter(**lookup).exists()
+        )
+        if not taken and filters is not None:
+            self._metrics['false_positives'] += 1
+        return not taken
+
+    def is_username_available(self, username):
+        return self.is_available('username', username)
+
+    def is_email_available(self, email):
+        return self.is_available('email', email)
+
+    def stats(self):
+        stats = dict(self._metrics)
+        built = self._built
+        stats['built'] = built is not None
+        stats['age_seconds'] = None
+        if built is not None:
+            filters, built_at = built
+            stats['age_seconds'] = time.monotonic() - built_at
+            stats['bits'] = filters['username'].num_bits
+            stats['hashes'] = filters['username'].num_hashes
+            stats['entries'] = filters['username'].count
+        return stats
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_availability_index():
+    """Return the process-wide availability index."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                options = get_availability_settings()
+                _index = AvailabilityIndex(
+                    false_positive_rate=options['FALSE_POSITIVE_RATE'],
+                    rebuild_interval=options['REBUILD_INTERVAL'],
+                    capacity_headroom=options['CAPACITY_HEADROOM'],
+                    min_capacity=options['MIN_CAPACITY'],
+                )
+    return _index
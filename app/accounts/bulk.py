@@ -0,0 +1,292 @@
+# accounts/bulk.py
+"""
+Bulk partial updates of accounts.
+
+``bulk_update_accounts`` applies a list of ``{'id': ..., <field>: ...}``
+changes with a fixed number of queries instead of a
+``get_object``/``save`` per item:
+
+- Every item is validated by one reused ``AccountBulkUpdateSerializer``.
+  Uniqueness of usernames, emails and phone numbers (against other
+  accounts, archived accounts and the rest of the batch) is then checked
+  with one ``IN`` query per field.
+- Targets are loaded with a single locked ``in_bulk``. Ids that are not
+  found are restored from the archive, as a single update would.
+- Items touching the same fields are written together, on just those
+  fields (plus ``updated_at`` and the phone display formats), with one
+  ``UPDATE ... FROM (VALUES ...)`` per batch. Databases without
+  ``UPDATE ... FROM`` use ``bulk_update`` instead, whose ``CASE WHEN``
+  per row and field costs more to build and to run.
+
+``bulk_update`` skips ``save()``, so this module does the rest of what
+``Account.save`` does: it records the ``updated`` outbox events, checks the
+archive again after writing, and sends ``post_save`` for the in-process
+indexes. A batch that hits an integrity error falls back to saving its items
+one by one, so the error is reported against the item that caused it.
+"""
+import logging
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import IntegrityError, connections, router, transaction
+from django.db.models.signals import post_save
+from django.utils import timezone
+from rest_framework import serializers
+from core.outbox import build_event, record_events
+from .archive import account_archive
+from .models import Account, ArchivedAccount
+from .serializers import AccountBulkUpdateSerializer
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'MAX_ITEMS': 10000,
+    'BATCH_SIZE': 1000,
+}
+
+UNIQUE_MESSAGES = {
+    'username': "This username is already taken.",
+    'email': "An account with this email already exists.",
+    'phone_number': "This phone number is already in use.",
+}
+
+PHONE_FORMAT_FIELDS = ('phone_number_international', 'phone_number_national')
+
+
+def get_bulk_update_settings():
+    options = DEFAULTS.copy()
+    options.update(getattr(settings, 'ACCOUNT_BULK_UPDATE', {}))
+    return options
+
+
+def _chunks(values, size):
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def validate_items(items):
+    """
+    Validate every item. Returns ``(changes, errors, pks)``: ``{pk: validated
+    fields}`` for the valid items, ``{position: errors}`` for the rest and
+    ``{position: pk}`` for every item with a valid id.
+    """
+    child = AccountBulkUpdateSerializer(partial=True)
+    changes, errors, pks = {}, {}, {}
+    for position, item in enumerate(items):
+        try:
+            data = child.run_validation(item)
+        except serializers.ValidationError as e:
+            errors[position] = e.detail
+            continue
+        pk = pks[position] = data.pop('id')
+        if pk in changes:
+            errors[position] = {'id': ["Duplicate id in this request."]}
+            continue
+        if not data:
+            errors[position] = {'non_field_errors': ["No fields to update."]}
+            continue
+        changes[pk] = data
+    return changes, errors, pks
+
+
+def unique_conflicts(changes, using, batch_size):
+    """``{pk: {field: [message]}}`` for changes that would break uniqueness."""
+    conflicts = defaultdict(dict)
+    for field, message in UNIQUE_MESSAGES.items():
+        wanted = {pk: data[field] for pk, data in changes.items() if data.get(field)}
+        if not wanted:
+            continue
+        counts = Counter(wanted.values())
+        holders, archived = {}, set()
+        for chunk in _chunks(set(wanted.values()), batch_size):
+            holders.update(
+                Account.objects.using(using)
+                .filter(**{f'{field}__in': chunk})
+                .values_list(field, 'pk')
+            )
+            archived.update(
+                ArchivedAccount.objects.using(using)
+                .filter(**{f'{field}__in': chunk})
+                .values_list(field, flat=True)
+            )
+        for pk, value in wanted.items():
+            if counts[value] > 1 or holders.get(value, pk) != pk or value in archived:
+                conflicts[pk][field] = [message]
+    return conflicts
+
+
+def _apply(account, data, now):
+    """Set ``data`` on ``account``; returns the fields to write."""
+    for name, value in data.items():
+        setattr(account, name, value)
+    account.updated_at = now
+    fields = {*data, 'updated_at'}
+    if 'phone_number' in data:
+        account.refresh_phone_formats()
+        fields.update(PHONE_FORMAT_FIELDS)
+    return fields
+
+
+def supports_update_from(connection):
+    if connection.vendor == 'postgresql':
+        return True
+    return (
+        connection.vendor == 'sqlite'
+        and connection.Database.sqlite_version_info >= (3, 33)
+    )
+
+
+def update_from_values(model, objs, fields, using, batch_size):
+    """
+    Write ``fields`` of ``objs`` with one
+    ``WITH v AS (VALUES ...) UPDATE ... FROM v`` per batch.
+    """
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    pk = model._meta.pk
+    columns = [pk] + [model._meta.get_field(name) for name in fields]
+    batch_size = min(
+        batch_size, connection.ops.bulk_batch_size(columns, objs) or batch_size
+    )
+
+    def source(field):
+        value = f'v.{quote(field.column)}'
+        if connection.vendor == 'postgresql':
+            # VALUES columns are text until cast.
+            value = f'CAST({value} AS {field.db_type(connection)})'
+        return value
+
+    assignments = ', '.join(
+        f'{quote(field.column)} = {source(field)}' for field in columns[1:]
+    )
+    table = quote(model._meta.db_table)
+    row = '(' + ', '.join(['%s'] * len(columns)) + ')'
+    with connection.cursor() as cursor:
+        for batch in _chunks(objs, batch_size):
+            params = [
+                field.get_db_prep_save(getattr(obj, field.attname), connection)
+                for obj in batch
+                for field in columns
+            ]
+            cursor.execute(
+                f"WITH v ({', '.join(quote(field.column) for field in columns)}) "
+                f"AS (VALUES {', '.join([row] * len(batch))}) "
+                f"UPDATE {table} SET {assignments} FROM v "
+                f"WHERE {table}.{quote(pk.column)} = {source(pk)}",
+                params,
+            )
+
+
+def _write_group(accounts, fields, using, batch_size):
+    """Write one group; raises IntegrityError on any conflict."""
+    with transaction.atomic(using=using):
+        if supports_update_from(connections[using]):
+            update_from_values(Account, accounts, fields, using, batch_size)
+        else:
+            Account.objects.using(using).bulk_update(
+                accounts, fields, batch_size=batch_size
+            )
+        unique = [name for name in account_archive.unique_fields if name in fields]
+        for name in unique:
+            values = [
+                getattr(account, name) for account in accounts if getattr(account, name)
+            ]
+            for chunk in _chunks(values, batch_size):
+                if (
+                    ArchivedAccount.objects.using(using)
+                    .filter(**{f'{name}__in': chunk})
+                    .exists()
+                ):
+                    raise IntegrityError(
+                        f"Archived accounts hold some of the new {name} values"
+                    )
+
+
+def _save_one_by_one(accounts, fields, using, errors_by_pk):
+    """Fallback for a group that failed as a whole."""
+    for account in accounts:
+        try:
+            with transaction.atomic(using=using):
+                # save() records its own outbox event and post_save.
+                account.save(using=using, update_fields=fields)
+        except IntegrityError as e:
+            errors_by_pk[account.pk] = {
+                'non_field_errors': [f"Conflicts with another account: {e}"]
+            }
+
+
+def bulk_update_accounts(items, using=None):
+    """
+    Apply ``items`` (a list of dicts with an ``id`` and the fields to change).
+    Returns one result per item, in order: ``{'index', 'id', 'status'}``
+    plus ``errors`` for items that were not applied.
+    """
+    options = get_bulk_update_settings()
+    batch_size = options['BATCH_SIZE']
+    using = using or router.db_for_write(Account)
+
+    changes, errors, pks = validate_items(items)
+    errors_by_pk = {}
+    for pk, found in unique_conflicts(changes, using, batch_size).items():
+        errors_by_pk[pk] = found
+        del changes[pk]
+
+    with transaction.atomic(using=using):
+        accounts = (
+            Account.objects.using(using).select_for_update().in_bulk(list(changes))
+        )
+        for pk in set(changes) - set(accounts):
+            restored = account_archive.restore(using=using, pk=pk)
+            if restored is None:
+                errors_by_pk[pk] = {'id': ["Account not found."]}
+                del changes[pk]
+            else:
+                accounts[pk] = restored
+
+        now = timezone.now()
+        groups = defaultdict(list)
+        for pk, data in changes.items():
+            groups[frozenset(_apply(accounts[pk], data, now))].append(accounts[pk])
+
+        for fields, group in groups.items():
+            fields = sorted(fields)
+            try:
+                _write_group(group, fields, using, batch_size)
+            except IntegrityError as e:
+                logger.error(f"Bulk account update fell back to single saves: {str(e)}")
+                _save_one_by_one(group, fields, using, errors_by_pk)
+                continue
+            record_events(
+                [
+                    build_event(
+                        Account.outbox_aggregate,
+                        account.pk,
+                        'updated',
+                        account.outbox_payload(),
+                    )
+                    for account in group
+                ],
+                using=using,
+            )
+            for account in group:
+                post_save.send(
+                    sender=Account, instance=account, created=False,
+                    update_fields=frozenset(fields), raw=False, using=using,
+                )
+
+    updated = sum(1 for pk in changes if pk not in errors_by_pk)
+    logger.info(f"Bulk-updated {updated} accounts, {len(items) - updated} rejected")
+
+    results = []
+    for position, item in enumerate(items):
+        pk = pks.get(position, item.get('id') if isinstance(item, dict) else None)
+        result = {'index': position, 'id': pk}
+        if position in errors:
+            result.update(status='error', errors=errors[position])
+        elif pk in errors_by_pk:
+            result.update(status='error', errors=errors_by_pk[pk])
+        else:
+            result['status'] = 'updated'
+        results.append(result)
+    return results
@@ -0,0 +1,103 @@
+# accounts/fields.py
+"""
+A phone number model field that imports ``phonenumbers`` on first use.
+
+``phonenumber_field`` imports ``phonenumbers`` and its metadata tables as
+soon as the model module loads, which every worker boot and ``manage.py``
+run pays for. This field stores the same E.164 strings but only parses
+when a number is validated or written, and memoizes what it parsed.
+"""
+from collections import namedtuple
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.utils.deconstruct import deconstructible
+from django.utils.translation import gettext_lazy as _
+
+# Parsing is deterministic, so results are cached; sign-up and update paths
+# parse the same value several times (validation, unique check, save).
+CACHE_SIZE = 4096
+
+PhoneNumberFormats = namedtuple(
+    'PhoneNumberFormats', 'e164 international national valid'
+)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse(value, region):
+    import phonenumbers
+
+    try:
+        number = phonenumbers.parse(value, region)
+    except phonenumbers.NumberParseException:
+        return None
+    fmt = phonenumbers.PhoneNumberFormat
+    return PhoneNumberFormats(
+        e164=phonenumbers.format_number(number, fmt.E164),
+        international=phonenumbers.format_number(number, fmt.INTERNATIONAL),
+        national=phonenumbers.format_number(number, fmt.NATIONAL),
+        valid=phonenumbers.is_valid_number(number),
+    )
+
+
+def phone_number_formats(value, region=None):
+    """
+    Return the ``PhoneNumberFormats`` for ``value``, or None if it does not
+    parse. Results are memoized in a bounded LRU.
+    """
+    if not value:
+        return None
+    region = region or getattr(settings, 'PHONENUMBER_DEFAULT_REGION', None)
+    return _parse(str(value).strip(), region)
+
+
+def to_e164(value, region=None):
+    """Return ``value`` in E.164, or unchanged if it does not parse."""
+    formats = phone_number_formats(value, region)
+    return formats.e164 if formats is not None else value
+
+
+@deconstructible
+class PhoneNumberValidator:
+    message = _("The phone number entered is not valid.")
+    code = 'invalid'
+
+    def __init__(self, region=None):
+        self.region = region
+
+    def __call__(self, value):
+        formats = phone_number_formats(value, self.region)
+        if formats is None or not formats.valid:
+            raise ValidationError(self.message, code=self.code)
+
+    def __eq__(self, other):
+        return isinstance(other, PhoneNumberValidator) and self.region == other.region
+
+
+class PhoneNumberField(models.CharField):
+    """
+    Stores phone numbers as E.164 strings.
+    """
+    description = _("Phone number")
+
+    def __init__(self, *args, region=None, **kwargs):
+        kwargs.setdefault('max_length', 128)
+        self.region = region
+        super().__init__(*args, **kwargs)
+        self.validators.append(PhoneNumberValidator(region))
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs['region'] = self.region
+        return name, path, args, kwargs
+
+    def to_python(self, value):
+        return to_e164(super().to_python(value), self.region)
+
+    def get_prep_value(self, value):
+        return to_e164(super().get_prep_value(value), self.region)
+
+    def formats(self, value):
+        return phone_number_formats(value, self.region)
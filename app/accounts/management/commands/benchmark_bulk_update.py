@@ -0,0 +1,112 @@
+# accounts/management/commands/benchmark_bulk_update.py
+
+import time
+from types import SimpleNamespace
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework.views import APIView
+from ...bulk import get_bulk_update_settings
+from ...models import Account
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare PATCHing accounts one request at a time with the bulk PATCH "
+        "endpoint, through the full request stack. All data is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000)
+        parser.add_argument(
+            '--batch', type=int, default=get_bulk_update_settings()['MAX_ITEMS'],
+            help="Items per bulk request.",
+        )
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        # Rate limits would stop the single-request run long before the end.
+        APIView.throttle_classes.clear()
+        client = APIClient()
+        client.force_authenticate(
+            user=SimpleNamespace(pk=1, is_authenticated=True, is_staff=True)
+        )
+
+        with override_settings(ALLOWED_HOSTS=['*']), transaction.atomic():
+            pks = self._load(rows)
+            single = self._measure(lambda: self._single(client, pks, 'single'))
+            bulk = self._measure(
+                lambda: self._bulk(client, pks, 'bulk', options['batch'])
+            )
+            transaction.set_rollback(True)
+
+        self.stdout.write(
+            f"database: {connection.vendor}, rows: {rows}, "
+            f"bulk batch: {options['batch']}"
+        )
+        results = (('one PATCH per row', single), ('bulk PATCH', bulk))
+        for label, (elapsed, queries) in results:
+            self.stdout.write(
+                f"{label:<18} total={elapsed:8.2f} s  "
+                f"per-row={elapsed / rows * 1000:7.3f} ms  queries={queries}"
+            )
+        self.stdout.write(self.style.SUCCESS(f"speedup: {single[0] / bulk[0]:.1f}x"))
+
+    def _load(self, rows):
+        Account.objects.bulk_create(
+            [
+                Account(
+                    username=f'bulkbench{i}',
+                    email=f'bulkbench{i}@example.com',
+                    password='x',
+                    first_name='Bench',
+                    last_name=f'User{i}',
+                )
+                for i in range(rows)
+            ],
+            batch_size=1000,
+        )
+        return list(
+            Account.objects.filter(username__startswith='bulkbench')
+            .order_by('pk')
+            .values_list('pk', flat=True)
+        )
+
+    def _measure(self, run):
+        queries = [0]
+
+        def count(execute, sql, params, many, context):
+            queries[0] += 1
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count):
+            started = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - started
+        return elapsed, queries[0]
+
+    def _single(self, client, pks, tag):
+        for pk in pks:
+            response = client.patch(
+                reverse('account-detail', args=[pk]),
+                {'address': f'{pk} {tag} road'},
+                format='json',
+            )
+            if response.status_code != 200:
+                self.stderr.write(f"PATCH {pk}: {response.status_code}")
+
+    def _bulk(self, client, pks, tag, batch):
+        for start in range(0, len(pks), batch):
+            items = [
+                {'id': pk, 'address': f'{pk} {tag} road'}
+                for pk in pks[start:start + batch]
+            ]
+            response = client.patch(
+                reverse('account-bulk-update'), items, format='json'
+            )
+            if response.status_code != 200:
+                self.stderr.write(
+                    f"bulk PATCH: {response.status_code} {response.data.get('failed')}"
+                )
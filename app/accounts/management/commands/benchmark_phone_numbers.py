@@ -0,0 +1,91 @@
+# accounts/management/commands/benchmark_phone_numbers.py
+
+import random
+import statistics
+import time
+from django.core.management.base import BaseCommand
+from ...fields import _parse, phone_number_formats
+from ...models import Account
+from ...serializers import AccountDetailSerializer
+
+AREA_CODES = ['212', '312', '415', '617', '650', '702', '718', '805']
+
+
+class Command(BaseCommand):
+    help = (
+        "Micro-benchmark phone number handling for accounts: rendering with "
+        "stored display formats vs formatting per render, and the write path "
+        "with and without the parse cache. Nothing touches the database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--accounts', type=int, default=10000)
+        parser.add_argument('--repeat', type=int, default=3)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        raw = [
+            f"+1 ({rng.choice(AREA_CODES)}) "
+            f"{rng.randint(200, 999)}-{rng.randint(0, 9999):04d}"
+            for _ in range(options['accounts'])
+        ]
+        accounts = [self._account(i, number) for i, number in enumerate(raw)]
+        repeat = options['repeat']
+
+        def render_stored():
+            AccountDetailSerializer(accounts, many=True).data
+
+        def render_formatting():
+            # What rendering cost when every load/render parsed the number.
+            for account in accounts:
+                _parse.__wrapped__(account.phone_number, None)
+            AccountDetailSerializer(accounts, many=True).data
+
+        # Validation, the unique check and save each normalize the value.
+        def write_uncached():
+            for number in raw:
+                for _ in range(3):
+                    _parse.__wrapped__(number, None)
+
+        def write_cached():
+            _parse.cache_clear()
+            for number in raw:
+                for _ in range(3):
+                    phone_number_formats(number)
+
+        count = len(accounts)
+        self.stdout.write(f"accounts: {count}")
+        for label, func in [
+            ('render, stored formats', render_stored),
+            ('render, format per row', render_formatting),
+            ('write path, uncached', write_uncached),
+            ('write path, LRU', write_cached),
+        ]:
+            timings = self._time(func, repeat)
+            median = statistics.median(timings)
+            self.stdout.write(
+                f"{label:<24} {median:8.1f} ms  "
+                f"({median * 1000 / count:.1f} us/account)"
+            )
+        self.stdout.write(f"parse cache: {_parse.cache_info()}")
+
+    def _account(self, pk, number):
+        account = Account(
+            pk=pk,
+            username=f'bench{pk}',
+            email=f'bench{pk}@example.com',
+            first_name='Bench',
+            last_name=f'User{pk}',
+            phone_number=number,
+        )
+        account.refresh_phone_formats()
+        return account
+
+    def _time(self, func, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started) * 1000)
+        return timings
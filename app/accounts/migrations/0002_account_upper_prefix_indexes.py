@@ -0,0 +1,42 @@
+# Generated by Django 4.2 on 2024-11-29 12:00
+
+from django.db import migrations
+
+# On PostgreSQL, istartswith and iexact compile to
+# UPPER(column::text) LIKE/= UPPER(%s). Django's own "_like" index is on the
+# bare column, so only an index on the UPPER() expression can serve them.
+UPPER_INDEXES = [
+    ('idx_accounts_username_upper', 'username'),
+    ('idx_accounts_email_upper', 'email'),
+]
+
+
+def create_upper_indexes(apps, schema_editor):
+    # text_pattern_ops lets LIKE 'ABC%' use the btree under any collation.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, column in UPPER_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+            f"ON accounts_account (UPPER({column}) text_pattern_ops)"
+        )
+
+
+def drop_upper_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _ in UPPER_INDEXES:
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_upper_indexes, drop_upper_indexes),
+    ]
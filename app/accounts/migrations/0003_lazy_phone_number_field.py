@@ -0,0 +1,21 @@
+# Generated by Django 4.2 on 2024-12-06 12:00
+
+import accounts.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_account_upper_prefix_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='account',
+            name='phone_number',
+            field=accounts.fields.PhoneNumberField(
+                blank=True, max_length=128, null=True, region=None, unique=True
+            ),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 4.2 on 2024-12-09 12:00
+
+from django.db import migrations, models
+
+
+def fill_phone_formats(apps, schema_editor):
+    from accounts.fields import phone_number_formats
+
+    Account = apps.get_model('accounts', 'Account')
+    db = schema_editor.connection.alias
+    accounts = (
+        Account.objects.using(db)
+        .exclude(phone_number__isnull=True)
+        .exclude(phone_number='')
+        .only('pk', 'phone_number')
+    )
+    batch = []
+    for account in accounts.iterator(chunk_size=2000):
+        formats = phone_number_formats(account.phone_number)
+        if formats is None:
+            continue
+        account.phone_number_international = formats.international
+        account.phone_number_national = formats.national
+        batch.append(account)
+        if len(batch) >= 2000:
+            Account.objects.using(db).bulk_update(
+                batch, ['phone_number_international', 'phone_number_national']
+            )
+            batch = []
+    if batch:
+        Account.objects.using(db).bulk_update(
+            batch, ['phone_number_international', 'phone_number_national']
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_lazy_phone_number_field'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='account',
+            name='phone_number_international',
+            field=models.CharField(
+                blank=True, default='', editable=False, max_length=64
+            ),
+        ),
+        migrations.AddField(
+            model_name='account',
+            name='phone_number_national',
+            field=models.CharField(
+                blank=True, default='', editable=False, max_length=64
+            ),
+        ),
+        migrations.RunPython(fill_phone_formats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2 on 2024-12-14 09:00
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_account_phone_number_formats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedAccount',
+            fields=[
+                (
+                    'archived_at',
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('username', models.CharField(max_length=50, unique=True)),
+                ('email', models.EmailField(max_length=100, unique=True)),
+                ('password', models.CharField(max_length=255)),
+                ('first_name', models.CharField(max_length=50)),
+                ('last_name', models.CharField(max_length=50)),
+                (
+                    'phone_number',
+                    models.CharField(blank=True, max_length=20, null=True, unique=True),
+                ),
+                (
+                    'phone_number_international',
+                    models.CharField(blank=True, default='', max_length=64),
+                ),
+                (
+                    'phone_number_national',
+                    models.CharField(blank=True, default='', max_length=64),
+                ),
+                ('address', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Archived account',
+                'verbose_name_plural': 'Archived accounts',
+            },
+        ),
+    ]
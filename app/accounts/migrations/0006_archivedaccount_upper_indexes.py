@@ -0,0 +1,40 @@
+# Generated by Django 4.2 on 2024-12-16 09:00
+
+from django.db import migrations
+
+# The availability check looks archived usernames and emails up with iexact,
+# i.e. UPPER(column::text) = UPPER(%s) on PostgreSQL (see 0002).
+UPPER_INDEXES = [
+    ('idx_archivedaccount_username_upper', 'username'),
+    ('idx_archivedaccount_email_upper', 'email'),
+]
+
+
+def create_upper_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, column in UPPER_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+            f"ON accounts_archivedaccount (UPPER({column}))"
+        )
+
+
+def drop_upper_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _ in UPPER_INDEXES:
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('accounts', '0005_archivedaccount'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_upper_indexes, drop_upper_indexes),
+    ]
@@ -1,16 +1,22 @@
 # accounts/models.py
 
 import logging
-from django.db import models
+from django.db import models, router, transaction
 from django.core.validators import RegexValidator, MinLengthValidator
 from django.utils import timezone
 from django.contrib.auth.hashers import make_password, check_password
-from phonenumber_field.modelfields import PhoneNumberField
+from core.archive import ArchivedModel
+from core.outbox import OutboxMixin
+from .fields import PhoneNumberField
 
 # Get an instance of a logger
 logger = logging.getLogger(__name__)
 
-class Account(models.Model):
+
+class Account(OutboxMixin, models.Model):
+    outbox_aggregate = 'account'
+    outbox_exclude = ('password',)
+
     username = models.CharField(
         max_length=50, 
         unique=True, 
@@ -30,6 +36,13 @@ class Account(models.Model):
     first_name = models.CharField(max_length=50)
     last_name = models.CharField(max_length=50)
     phone_number = PhoneNumberField(null=True, blank=True, unique=True)
+    # Display formats of phone_number, kept in step by save().
+    phone_number_international = models.CharField(
+        max_length=64, blank=True, default='', editable=False
+    )
+    phone_number_national = models.CharField(
+        max_length=64, blank=True, default='', editable=False
+    )
     address = models.TextField(null=True, blank=True)
     created_at = models.DateTimeField(default=timezone.now, editable=False)
     updated_at = models.DateTimeField(default=timezone.now)
@@ -40,10 +53,35 @@ class Account(models.Model):
     def check_password(self, raw_password):
         return check_password(raw_password, self.password)
 
+    def refresh_phone_formats(self):
+        """Normalize phone_number to E.164 and fill in its display formats."""
+        formats = self._meta.get_field('phone_number').formats(self.phone_number)
+        if formats is not None:
+            self.phone_number = formats.e164
+        self.phone_number_international = formats.international if formats else ''
+        self.phone_number_national = formats.national if formats else ''
+
     def save(self, *args, **kwargs):
+        from .archive import account_archive
+
         try:
             self.updated_at = timezone.now()
-            super().save(*args, **kwargs)
+            if 'phone_number' not in self.get_deferred_fields():
+                self.refresh_phone_formats()
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None and 'phone_number' in update_fields:
+                kwargs['update_fields'] = {
+                    *update_fields,
+                    'phone_number_international',
+                    'phone_number_national',
+                }
+            using = kwargs.get('using')
+            using = using or router.db_for_write(type(self), instance=self)
+            with transaction.atomic(using=using, savepoint=False):
+                super().save(*args, **kwargs)
+                # Usernames, emails and phone numbers stay unique across the
+                # archive too.
+                account_archive.ensure_unique(self, using, kwargs.get('update_fields'))
         except Exception as e:
             logger.error(f"Error saving Account: {type(e).__name__}")
             raise
@@ -58,3 +96,29 @@ class Account(models.Model):
             models.Index(fields=['email'], name='idx_accounts_email'),
             models.Index(fields=['username'], name='idx_accounts_username'),
         ]
+
+
+class ArchivedAccount(ArchivedModel):
+    """
+    An ``Account`` moved out of the hot table by ``accounts.archive``.
+    Same columns and primary key; restored when the account is changed.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    username = models.CharField(max_length=50, unique=True)
+    email = models.EmailField(max_length=100, unique=True)
+    password = models.CharField(max_length=255)
+    first_name = models.CharField(max_length=50)
+    last_name = models.CharField(max_length=50)
+    phone_number = models.CharField(max_length=20, null=True, blank=True, unique=True)
+    phone_number_international = models.CharField(max_length=64, blank=True, default='')
+    phone_number_national = models.CharField(max_length=64, blank=True, default='')
+    address = models.TextField(null=True, blank=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name = 'Archived account'
+        verbose_name_plural = 'Archived accounts'
+
+    def __str__(self):
+        return self.username
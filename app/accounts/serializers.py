@@ -1,11 +1,29 @@
 from rest_framework import serializers
-from phonenumber_field.serializerfields import PhoneNumberField
-from .models import Account
+from rest_framework.validators import UniqueValidator
+from .fields import phone_number_formats
+from .models import Account, ArchivedAccount
 import logging
 
 # Get an instance of a logger
 logger = logging.getLogger(__name__)
 
+
+def normalize_phone_number(value):
+    """Return ``value`` in E.164; parse results come from a bounded LRU."""
+    if not value:
+        return value
+    formats = phone_number_formats(value)
+    if formats is None or not formats.valid:
+        raise serializers.ValidationError("Enter a valid phone number.")
+    return formats.e164
+
+
+def check_not_archived(field, value, message):
+    """Unique fields must not reuse a value held by an archived account."""
+    if value and ArchivedAccount.objects.filter(**{field: value}).exists():
+        raise serializers.ValidationError(message)
+    return value
+
 class AccountCreateSerializer(serializers.ModelSerializer):
     """
     Serializer for creating new Account instances.
@@ -31,11 +49,23 @@ class AccountCreateSerializer(serializers.ModelSerializer):
         """Validate username length and uniqueness."""
         if len(value) < 3:
             raise serializers.ValidationError("Username must be at least 3 characters long.")
-        return value.lower()
+        return check_not_archived(
+            'username', value.lower(), "This username is already taken."
+        )
 
     def validate_email(self, value):
         """Validate email format and uniqueness."""
-        return value.lower()
+        return check_not_archived(
+            'email', value.lower(), "An account with this email already exists."
+        )
+
+    def validate_phone_number(self, value):
+        """Normalize the phone number to E.164."""
+        return check_not_archived(
+            'phone_number',
+            normalize_phone_number(value),
+            "This phone number is already in use.",
+        )
 
     def validate(self, data):
         """Validate password match and complexity."""
@@ -75,9 +105,11 @@ class AccountDetailSerializer(serializers.ModelSerializer):
         model = Account
         fields = [
             'id', 'username', 'email', 'first_name', 'last_name',
-            'full_name', 'phone_number', 'address', 'created_at', 'updated_at'
+            'full_name', 'phone_number', 'phone_number_international',
+            'phone_number_national', 'address', 'created_at', 'updated_at'
         ]
         read_only_fields = ['created_at', 'updated_at']
+        projection_requires = {'full_name': ['first_name', 'last_name']}
 
     def get_full_name(self, obj):
         """Return the user's full name."""
@@ -104,6 +136,22 @@ class AccountUpdateSerializer(serializers.ModelSerializer):
             'email': {'required': False},
         }
 
+    def validate_username(self, value):
+        return check_not_archived('username', value, "This username is already taken.")
+
+    def validate_email(self, value):
+        return check_not_archived(
+            'email', value, "An account with this email already exists."
+        )
+
+    def validate_phone_number(self, value):
+        """Normalize the phone number to E.164."""
+        return check_not_archived(
+            'phone_number',
+            normalize_phone_number(value),
+            "This phone number is already in use.",
+        )
+
     def validate(self, data):
         """Validate password change if requested."""
         if 'new_password' in data or 'current_password' in data:
@@ -143,4 +191,39 @@ class AccountUpdateSerializer(serializers.ModelSerializer):
             return instance
         except Exception as e:
             logger.error(f"Error updating account: {str(e)}")
-            raise serializers.ValidationError("Failed to update account.")
\ No newline at end of file
+            raise serializers.ValidationError("Failed to update account.")
+
+
+class AccountBulkUpdateSerializer(serializers.ModelSerializer):
+    """
+    One item of a bulk partial update (see ``accounts.bulk``). Uniqueness is
+    checked for the whole batch at once there, so the per-item unique
+    validators, a query each, are left out.
+    """
+    id = serializers.IntegerField()
+
+    class Meta:
+        model = Account
+        fields = [
+            'id', 'username', 'email', 'first_name', 'last_name',
+            'phone_number', 'address'
+        ]
+
+    def get_fields(self):
+        fields = super().get_fields()
+        for field in fields.values():
+            field.validators = [
+                validator for validator in field.validators
+                if not isinstance(validator, UniqueValidator)
+            ]
+        return fields
+
+    def validate_phone_number(self, value):
+        """Normalize the phone number to E.164."""
+        return normalize_phone_number(value)
+
+    def validate(self, data):
+        # Partial validation does not enforce required fields.
+        if 'id' not in data:
+            raise serializers.ValidationError({'id': "This field is required."})
+        return data
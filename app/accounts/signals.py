@@ -1,8 +1,12 @@
 # accounts/signals.py
 
-from django.db.models.signals import post_save
+import copy
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from .models import Account
+from .autocomplete import get_account_autocomplete
+from .availability import get_availability_index
 import logging
 
 logger = logging.getLogger(__name__)
@@ -11,3 +15,24 @@ logger = logging.getLogger(__name__)
 def log_account_creation(sender, instance, created, **kwargs):
     if created:
         logger.info(f"New account created: {instance.username}")
+
+
+@receiver(post_save, sender=Account)
+def update_availability_index(sender, instance, **kwargs):
+    get_availability_index().add(username=instance.username, email=instance.email)
+
+
+# The autocomplete index only learns about committed changes, so a rolled-back
+# save or delete leaves nothing behind.
+@receiver(post_save, sender=Account)
+def update_autocomplete_index(sender, instance, using=None, **kwargs):
+    account = copy.copy(instance)
+    transaction.on_commit(
+        lambda: get_account_autocomplete().update(account), using=using
+    )
+
+
+@receiver(post_delete, sender=Account)
+def remove_from_autocomplete_index(sender, instance, using=None, **kwargs):
+    pk = instance.pk
+    transaction.on_commit(lambda: get_account_autocomplete().remove(pk), using=using)
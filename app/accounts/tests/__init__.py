@@ -2,3 +2,7 @@
 
 from .test_models import AccountModelTest
 from .test_urls import TestUrls
+from .test_availability import BloomFilterTest, AvailabilityIndexTest  # noqa: F401
+from .test_autocomplete import PrefixIndexTest, AccountAutocompleteTest  # noqa: F401
+from .test_fields import PhoneNumberFieldTest  # noqa: F401
+from .test_bulk import AccountBulkUpdateTest  # noqa: F401
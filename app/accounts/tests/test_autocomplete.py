@@ -0,0 +1,104 @@
+# accounts/tests/test_autocomplete.py
+
+from unittest import mock
+from django.contrib.admin.sites import AdminSite
+from django.db import transaction
+from django.test import RequestFactory, TestCase
+from ..admin import AccountAdmin
+from ..autocomplete import AccountAutocomplete, PrefixIndex
+from ..models import Account
+
+
+class PrefixIndexTest(TestCase):
+    def setUp(self):
+        self.index = PrefixIndex()
+        self.index.load([
+            (1, 'alice', 'alice@example.com'),
+            (2, 'alina', 'a.l@example.com'),
+            (3, 'bob', 'bob@example.com'),
+        ])
+
+    def test_matches_username_and_email_prefixes(self):
+        results, complete = self.index.match('al')
+        self.assertTrue(complete)
+        self.assertEqual([r['id'] for r in results], [1, 2])
+
+        results, _ = self.index.match('a.')
+        self.assertEqual([r['id'] for r in results], [2])
+
+    def test_limit_and_deduplication(self):
+        results, _ = self.index.match('a', limit=5)
+        self.assertEqual(sorted(r['id'] for r in results), [1, 2])
+        results, _ = self.index.match('a', limit=1)
+        self.assertEqual(len(results), 1)
+
+    def test_incremental_updates(self):
+        self.index.update(3, 'albert', 'bob@example.com')
+        results, _ = self.index.match('al')
+        self.assertIn(3, [r['id'] for r in results])
+        self.assertEqual(self.index.match('bob')[0][0]['username'], 'albert')
+
+        self.index.remove(1)
+        results, _ = self.index.match('alice')
+        self.assertEqual(results, [])
+
+
+class AccountAutocompleteTest(TestCase):
+    def create_account(self, username):
+        return Account.objects.create(
+            username=username,
+            email=f'{username}@example.com',
+            password='securepassword123',
+            first_name='Test',
+            last_name='User',
+        )
+
+    def setUp(self):
+        for username in ('carol', 'carla', 'dave'):
+            self.create_account(username)
+        self.autocomplete = AccountAutocomplete()
+
+    def test_database_fallback_before_load(self):
+        self.autocomplete._load_in_background = lambda: None
+        results = self.autocomplete.complete('car', limit=10)
+        self.assertEqual([r['username'] for r in results], ['carla', 'carol'])
+
+    def test_loaded_index_answers_without_queries(self):
+        self.autocomplete.load()
+        with self.assertNumQueries(0):
+            results = self.autocomplete.complete('Car', limit=1)
+        self.assertEqual([r['username'] for r in results], ['carla'])
+
+    def test_database_fallback_ignores_case(self):
+        self.create_account('Carmen')
+        self.autocomplete._load_in_background = lambda: None
+        results = self.autocomplete.complete('CAR', limit=10)
+        self.assertEqual([r['username'] for r in results], ['carla', 'Carmen', 'carol'])
+
+    def test_index_only_sees_committed_saves(self):
+        self.autocomplete.load()
+        with mock.patch(
+            'accounts.signals.get_account_autocomplete', return_value=self.autocomplete
+        ):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.create_account('carmen')
+            with self.assertRaises(RuntimeError):
+                with transaction.atomic():
+                    self.create_account('carrie')
+                    raise RuntimeError
+
+        with self.assertNumQueries(0):
+            results = self.autocomplete.complete('car', limit=10)
+        self.assertEqual([r['username'] for r in results], ['carla', 'carmen', 'carol'])
+
+    def test_admin_search_matches_prefixes_then_substrings(self):
+        admin = AccountAdmin(Account, AdminSite())
+        request = RequestFactory().get('/admin/accounts/account/')
+
+        def search(term):
+            queryset, _ = admin.get_search_results(request, Account.objects.all(), term)
+            return sorted(queryset.values_list('username', flat=True))
+
+        self.assertEqual(search('CAR'), ['carla', 'carol'])
+        # No username or email starts with a domain.
+        self.assertEqual(search('example.com'), ['carla', 'carol', 'dave'])
@@ -0,0 +1,67 @@
+# accounts/tests/test_availability.py
+
+from django.test import TestCase
+from ..availability import AvailabilityIndex, BloomFilter
+from ..models import Account
+
+
+class BloomFilterTest(TestCase):
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(capacity=1000, false_positive_rate=0.01)
+        values = [f"user{i}" for i in range(1000)]
+        for value in values:
+            bloom.add(value)
+        self.assertTrue(all(value in bloom for value in values))
+
+    def test_false_positive_rate_is_bounded(self):
+        bloom = BloomFilter(capacity=1000, false_positive_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"user{i}")
+        false_positives = sum(f"other{i}" in bloom for i in range(10000))
+        self.assertLess(false_positives / 10000, 0.03)
+
+
+class AvailabilityIndexTest(TestCase):
+    def setUp(self):
+        Account.objects.create(
+            username='taken',
+            email='taken@example.com',
+            password='securepassword123',
+            first_name='Test',
+            last_name='User',
+        )
+        self.index = AvailabilityIndex(min_capacity=100)
+        self.index.build()
+
+    def test_definite_negative_skips_database(self):
+        with self.assertNumQueries(0):
+            self.assertTrue(self.index.is_username_available('free-name'))
+            self.assertTrue(self.index.is_email_available('free@example.com'))
+
+    def test_taken_values_are_checked_against_database(self):
+        self.assertFalse(self.index.is_username_available('Taken'))
+        self.assertFalse(self.index.is_email_available('TAKEN@example.com'))
+        self.assertEqual(self.index.stats()['database_checks'], 2)
+
+    def test_added_values_are_seen_without_rebuild(self):
+        self.index.add(username='newcomer', email='new@example.com')
+        Account.objects.create(
+            username='newcomer',
+            email='new@example.com',
+            password='securepassword123',
+            first_name='New',
+            last_name='User',
+        )
+        self.assertFalse(self.index.is_username_available('newcomer'))
+
+    def test_mixed_case_values_are_taken(self):
+        Account.objects.create(
+            username='Alice',
+            email='Alice@Example.com',
+            password='securepassword123',
+            first_name='Alice',
+            last_name='User',
+        )
+        self.index.build()
+        self.assertFalse(self.index.is_username_available('alice'))
+        self.assertFalse(self.index.is_email_available('alice@example.com'))
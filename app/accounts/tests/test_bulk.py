@@ -0,0 +1,88 @@
+# accounts/tests/test_bulk.py
+
+from types import SimpleNamespace
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from core.models import OutboxEvent
+from ..models import Account
+
+
+class AccountBulkUpdateTest(APITestCase):
+    def setUp(self):
+        Account.objects.bulk_create([
+            Account(
+                username=f'bulk{i}',
+                email=f'bulk{i}@example.com',
+                password='x',
+                first_name='Bulk',
+                last_name=str(i),
+            )
+            for i in range(60)
+        ])
+        self.pks = list(Account.objects.order_by('pk').values_list('pk', flat=True))
+        self.url = reverse('account-bulk-update')
+        self.client.force_authenticate(
+            user=SimpleNamespace(pk=1, is_authenticated=True, is_staff=True)
+        )
+
+    def test_items_are_applied_or_rejected_individually(self):
+        first, second, third = self.pks[:3]
+        response = self.client.patch(self.url, [
+            {'id': first, 'address': '1 Main St', 'phone_number': '+1 (650) 253-0000'},
+            {'id': second, 'first_name': 'Fixed'},
+            {'id': third, 'email': 'not-an-email'},
+            {'id': third, 'username': 'bulk0'},
+            {'id': 999999, 'first_name': 'Ghost'},
+            {'id': second, 'last_name': 'Twice'},
+            {'first_name': 'No id'},
+        ], format='json')
+
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(response.data['updated'], 2)
+        statuses = [result['status'] for result in response.data['results']]
+        self.assertEqual(statuses, ['updated', 'updated'] + ['error'] * 5)
+        errors = [result.get('errors', {}) for result in response.data['results']]
+        self.assertIn('email', errors[2])
+        self.assertIn('username', errors[3])
+        self.assertIn('id', errors[4])
+        self.assertIn('id', errors[5])
+        self.assertIn('id', errors[6])
+
+        account = Account.objects.get(pk=first)
+        self.assertEqual(account.address, '1 Main St')
+        self.assertEqual(account.phone_number_national, '(650) 253-0000')
+        self.assertEqual(Account.objects.get(pk=second).first_name, 'Fixed')
+        self.assertEqual(Account.objects.get(pk=third).username, 'bulk2')
+        self.assertEqual(
+            OutboxEvent.objects.filter(
+                aggregate_type='account', event_type='updated'
+            ).count(),
+            2,
+        )
+
+    def test_query_count_does_not_grow_with_the_batch(self):
+        def run(pks):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.patch(
+                    self.url,
+                    [{'id': pk, 'address': f'{pk} Side St'} for pk in pks],
+                    format='json',
+                )
+            self.assertEqual(response.status_code, 200)
+            return len(queries)
+
+        self.assertEqual(run(self.pks[:5]), run(self.pks[5:]))
+        self.assertEqual(
+            Account.objects.filter(address__endswith='Side St').count(), len(self.pks)
+        )
+
+    def test_staff_only(self):
+        self.client.force_authenticate(
+            user=SimpleNamespace(pk=2, is_authenticated=True, is_staff=False)
+        )
+        response = self.client.patch(
+            self.url, [{'id': self.pks[0], 'first_name': 'X'}], format='json'
+        )
+        self.assertEqual(response.status_code, 403)
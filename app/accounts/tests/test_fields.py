@@ -0,0 +1,51 @@
+# accounts/tests/test_fields.py
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from ..fields import _parse
+from ..models import Account
+from ..serializers import AccountCreateSerializer
+
+
+class PhoneNumberFieldTest(TestCase):
+    def setUp(self):
+        self.field = Account._meta.get_field('phone_number')
+
+    def test_stores_e164(self):
+        account = Account.objects.create(
+            username='caller',
+            email='caller@example.com',
+            password='x',
+            first_name='Test',
+            last_name='Caller',
+            phone_number='+1 (650) 253-0000',
+        )
+        account.refresh_from_db()
+        self.assertEqual(account.phone_number, '+16502530000')
+        self.assertEqual(account.phone_number_international, '+1 650-253-0000')
+        self.assertEqual(account.phone_number_national, '(650) 253-0000')
+        self.assertTrue(Account.objects.filter(phone_number='+1 650 253 0000').exists())
+
+    def test_rejects_invalid_numbers(self):
+        with self.assertRaises(ValidationError):
+            self.field.clean('+1 555', None)
+
+    def test_serializer_normalizes_with_cached_parse(self):
+        _parse.cache_clear()
+        serializer = AccountCreateSerializer(data={
+            'username': 'caller',
+            'email': 'caller@example.com',
+            'password': 'secure-password',
+            'confirm_password': 'secure-password',
+            'first_name': 'Test',
+            'last_name': 'Caller',
+            'phone_number': '+1 650 253 0000',
+        })
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(serializer.validated_data['phone_number'], '+16502530000')
+        self.assertEqual(_parse.cache_info().misses, 2)
+        self.assertGreater(_parse.cache_info().hits, 0)
+
+    def test_empty_values_pass_through(self):
+        self.assertIsNone(self.field.get_prep_value(None))
+        self.assertEqual(self.field.get_prep_value(''), '')
@@ -2,7 +2,12 @@
 
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import AccountViewSet, AccountSearchView
+from .views import (
+    AccountViewSet,
+    AccountSearchView,
+    AccountAvailabilityView,
+    AccountAutocompleteView,
+)
 
 # Create a router and register viewsets
 router = DefaultRouter()
@@ -10,9 +15,21 @@ router.register(r'accounts', AccountViewSet, basename='account')
 
 # URL patterns
 urlpatterns = [
-    # Include all router-generated URLs
-    path('', include(router.urls)),
-    
+    # Registered before the router so they are not captured as an account pk
+    path(
+        'accounts/availability/',
+        AccountAvailabilityView.as_view(),
+        name='account-availability',
+    ),
+    path(
+        'accounts/autocomplete/',
+        AccountAutocompleteView.as_view(),
+        name='account-autocomplete',
+    ),
+
     # Custom search endpoint
     path('accounts/search/', AccountSearchView.as_view(), name='account-search'),
+
+    # Include all router-generated URLs
+    path('', include(router.urls)),
 ]
\ No newline at end of file
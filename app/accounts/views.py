@@ -4,9 +4,24 @@ import logging
 from rest_framework import viewsets, generics, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.permissions import IsAuthenticated, IsAdminUser, AllowAny
 from rest_framework.exceptions import ValidationError
+from rest_framework.throttling import ScopedRateThrottle
+from rest_framework.views import APIView
+from django.db.models import Q
 from django_filters.rest_framework import DjangoFilterBackend
+from core.async_views import AsyncListAPIView, AsyncRetrieveAPIView
+from core.idempotency import idempotent
+from core.mixins import (
+    ArchiveRestoreMixin,
+    BatchCacheMixin,
+    FieldProjectionMixin,
+    ReplicaReadMixin,
+)
+from .archive import account_archive
+from .autocomplete import get_account_autocomplete, get_autocomplete_settings
+from .availability import get_availability_index
+from .bulk import bulk_update_accounts, get_bulk_update_settings
 from .models import Account
 from .serializers import (
     AccountCreateSerializer,
@@ -16,11 +31,22 @@ from .serializers import (
 
 logger = logging.getLogger(__name__)
 
-class AccountViewSet(viewsets.ModelViewSet):
+
+class AccountViewSet(
+    ArchiveRestoreMixin,
+    BatchCacheMixin,
+    FieldProjectionMixin,
+    ReplicaReadMixin,
+    viewsets.ModelViewSet,
+):
     """
     ViewSet for handling standard CRUD operations on Account model.
     Provides different serializers for different operations.
+    Archived accounts are served on lookup and restored when changed.
     """
+    archive = account_archive
+    replica_actions = ('list', 'retrieve')
+    projection_actions = ('list', 'retrieve')
     queryset = Account.objects.all()
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['username', 'email', 'first_name', 'last_name']
@@ -35,10 +61,13 @@ class AccountViewSet(viewsets.ModelViewSet):
     def get_permissions(self):
         if self.action == 'create':
             permission_classes = [AllowAny]
+        elif self.action == 'bulk_update':
+            permission_classes = [IsAdminUser]
         else:
             permission_classes = [IsAuthenticated]
         return [permission() for permission in permission_classes]
 
+    @idempotent
     def create(self, request, *args, **kwargs):
         try:
             logger.info(f"Creating new account with username: {request.data.get('username')}")
@@ -83,6 +112,50 @@ class AccountViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    @action(detail=False, methods=['patch'], url_path='bulk')
+    @idempotent
+    def bulk_update(self, request):
+        """
+        Partially update many accounts: a list of ``{"id": ..., <field>: ...}``.
+        Items are applied or rejected one by one; see ``accounts.bulk``.
+        """
+        items = request.data
+        max_items = get_bulk_update_settings()['MAX_ITEMS']
+        if not (
+            isinstance(items, list)
+            and all(isinstance(item, dict) for item in items)
+        ):
+            return Response(
+                {'error': 'Expected a list of objects with an "id".'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(items) > max_items:
+            return Response(
+                {'error': f'At most {max_items} items per request.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            logger.info(f"Bulk-updating {len(items)} accounts")
+            results = bulk_update_accounts(items)
+        except Exception as e:
+            logger.error(f"Error bulk-updating accounts: {str(e)}")
+            return Response(
+                {'error': 'Failed to update accounts'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        updated = sum(1 for result in results if result['status'] == 'updated')
+        if updated == len(results):
+            code = status.HTTP_200_OK
+        elif updated:
+            code = status.HTTP_207_MULTI_STATUS
+        else:
+            code = status.HTTP_400_BAD_REQUEST
+        return Response(
+            {'updated': updated, 'failed': len(results) - updated, 'results': results},
+            status=code
+        )
+
     @action(detail=True, methods=['post'])
     def change_password(self, request, pk=None):
         try:
@@ -117,9 +190,10 @@ class AccountViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-class AccountSearchView(generics.ListAPIView):
+
+class AccountSearchMixin:
     """
-    Custom view for searching accounts with advanced filtering.
+    Queryset and configuration shared by the sync and async search views.
     """
     serializer_class = AccountDetailSerializer
     permission_classes = [IsAuthenticated]
@@ -130,10 +204,105 @@ class AccountSearchView(generics.ListAPIView):
 
         if search_term:
             queryset = queryset.filter(
-                models.Q(username__icontains=search_term) |
-                models.Q(email__icontains=search_term) |
-                models.Q(first_name__icontains=search_term) |
-                models.Q(last_name__icontains=search_term)
+                Q(username__icontains=search_term) |
+                Q(email__icontains=search_term) |
+                Q(first_name__icontains=search_term) |
+                Q(last_name__icontains=search_term)
             )
 
-        return queryset.select_related()
\ No newline at end of file
+        return queryset.select_related()
+
+
+class AccountSearchView(
+    AccountSearchMixin, FieldProjectionMixin, ReplicaReadMixin, generics.ListAPIView
+):
+    """
+    Custom view for searching accounts with advanced filtering.
+    """
+
+
+class AsyncAccountListView(FieldProjectionMixin, ReplicaReadMixin, AsyncListAPIView):
+    """
+    Async-native ``AccountViewSet.list`` for the ASGI entry point.
+    """
+    queryset = Account.objects.all()
+    serializer_class = AccountDetailSerializer
+    permission_classes = [IsAuthenticated]
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = AccountViewSet.filterset_fields
+
+
+class AsyncAccountDetailView(
+    ArchiveRestoreMixin, FieldProjectionMixin, ReplicaReadMixin, AsyncRetrieveAPIView
+):
+    """
+    Async-native ``AccountViewSet.retrieve`` for the ASGI entry point.
+    """
+    archive = account_archive
+    queryset = Account.objects.all()
+    serializer_class = AccountDetailSerializer
+    permission_classes = [IsAuthenticated]
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = AccountViewSet.filterset_fields
+
+
+class AsyncAccountSearchView(
+    AccountSearchMixin, FieldProjectionMixin, ReplicaReadMixin, AsyncListAPIView
+):
+    """
+    Async-native ``AccountSearchView`` for the ASGI entry point.
+    """
+
+
+class AccountAvailabilityView(APIView):
+    """
+    Check whether a username and/or email is still free.
+    Definite negatives are answered from an in-memory Bloom filter.
+    """
+    permission_classes = [AllowAny]
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = 'availability'
+
+    def get(self, request, *args, **kwargs):
+        index = get_availability_index()
+        result = {}
+
+        username = request.query_params.get('username')
+        if username:
+            result['username'] = {
+                'value': username.strip().lower(),
+                'available': index.is_username_available(username),
+            }
+
+        email = request.query_params.get('email')
+        if email:
+            result['email'] = {
+                'value': email.strip().lower(),
+                'available': index.is_email_available(email),
+            }
+
+        if not result:
+            return Response(
+                {'error': 'Provide a username or email to check'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(result)
+
+
+class AccountAutocompleteView(APIView):
+    """
+    Top-N username/email prefix completion for support tools.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        options = get_autocomplete_settings()
+        prefix = request.query_params.get('q', '')
+        try:
+            limit = int(request.query_params.get('limit', options['LIMIT']))
+        except ValueError:
+            limit = options['LIMIT']
+        limit = max(1, min(limit, options['MAX_LIMIT']))
+
+        results = get_account_autocomplete().complete(prefix, limit)
+        return Response({'results': results})
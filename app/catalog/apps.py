@@ -0,0 +1,12 @@
+# catalog/apps.py
+
+from django.apps import AppConfig
+
+
+class CatalogConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'catalog'
+
+    def ready(self):
+        from .buffers import install_shutdown_flush
+        install_shutdown_flush()
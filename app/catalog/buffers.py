@@ -0,0 +1,286 @@
+# catalog/buffers.py
+"""
+Write-behind buffer for high-frequency stock changes.
+
+Deltas are coalesced per catalog item in memory, restocks apart from
+removals, and written back as a single ``UPDATE ... SET stock = CASE ...``
+statement when the buffer grows past ``MAX_ITEMS`` or every
+``FLUSH_INTERVAL`` seconds, whichever comes first.
+
+Callers are told an update succeeded before it is flushed, so a delta the
+flush has to reject (the item is gone, or removals would take stock below
+zero) is recorded as a ``stock_rejected`` outbox event in the flush
+transaction, for an operator or handler to reconcile. Restocks are applied
+even when the removals queued with them are rejected.
+"""
+import atexit
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Case, F, IntegerField, Value, When
+from django.utils import timezone
+from core.outbox import build_event, record_events
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'ENABLED': False,
+    'MAX_ITEMS': 500,
+    'FLUSH_INTERVAL': 0.5,
+    'DATABASE': 'default',
+}
+
+
+def get_buffer_settings():
+    options = DEFAULTS.copy()
+    options.update(getattr(settings, 'CATALOG_STOCK_BUFFER', {}))
+    return options
+
+
+class StockWriteBuffer:
+    """
+    Coalesces stock deltas per item and flushes them in batches.
+
+    The buffer is safe to share between threads. A flush never lets stock go
+    below zero: removals that would do so are rejected, logged, counted and
+    recorded as ``stock_rejected`` outbox events.
+    """
+
+    def __init__(self, max_items=500, flush_interval=0.5, using='default'):
+        self.max_items = max_items
+        self.flush_interval = flush_interval
+        self.using = using
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._metrics = {
+            'flushes': 0,
+            'flushed_items': 0,
+            'rejected_items': 0,
+            'failed_flushes': 0,
+            'last_flush_ms': 0.0,
+            'max_flush_ms': 0.0,
+            'total_flush_ms': 0.0,
+        }
+
+    def add(self, pk, quantity, stock=None):
+        """
+        Queue a stock delta for the given catalog item.
+
+        With ``stock``, the item's stored stock, a removal that would take
+        it below zero once the pending deltas are applied raises ValueError
+        instead of being queued. Returns the item's pending net delta.
+        """
+        with self._lock:
+            added, removed = self._pending.get(pk, (0, 0))
+            if stock is not None and stock + added + removed + quantity < 0:
+                raise ValueError("Stock cannot be negative")
+            if quantity > 0:
+                added += quantity
+            else:
+                removed += quantity
+            self._pending[pk] = (added, removed)
+            full = len(self._pending) >= self.max_items
+
+        if full:
+            if self._thread is not None and self._thread.is_alive():
+                self._wake.set()
+            else:
+                self.flush()
+        return added + removed
+
+    def pending(self, pk):
+        """Return the not-yet-flushed net delta for an item."""
+        with self._lock:
+            return sum(self._pending.get(pk, (0, 0)))
+
+    def depth(self):
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self):
+        """
+        Write all pending deltas to the database.
+
+        Returns the number of items updated. If the write fails the deltas are
+        put back so they are retried on the next flush.
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+
+            batch = {pk: deltas for pk, deltas in batch.items() if any(deltas)}
+            if not batch:
+                return 0
+
+            started = time.perf_counter()
+            try:
+                applied, rejected = self._apply(batch)
+            except Exception as e:
+                self._requeue(batch)
+                self._metrics['failed_flushes'] += 1
+                logger.error(f"Error flushing stock buffer: {str(e)}")
+                raise
+
+            elapsed = (time.perf_counter() - started) * 1000
+            self._metrics['flushes'] += 1
+            self._metrics['flushed_items'] += len(applied)
+            self._metrics['rejected_items'] += len(rejected)
+            self._metrics['last_flush_ms'] = elapsed
+            self._metrics['total_flush_ms'] += elapsed
+            self._metrics['max_flush_ms'] = max(self._metrics['max_flush_ms'], elapsed)
+
+            for pk, delta in rejected.items():
+                logger.warning(f"Rejected stock delta {delta} for catalog item {pk}")
+
+            return len(applied)
+
+    def _apply(self, batch):
+        from .models import Catalog
+
+        manager = Catalog.objects.using(self.using)
+        with transaction.atomic(using=self.using):
+            current = dict(
+                manager.select_for_update()
+                .filter(pk__in=list(batch))
+                .values_list('pk', 'stock')
+            )
+
+            applied = {}
+            rejected = {}
+            for pk, (added, removed) in batch.items():
+                if pk not in current:
+                    rejected[pk] = added + removed
+                elif current[pk] + added + removed >= 0:
+                    applied[pk] = added + removed
+                else:
+                    # Keep the restocks; only the removals don't fit.
+                    rejected[pk] = removed
+                    if added:
+                        applied[pk] = added
+
+            events = [
+                build_event('catalog', pk, 'stock_rejected', {
+                    'id': pk,
+                    'delta': delta,
+                    'stock': current.get(pk),
+                })
+                for pk, delta in rejected.items()
+            ]
+            if applied:
+                manager.filter(pk__in=list(applied)).update(
+                    stock=Case(
+                        *[
+                            When(pk=pk, then=F('stock') + Value(delta))
+                            for pk, delta in applied.items()
+                        ],
+                        default=F('stock'),
+                        output_field=IntegerField(),
+                    ),
+                    updated_at=timezone.now(),
+                )
+                events += [
+                    build_event('catalog', pk, 'stock_changed', {
+                        'id': pk,
+                        'delta': delta,
+                        'stock': current[pk] + delta,
+                    })
+                    for pk, delta in applied.items()
+                ]
+            record_events(events, using=self.using)
+
+        return applied, rejected
+
+    def _requeue(self, batch):
+        with self._lock:
+            for pk, (added, removed) in batch.items():
+                pending = self._pending.get(pk, (0, 0))
+                self._pending[pk] = (pending[0] + added, pending[1] + removed)
+
+    def start(self):
+        """Start the background thread that flushes on the time trigger."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name='catalog-stock-buffer', daemon=True
+        )
+        self._thread.start()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                # Already logged and requeued; try again on the next tick.
+                pass
+            finally:
+                connections[self.using].close()
+
+    def close(self):
+        """Stop the background thread and flush whatever is left."""
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=max(self.flush_interval * 2, 1))
+            self._thread = None
+        self.flush()
+
+    def stats(self):
+        """Return buffer depth and flush latency metrics."""
+        with self._lock:
+            depth = len(self._pending)
+            units = sum(
+                added - removed for added, removed in self._pending.values()
+            )
+
+        stats = dict(self._metrics)
+        stats['depth'] = depth
+        stats['pending_units'] = units
+        stats['avg_flush_ms'] = (
+            stats['total_flush_ms'] / stats['flushes'] if stats['flushes'] else 0.0
+        )
+        return stats
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_stock_buffer():
+    """Return the process-wide stock buffer, starting it on first use."""
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                options = get_buffer_settings()
+                _buffer = StockWriteBuffer(
+                    max_items=options['MAX_ITEMS'],
+                    flush_interval=options['FLUSH_INTERVAL'],
+                    using=options['DATABASE'],
+                )
+                _buffer.start()
+    return _buffer
+
+
+def _flush_on_shutdown():
+    if _buffer is None:
+        return
+    try:
+        _buffer.close()
+    except Exception as e:
+        logger.error(f"Stock buffer lost pending deltas on shutdown: {str(e)}")
+
+
+def install_shutdown_flush():
+    """Make sure pending deltas are written when the worker exits."""
+    atexit.unregister(_flush_on_shutdown)
+    atexit.register(_flush_on_shutdown)
@@ -0,0 +1,260 @@
+# catalog/importers.py
+"""
+Streaming upsert import for supplier catalog feeds.
+
+Rows are read one at a time from CSV or NDJSON, validated, and written in
+batches with ``bulk_create(update_conflicts=True)`` keyed on the unique
+``name``. Each row's content hash is stored on the item, so rows that have
+not changed since the last import are skipped without a write.
+"""
+import csv
+import hashlib
+import json
+import logging
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+
+from django.db import transaction
+from core.outbox import build_event, record_events
+from .models import Catalog
+
+logger = logging.getLogger(__name__)
+
+FEED_FIELDS = ('name', 'description', 'price', 'category', 'stock')
+UPDATE_FIELDS = [
+    'description',
+    'price',
+    'category',
+    'stock',
+    'content_hash',
+    'updated_at',
+]
+MAX_REPORTED_ERRORS = 100
+# Largest value a PositiveIntegerField holds on every supported database.
+MAX_STOCK = 2147483647
+
+
+class RowError(ValueError):
+    """Raised when a feed row fails validation."""
+
+
+class ImportResult:
+    """Counters for a single import run."""
+
+    def __init__(self):
+        self.inserted = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.duplicates = 0
+        self.rejected = 0
+        self.errors = []
+
+    def reject(self, line, message):
+        self.rejected += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'line': line, 'error': message})
+
+    def as_dict(self):
+        return {
+            'inserted': self.inserted,
+            'updated': self.updated,
+            'unchanged': self.unchanged,
+            'duplicates': self.duplicates,
+            'rejected': self.rejected,
+            'errors': self.errors,
+        }
+
+
+def read_csv(stream):
+    """Yield ``(line_number, row)`` pairs from a CSV feed with a header row."""
+    reader = csv.DictReader(stream)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def read_ndjson(stream):
+    """Yield ``(line_number, row)`` pairs from a newline-delimited JSON feed."""
+    for line_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        if not isinstance(row, dict):
+            row = {'__invalid__': line}
+        yield line_number, row
+
+
+READERS = {
+    'csv': read_csv,
+    'ndjson': read_ndjson,
+}
+
+
+def detect_format(filename, default='csv'):
+    if filename and filename.lower().endswith(('.ndjson', '.jsonl')):
+        return 'ndjson'
+    if filename and filename.lower().endswith('.csv'):
+        return 'csv'
+    return default
+
+
+def clean_row(row):
+    """Validate a raw feed row and return the normalized field values."""
+    if '__invalid__' in row:
+        raise RowError("Row is not a JSON object.")
+
+    name = str(row.get('name') or '').strip()
+    if not name:
+        raise RowError("Name is required.")
+    if len(name) > 100:
+        raise RowError("Name must be at most 100 characters.")
+
+    try:
+        price = Decimal(str(row.get('price', '')).strip())
+        if not price.is_finite():
+            raise InvalidOperation
+        price = price.quantize(Decimal('0.01'))
+    except InvalidOperation:
+        raise RowError("Price must be a decimal number.")
+    if price < 0:
+        raise RowError("Price must be zero or greater.")
+    if len(price.as_tuple().digits) > 10:
+        raise RowError("Price has too many digits.")
+
+    category = str(row.get('category') or '').strip().upper()
+    if category not in Catalog.CategoryChoices.values:
+        raise RowError(f"Unknown category: {row.get('category')!r}.")
+
+    try:
+        stock = int(str(row.get('stock', 0)).strip() or 0)
+    except ValueError:
+        raise RowError("Stock must be an integer.")
+    if stock < 0:
+        raise RowError("Stock cannot be negative.")
+    if stock > MAX_STOCK:
+        raise RowError(f"Stock must be at most {MAX_STOCK}.")
+
+    description = row.get('description')
+    description = str(description).strip() if description not in (None, '') else None
+
+    return {
+        'name': name,
+        'description': description,
+        'price': price,
+        'category': category,
+        'stock': stock,
+    }
+
+
+def content_hash(values):
+    """Return a stable hash of the normalized feed values."""
+    payload = '\x1f'.join(
+        '' if values[field] is None else str(values[field]) for field in FEED_FIELDS
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class CatalogImporter:
+    """
+    Upserts validated feed rows into ``Catalog`` in batches.
+
+    Within a batch the last row for a given name wins; the rows it replaces
+    are counted as ``duplicates``, so every row read is counted exactly once.
+    """
+
+    def __init__(self, batch_size=1000, using='default'):
+        self.batch_size = batch_size
+        self.using = using
+
+    def run(self, rows):
+        """Import an iterable of ``(line_number, row)`` pairs."""
+        result = ImportResult()
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, self.batch_size))
+            if not chunk:
+                break
+            self._import_batch(chunk, result)
+        logger.info(
+            f"Catalog import finished: {result.inserted} inserted, "
+            f"{result.updated} updated, {result.unchanged} unchanged, "
+            f"{result.duplicates} duplicates, {result.rejected} rejected"
+        )
+        return result
+
+    def _import_batch(self, chunk, result):
+        batch = {}
+        for line, row in chunk:
+            try:
+                values = clean_row(row)
+            except RowError as e:
+                result.reject(line, str(e))
+                continue
+            values['content_hash'] = content_hash(values)
+            if values['name'] in batch:
+                result.duplicates += 1
+            batch[values['name']] = values
+
+        if not batch:
+            return
+
+        existing = dict(
+            Catalog.objects.using(self.using)
+            .filter(name__in=list(batch))
+            .values_list('name', 'content_hash')
+        )
+
+        objs = []
+        for name, values in batch.items():
+            if name not in existing:
+                result.inserted += 1
+            elif existing[name] == values['content_hash']:
+                result.unchanged += 1
+                continue
+            else:
+                result.updated += 1
+            objs.append(Catalog(**values))
+
+        if not objs:
+            return
+
+        with transaction.atomic(using=self.using):
+            manager = Catalog.objects.using(self.using)
+            manager.bulk_create(
+                objs,
+                update_conflicts=True,
+                unique_fields=['name'],
+                update_fields=UPDATE_FIELDS,
+            )
+            # Upserts do not report primary keys back, so look them up for
+            # the outbox events.
+            names = [obj.name for obj in objs]
+            pks = dict(
+                manager.filter(name__in=names).values_list('name', 'pk')
+            )
+            record_events(
+                [
+                    build_event('catalog', pks[obj.name], 'upserted', {
+                        'id': pks[obj.name],
+                        'name': obj.name,
+                        'description': obj.description,
+                        'price': obj.price,
+                        'category': obj.category,
+                        'stock': obj.stock,
+                    })
+                    for obj in objs
+                ],
+                using=self.using,
+            )
+
+
+def import_stream(stream, fmt='csv', batch_size=1000, using='default'):
+    """Read a text stream in the given format and import it."""
+    try:
+        reader = READERS[fmt]
+    except KeyError:
+        raise ValueError(f"Unsupported feed format: {fmt}")
+    return CatalogImporter(batch_size=batch_size, using=using).run(reader(stream))
@@ -0,0 +1,96 @@
+# catalog/management/commands/benchmark_search.py
+
+import random
+import statistics
+import time
+from decimal import Decimal
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from ...models import Catalog
+from ...search import drop_search_triggers, search_catalog
+
+WORDS = [
+    'wireless', 'charger', 'cotton', 'shirt', 'novel', 'history', 'coffee',
+    'organic', 'laptop', 'stand', 'leather', 'wallet', 'kitchen', 'knife',
+    'running', 'shoes', 'garden', 'lamp', 'travel', 'guide', 'bluetooth',
+    'speaker', 'winter', 'jacket', 'green', 'tea', 'phone', 'case',
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure catalog search latency and the cost of maintaining the "
+        "search index during bulk loads. All data is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000)
+        parser.add_argument('--queries', type=int, default=200)
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        rows = options['rows']
+
+        with transaction.atomic():
+            sid = transaction.savepoint()
+            drop_search_triggers(connection)
+            plain = self._load(
+                rows, options['batch_size'], random.Random(options['seed'])
+            )
+            transaction.savepoint_rollback(sid)
+
+            indexed = self._load(
+                rows, options['batch_size'], random.Random(options['seed'])
+            )
+            latencies = self._query(options['queries'], rng)
+
+            transaction.set_rollback(True)
+
+        overhead = (indexed - plain) / plain * 100 if plain else 0.0
+        self.stdout.write(f"database:              {connection.vendor}")
+        self.stdout.write(
+            f"bulk load, no index:   {plain * 1000:.1f} ms for {rows} rows"
+        )
+        self.stdout.write(
+            f"bulk load, indexed:    {indexed * 1000:.1f} ms for {rows} rows"
+        )
+        self.stdout.write(f"index maintenance:     {overhead:+.1f}%")
+        self.stdout.write(
+            f"query latency (ms):    p50={self._pct(latencies, 50):.2f} "
+            f"p95={self._pct(latencies, 95):.2f} max={max(latencies, default=0.0):.2f}"
+        )
+
+    def _load(self, rows, batch_size, rng):
+        categories = Catalog.CategoryChoices.values
+        items = [
+            Catalog(
+                name=f"{' '.join(rng.sample(WORDS, 3))} {i}",
+                description=' '.join(rng.choices(WORDS, k=20)),
+                price=Decimal(rng.randint(100, 100000)) / 100,
+                category=rng.choice(categories),
+                stock=rng.randint(0, 50),
+            )
+            for i in range(rows)
+        ]
+        started = time.perf_counter()
+        Catalog.objects.bulk_create(items, batch_size=batch_size)
+        return time.perf_counter() - started
+
+    def _query(self, count, rng):
+        latencies = []
+        for _ in range(count):
+            word = rng.choice(WORDS)
+            query = word[:rng.randint(2, len(word))]
+            if rng.random() < 0.3:
+                query = f"{rng.choice(WORDS)} {query}"
+            started = time.perf_counter()
+            list(search_catalog(query, in_stock=rng.random() < 0.5)[:20])
+            latencies.append((time.perf_counter() - started) * 1000)
+        return latencies
+
+    def _pct(self, values, pct):
+        if len(values) < 2:
+            return values[0] if values else 0.0
+        return statistics.quantiles(values, n=100)[pct - 1]
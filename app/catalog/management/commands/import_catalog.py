@@ -0,0 +1,49 @@
+# catalog/management/commands/import_catalog.py
+
+import sys
+from django.core.management.base import BaseCommand, CommandError
+from ...importers import READERS, detect_format, import_stream
+
+
+class Command(BaseCommand):
+    help = "Upsert a CSV or NDJSON supplier feed into the catalog."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="Feed file, or '-' to read from stdin.")
+        parser.add_argument(
+            '--format',
+            choices=sorted(READERS),
+            help="Feed format. Defaults to the file extension, then csv.",
+        )
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--database', default='default')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        fmt = options['format'] or detect_format(path)
+
+        try:
+            if path == '-':
+                result = self._import(sys.stdin, fmt, options)
+            else:
+                with open(path, newline='', encoding='utf-8') as stream:
+                    result = self._import(stream, fmt, options)
+        except OSError as e:
+            raise CommandError(f"Cannot read feed: {e}")
+
+        for error in result.errors:
+            self.stderr.write(f"line {error['line']}: {error['error']}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"inserted={result.inserted} updated={result.updated} "
+            f"unchanged={result.unchanged} duplicates={result.duplicates} "
+            f"rejected={result.rejected}"
+        ))
+
+    def _import(self, stream, fmt, options):
+        return import_stream(
+            stream,
+            fmt=fmt,
+            batch_size=options['batch_size'],
+            using=options['database'],
+        )
@@ -0,0 +1,92 @@
+# Generated by Django 4.2 on 2024-11-27 09:00
+
+from decimal import Decimal
+import django.core.validators
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Catalog',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                (
+                    'created_at',
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, editable=False
+                    ),
+                ),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                (
+                    'name',
+                    models.CharField(
+                        help_text='Product name', max_length=100, unique=True
+                    ),
+                ),
+                (
+                    'description',
+                    models.TextField(
+                        blank=True, help_text='Product description', null=True
+                    ),
+                ),
+                (
+                    'price',
+                    models.DecimalField(
+                        decimal_places=2,
+                        help_text='Product price',
+                        max_digits=10,
+                        validators=[
+                            django.core.validators.MinValueValidator(Decimal('0.00'))
+                        ],
+                    ),
+                ),
+                (
+                    'category',
+                    models.CharField(
+                        choices=[
+                            ('ELECTRONICS', 'Electronics'),
+                            ('CLOTHING', 'Clothing'),
+                            ('BOOKS', 'Books'),
+                            ('FOOD', 'Food'),
+                            ('OTHER', 'Other'),
+                        ],
+                        help_text='Product category',
+                        max_length=50,
+                    ),
+                ),
+                (
+                    'stock',
+                    models.PositiveIntegerField(default=0, help_text='Available stock'),
+                ),
+            ],
+            options={
+                'verbose_name': 'Catalog Item',
+                'verbose_name_plural': 'Catalog Items',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='catalog',
+            index=models.Index(fields=['category'], name='idx_catalog_category'),
+        ),
+        migrations.AddIndex(
+            model_name='catalog',
+            index=models.Index(fields=['price'], name='idx_catalog_price'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2 on 2024-11-28 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='catalog',
+            name='content_hash',
+            field=models.CharField(
+                blank=True,
+                default='',
+                editable=False,
+                help_text='Hash of the last imported feed row',
+                max_length=64,
+            ),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2 on 2024-11-29 10:00
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+def install_search_index(apps, schema_editor):
+    from catalog.search import install_search_index
+    install_search_index(schema_editor.connection)
+
+
+def uninstall_search_index(apps, schema_editor):
+    from catalog.search import uninstall_search_index
+    uninstall_search_index(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0002_catalog_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='catalog',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False,
+                help_text=(
+                    'Weighted name/description vector, kept up to date by a trigger'
+                ),
+                null=True,
+            ),
+        ),
+        migrations.RunPython(install_search_index, uninstall_search_index),
+    ]
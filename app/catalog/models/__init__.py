@@ -0,0 +1,3 @@
+# models/__init__.py
+from .base import BaseModel  # noqa: F401
+from .catalog import Catalog  # noqa: F401
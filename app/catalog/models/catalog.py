@@ -1,11 +1,17 @@
 # models/catalog.py
 from decimal import Decimal
 from django.db import models
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MinValueValidator
 from django.utils.translation import gettext_lazy as _
+from core.outbox import OutboxMixin
 from .base import BaseModel
 
-class Catalog(BaseModel):
+
+class Catalog(OutboxMixin, BaseModel):
+    outbox_aggregate = 'catalog'
+    outbox_exclude = ('search_vector', 'content_hash')
+
     class CategoryChoices(models.TextChoices):
         ELECTRONICS = 'ELECTRONICS', _('Electronics')
         CLOTHING = 'CLOTHING', _('Clothing')
@@ -38,6 +44,18 @@ class Catalog(BaseModel):
         default=0,
         help_text=_("Available stock")
     )
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default='',
+        editable=False,
+        help_text=_("Hash of the last imported feed row")
+    )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text=_("Weighted name/description vector, kept up to date by a trigger")
+    )
 
     class Meta:
         verbose_name = _("Catalog Item")
@@ -54,8 +72,35 @@ class Catalog(BaseModel):
     def is_in_stock(self):
         return self.stock > 0
 
-    def update_stock(self, quantity):
+    def update_stock(self, quantity, buffered=None):
+        """
+        Adjust stock by ``quantity``.
+
+        With ``buffered=True`` (or ``CATALOG_STOCK_BUFFER['ENABLED']``) the
+        change is queued in the write-behind buffer instead of saved right
+        away. It is checked against the stored stock plus the deltas already
+        queued for the item, and the check is enforced again at flush time;
+        ``stock`` then includes the pending deltas.
+        """
+        if buffered is None:
+            from ..buffers import get_buffer_settings
+            buffered = get_buffer_settings()['ENABLED']
+
+        if buffered:
+            from ..buffers import get_stock_buffer
+            # The part of self.stock that is still waiting in the buffer.
+            stored = self.stock - getattr(self, '_pending_stock', 0)
+            try:
+                pending = get_stock_buffer().add(
+                    self.pk, quantity, stock=stored
+                )
+            except ValueError:
+                raise ValueError(_("Stock cannot be negative")) from None
+            self._pending_stock = pending
+            self.stock = stored + pending
+            return
+
         if self.stock + quantity < 0:
             raise ValueError(_("Stock cannot be negative"))
         self.stock += quantity
-        self.save()
\ No newline at end of file
+        self.save()
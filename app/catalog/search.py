@@ -0,0 +1,217 @@
+# catalog/search.py
+"""
+Ranked full-text search over catalog names and descriptions.
+
+PostgreSQL keeps a weighted ``tsvector`` (name = A, description = B) in
+``Catalog.search_vector`` behind a GIN index; SQLite keeps an external-content
+FTS5 table. Both are maintained by database triggers, so bulk imports and
+``UPDATE`` statements stay in sync without going through ``save()``.
+"""
+import re
+import logging
+
+from django.db import connection, connections
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+from .models import Catalog
+
+logger = logging.getLogger(__name__)
+
+SEARCH_CONFIG = 'simple'
+FTS_TABLE = 'catalog_catalog_fts'
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+POSTGRESQL_INSTALL = [
+    f"""
+    CREATE OR REPLACE FUNCTION catalog_catalog_search_vector_update()
+    RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.name, '')), 'A') ||
+            setweight(
+                to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.description, '')), 'B'
+            );
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS catalog_catalog_search_vector_trigger ON catalog_catalog",
+    """
+    CREATE TRIGGER catalog_catalog_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF name, description ON catalog_catalog
+    FOR EACH ROW EXECUTE FUNCTION catalog_catalog_search_vector_update()
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_catalog_search "
+    "ON catalog_catalog USING gin (search_vector)",
+    f"""
+    UPDATE catalog_catalog SET search_vector =
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')
+    WHERE search_vector IS NULL
+    """,
+]
+
+POSTGRESQL_DROP_TRIGGERS = [
+    "DROP TRIGGER IF EXISTS catalog_catalog_search_vector_trigger ON catalog_catalog",
+]
+
+POSTGRESQL_UNINSTALL = POSTGRESQL_DROP_TRIGGERS + [
+    "DROP FUNCTION IF EXISTS catalog_catalog_search_vector_update()",
+    "DROP INDEX IF EXISTS idx_catalog_search",
+]
+
+SQLITE_INSTALL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        name, description,
+        content='catalog_catalog', content_rowid='id',
+        prefix='2 3 4'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai
+    AFTER INSERT ON catalog_catalog BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad
+    AFTER DELETE ON catalog_catalog BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, description)
+        VALUES ('delete', old.id, old.name, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au
+    AFTER UPDATE OF name, description ON catalog_catalog BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, description)
+        VALUES ('delete', old.id, old.name, old.description);
+        INSERT INTO {FTS_TABLE}(rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    """,
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+SQLITE_DROP_TRIGGERS = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+]
+
+SQLITE_UNINSTALL = SQLITE_DROP_TRIGGERS + [
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+
+def _run(conn, statements):
+    with conn.cursor() as cursor:
+        for sql in statements:
+            cursor.execute(sql)
+
+
+def install_search_index(conn=None):
+    """Create (or refresh) the search index and its maintenance triggers."""
+    conn = conn or connection
+    if conn.vendor == 'postgresql':
+        _run(conn, POSTGRESQL_INSTALL)
+    elif conn.vendor == 'sqlite':
+        _run(conn, SQLITE_INSTALL)
+    else:
+        logger.warning(f"No full-text index for database vendor {conn.vendor}")
+
+
+def uninstall_search_index(conn=None):
+    conn = conn or connection
+    if conn.vendor == 'postgresql':
+        _run(conn, POSTGRESQL_UNINSTALL)
+    elif conn.vendor == 'sqlite':
+        _run(conn, SQLITE_UNINSTALL)
+
+
+def drop_search_triggers(conn=None):
+    """Drop only the maintenance triggers (used to measure their cost)."""
+    conn = conn or connection
+    if conn.vendor == 'postgresql':
+        _run(conn, POSTGRESQL_DROP_TRIGGERS)
+    elif conn.vendor == 'sqlite':
+        _run(conn, SQLITE_DROP_TRIGGERS)
+
+
+def tokenize(query):
+    return TOKEN_RE.findall(query.lower())
+
+
+def search_catalog(query, category=None, in_stock=False, prefix=True, queryset=None):
+    """
+    Return catalog items matching ``query``, best matches first.
+
+    With ``prefix=True`` the last term matches as a prefix, for type-ahead.
+    Category and in-stock filters are applied in the same query.
+    """
+    queryset = Catalog.objects.all() if queryset is None else queryset
+    if category:
+        queryset = queryset.filter(category=category.upper())
+    if in_stock:
+        queryset = queryset.filter(stock__gt=0)
+
+    terms = tokenize(query or '')
+    if not terms:
+        return queryset.none()
+
+    # The queryset may be routed to a replica of another vendor than default.
+    vendor = connections[queryset.db].vendor
+    if vendor == 'postgresql':
+        return _search_postgresql(queryset, terms, prefix)
+    if vendor == 'sqlite':
+        return _search_sqlite(queryset, terms, prefix)
+    return _search_fallback(queryset, terms)
+
+
+def _search_postgresql(queryset, terms, prefix):
+    from django.contrib.postgres.search import SearchQuery, SearchRank
+
+    parts = list(terms)
+    if prefix:
+        parts[-1] = f"{parts[-1]}:*"
+    query = SearchQuery(' & '.join(parts), config=SEARCH_CONFIG, search_type='raw')
+
+    return (
+        queryset.filter(search_vector=query)
+        .annotate(rank=SearchRank(F('search_vector'), query))
+        .order_by('-rank', 'name')
+    )
+
+
+def _search_sqlite(queryset, terms, prefix):
+    parts = [f'"{term}"' for term in terms]
+    if prefix:
+        parts[-1] = f"{parts[-1]}*"
+    match = ' AND '.join(parts)
+    table = Catalog._meta.db_table
+
+    matching_ids = RawSQL(
+        f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", (match,)
+    )
+    # bm25() is lower-is-better; weight name ten times higher than description.
+    rank = RawSQL(
+        f"SELECT -bm25({FTS_TABLE}, 10.0, 1.0) FROM {FTS_TABLE} "
+        f"WHERE {FTS_TABLE} MATCH %s AND rowid = {table}.id",
+        (match,),
+        output_field=FloatField(),
+    )
+    return (
+        queryset.filter(pk__in=matching_ids)
+        .annotate(rank=rank)
+        .order_by('-rank', 'name')
+    )
+
+
+def _search_fallback(queryset, terms):
+    for term in terms:
+        queryset = queryset.filter(
+            Q(name__icontains=term) | Q(description__icontains=term)
+        )
+    rank = Value(0.0, output_field=FloatField())
+    return queryset.annotate(rank=rank).order_by('name')
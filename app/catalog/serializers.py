@@ -0,0 +1,32 @@
+from rest_framework import serializers
+from .models import Catalog
+
+
+class CatalogSerializer(serializers.ModelSerializer):
+    """
+    Serializer for reading catalog items.
+    """
+    in_stock = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Catalog
+        fields = [
+            'id', 'name', 'description', 'price', 'category',
+            'stock', 'in_stock', 'created_at', 'updated_at'
+        ]
+        read_only_fields = fields
+        projection_requires = {'in_stock': ['stock']}
+
+    def get_in_stock(self, obj):
+        return obj.is_in_stock()
+
+
+class CatalogSearchResultSerializer(CatalogSerializer):
+    """
+    Catalog item with its search relevance.
+    """
+    rank = serializers.FloatField(read_only=True)
+
+    class Meta(CatalogSerializer.Meta):
+        fields = CatalogSerializer.Meta.fields + ['rank']
+        read_only_fields = fields
@@ -0,0 +1,5 @@
+# catalog/tests/__init__.py
+
+from .test_buffers import StockWriteBufferTest  # noqa: F401
+from .test_importers import CatalogImportTest  # noqa: F401
+from .test_search import CatalogSearchTest  # noqa: F401
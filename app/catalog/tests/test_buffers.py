@@ -0,0 +1,88 @@
+# catalog/tests/test_buffers.py
+
+from decimal import Decimal
+from unittest import mock
+from django.test import TestCase
+from core.models import OutboxEvent
+from ..buffers import StockWriteBuffer
+from ..models import Catalog
+
+
+class StockWriteBufferTest(TestCase):
+    def setUp(self):
+        self.item = Catalog.objects.create(
+            name='Test Phone',
+            price=Decimal('199.99'),
+            category=Catalog.CategoryChoices.ELECTRONICS,
+            stock=10,
+        )
+        self.buffer = StockWriteBuffer(max_items=100, flush_interval=60)
+
+    def test_deltas_are_coalesced_per_item(self):
+        for _ in range(5):
+            self.buffer.add(self.item.pk, -1)
+        self.buffer.add(self.item.pk, 2)
+
+        self.assertEqual(self.buffer.pending(self.item.pk), -3)
+        self.assertEqual(self.buffer.depth(), 1)
+
+        self.assertEqual(self.buffer.flush(), 1)
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.stock, 7)
+        self.assertEqual(self.buffer.depth(), 0)
+
+    def test_flush_rejects_negative_stock(self):
+        self.buffer.add(self.item.pk, -11)
+
+        self.assertEqual(self.buffer.flush(), 0)
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.stock, 10)
+        self.assertEqual(self.buffer.stats()['rejected_items'], 1)
+        event = OutboxEvent.objects.get(event_type='stock_rejected')
+        self.assertEqual(event.aggregate_id, str(self.item.pk))
+        self.assertEqual(event.payload, {'id': self.item.pk, 'delta': -11, 'stock': 10})
+
+    def test_rejected_removals_keep_restocks(self):
+        self.buffer.add(self.item.pk, 5)
+        self.buffer.add(self.item.pk, -20)
+
+        self.assertEqual(self.buffer.flush(), 1)
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.stock, 15)
+        event = OutboxEvent.objects.get(event_type='stock_rejected')
+        self.assertEqual(event.payload, {'id': self.item.pk, 'delta': -20, 'stock': 10})
+
+    def test_size_trigger_flushes(self):
+        buffer = StockWriteBuffer(max_items=1, flush_interval=60)
+        buffer.add(self.item.pk, 5)
+
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.stock, 15)
+        self.assertEqual(buffer.stats()['flushes'], 1)
+
+    def test_update_stock_buffered(self):
+        with mock.patch('catalog.buffers.get_stock_buffer', return_value=self.buffer):
+            self.item.update_stock(-2, buffered=True)
+
+        self.assertEqual(self.item.stock, 8)
+        self.assertEqual(Catalog.objects.get(pk=self.item.pk).stock, 10)
+
+        self.buffer.flush()
+        self.assertEqual(Catalog.objects.get(pk=self.item.pk).stock, 8)
+
+    def test_update_stock_buffered_counts_pending_deltas(self):
+        other = Catalog.objects.get(pk=self.item.pk)
+        with mock.patch('catalog.buffers.get_stock_buffer', return_value=self.buffer):
+            self.item.update_stock(-8, buffered=True)
+            # Another request still sees the stored stock of 10.
+            with self.assertRaises(ValueError):
+                other.update_stock(-3, buffered=True)
+            other.update_stock(5, buffered=True)
+            self.assertEqual(other.stock, 7)
+            other.update_stock(-7, buffered=True)
+
+        self.assertEqual(self.buffer.pending(self.item.pk), -10)
+        self.buffer.flush()
+        self.assertEqual(Catalog.objects.get(pk=self.item.pk).stock, 0)
+        rejected = OutboxEvent.objects.filter(event_type='stock_rejected')
+        self.assertFalse(rejected.exists())
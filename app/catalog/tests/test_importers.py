@@ -0,0 +1,71 @@
+# catalog/tests/test_importers.py
+
+import io
+from decimal import Decimal
+from django.test import TestCase
+from ..importers import import_stream
+from ..models import Catalog
+
+FEED = (
+    "name,description,price,category,stock\n"
+    "Laptop,Thin and light,999.99,ELECTRONICS,5\n"
+    "Novel,,12.50,books,20\n"
+    "Broken,,abc,BOOKS,1\n"
+    "Toaster,,25.00,KITCHEN,3\n"
+)
+
+
+class CatalogImportTest(TestCase):
+    def test_inserts_and_rejects(self):
+        result = import_stream(io.StringIO(FEED), fmt='csv')
+
+        self.assertEqual(result.inserted, 2)
+        self.assertEqual(result.rejected, 2)
+        self.assertEqual([e['line'] for e in result.errors], [4, 5])
+        novel = Catalog.objects.get(name='Novel')
+        self.assertEqual(novel.category, Catalog.CategoryChoices.BOOKS)
+        self.assertEqual(novel.price, Decimal('12.50'))
+
+    def test_unchanged_rows_are_skipped(self):
+        import_stream(io.StringIO(FEED), fmt='csv')
+
+        changed = FEED.replace(
+            'Laptop,Thin and light,999.99', 'Laptop,Thin and light,899.99'
+        )
+        result = import_stream(io.StringIO(changed), fmt='csv')
+
+        self.assertEqual(result.inserted, 0)
+        self.assertEqual(result.updated, 1)
+        self.assertEqual(result.unchanged, 1)
+        self.assertEqual(Catalog.objects.get(name='Laptop').price, Decimal('899.99'))
+
+    def test_repeated_names_are_counted_as_duplicates(self):
+        feed = FEED + "Laptop,Refurbished,799.99,ELECTRONICS,2\n"
+        result = import_stream(io.StringIO(feed), fmt='csv')
+
+        self.assertEqual(
+            (result.inserted, result.duplicates, result.rejected), (2, 1, 2)
+        )
+        self.assertEqual(result.inserted + result.duplicates + result.rejected, 5)
+        self.assertEqual(Catalog.objects.get(name='Laptop').price, Decimal('799.99'))
+
+    def test_ndjson_feed(self):
+        feed = (
+            '{"name": "Apple", "price": "0.50", "category": "FOOD", "stock": 100}\n'
+            '\n'
+            'not json\n'
+        )
+        result = import_stream(io.StringIO(feed), fmt='ndjson', batch_size=1)
+
+        self.assertEqual(result.inserted, 1)
+        self.assertEqual(result.rejected, 1)
+        self.assertEqual(result.errors[0]['line'], 3)
+        self.assertEqual(Catalog.objects.get(name='Apple').stock, 100)
+
+    def test_stock_out_of_range_is_rejected(self):
+        feed = FEED + "Warehouse,,1.00,BOOKS,2147483648\n"
+        result = import_stream(io.StringIO(feed), fmt='csv')
+
+        self.assertEqual((result.inserted, result.rejected), (2, 3))
+        self.assertEqual(result.errors[-1]['line'], 6)
+        self.assertFalse(Catalog.objects.filter(name='Warehouse').exists())
@@ -0,0 +1,77 @@
+# catalog/tests/test_search.py
+
+from decimal import Decimal
+from unittest import mock, skipUnless
+from django.db import connection
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from ..models import Catalog
+from ..search import install_search_index, search_catalog
+
+
+@skipUnless(connection.vendor in ('postgresql', 'sqlite'), "Needs a full-text backend")
+# Data written inside a TestCase is not visible on a replica's connection.
+@override_settings(DATABASE_REPLICAS=[])
+class CatalogSearchTest(APITestCase):
+    def setUp(self):
+        install_search_index(connection)
+        self.charger = Catalog.objects.create(
+            name='Wireless Charger',
+            description='Fast charging pad',
+            price=Decimal('29.99'),
+            category=Catalog.CategoryChoices.ELECTRONICS,
+            stock=4,
+        )
+        self.cable = Catalog.objects.create(
+            name='USB Cable',
+            description='Works with any wireless charger stand',
+            price=Decimal('9.99'),
+            category=Catalog.CategoryChoices.ELECTRONICS,
+            stock=0,
+        )
+        self.book = Catalog.objects.create(
+            name='Wireless Networking',
+            description='A practical guide',
+            price=Decimal('39.00'),
+            category=Catalog.CategoryChoices.BOOKS,
+            stock=2,
+        )
+
+    def test_name_matches_rank_above_description(self):
+        results = list(search_catalog('charger'))
+        self.assertEqual(results, [self.charger, self.cable])
+
+    def test_prefix_matching(self):
+        self.assertEqual(
+            set(search_catalog('wirel')), {self.charger, self.cable, self.book}
+        )
+        self.assertEqual(list(search_catalog('wirel', prefix=False)), [])
+
+    def test_filters_apply_in_same_query(self):
+        self.assertEqual(
+            list(search_catalog('wireless', category='books')), [self.book]
+        )
+        self.assertNotIn(self.cable, search_catalog('charger', in_stock=True))
+
+    def test_index_follows_updates(self):
+        self.book.name = 'Wired Networking'
+        self.book.save()
+        self.assertNotIn(self.book, search_catalog('wireless'))
+        self.assertIn(self.book, search_catalog('wired'))
+
+    def test_backend_follows_the_queryset_database(self):
+        queryset = Catalog.objects.using('default')
+        with mock.patch('catalog.search.connections') as connections:
+            connections.__getitem__.return_value.vendor = 'mysql'
+            results = list(search_catalog('charger', queryset=queryset, prefix=False))
+
+        connections.__getitem__.assert_called_with('default')
+        # Other vendors get the icontains fallback, ordered by name.
+        self.assertEqual(results, [self.cable, self.charger])
+
+    def test_search_endpoint(self):
+        response = self.client.get(reverse('catalog-search'), {'q': 'charg'})
+        self.assertEqual(response.status_code, 200)
+        names = [item['name'] for item in response.data['results']]
+        self.assertEqual(names[0], 'Wireless Charger')
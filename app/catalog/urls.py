@@ -0,0 +1,10 @@
+# catalog/urls.py
+
+from django.urls import path
+from .views import CatalogImportView, CatalogSearchView, CatalogStockView
+
+urlpatterns = [
+    path('import/', CatalogImportView.as_view(), name='catalog-import'),
+    path('search/', CatalogSearchView.as_view(), name='catalog-search'),
+    path('<int:pk>/stock/', CatalogStockView.as_view(), name='catalog-stock'),
+]
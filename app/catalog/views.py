@@ -0,0 +1,124 @@
+# catalog/views.py
+
+import io
+import logging
+from django.db import transaction
+from django.shortcuts import get_object_or_404
+from rest_framework import generics, status
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import AllowAny, IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from core.async_views import AsyncListAPIView
+from core.idempotency import idempotent
+from core.mixins import FieldProjectionMixin, ReplicaReadMixin
+from .importers import READERS, detect_format, import_stream
+from .models import Catalog
+from .search import search_catalog
+from .serializers import CatalogSearchResultSerializer
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogImportView(APIView):
+    """
+    Upload a CSV or NDJSON supplier feed and upsert it into the catalog.
+    Expects a multipart ``file`` field and an optional ``format``.
+    """
+    permission_classes = [IsAdminUser]
+    parser_classes = [MultiPartParser]
+
+    def post(self, request, *args, **kwargs):
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response(
+                {'error': 'A feed file is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        fmt = request.data.get('format') or detect_format(upload.name)
+        if fmt not in READERS:
+            return Response(
+                {'error': f'Unsupported feed format: {fmt}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            stream = io.TextIOWrapper(upload.file, encoding='utf-8', newline='')
+            result = import_stream(stream, fmt=fmt)
+        except UnicodeDecodeError:
+            return Response(
+                {'error': 'Feed must be UTF-8 encoded'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            logger.error(f"Error importing catalog feed: {str(e)}")
+            return Response(
+                {'error': 'Failed to import catalog feed'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        return Response(result.as_dict())
+
+
+class CatalogStockView(APIView):
+    """
+    Adjust an item's stock by ``quantity`` (negative to take stock out).
+    Send an ``Idempotency-Key`` header so retries are applied only once.
+    """
+    permission_classes = [IsAdminUser]
+
+    @idempotent
+    def post(self, request, pk, *args, **kwargs):
+        try:
+            quantity = int(request.data.get('quantity'))
+        except (TypeError, ValueError):
+            return Response(
+                {'error': 'quantity must be an integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            with transaction.atomic():
+                item = get_object_or_404(Catalog.objects.select_for_update(), pk=pk)
+                item.update_stock(quantity)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({'id': item.pk, 'stock': item.stock})
+
+
+class CatalogSearchMixin:
+    """
+    Queryset and configuration shared by the sync and async search views.
+    """
+    serializer_class = CatalogSearchResultSerializer
+    permission_classes = [AllowAny]
+    filter_backends = []
+
+    def get_queryset(self):
+        params = self.request.query_params
+        return search_catalog(
+            params.get('q', ''),
+            category=params.get('category'),
+            in_stock=params.get('in_stock', '').lower() in ('1', 'true', 'yes'),
+            prefix=params.get('prefix', 'true').lower() not in ('0', 'false', 'no'),
+        )
+
+
+class CatalogSearchView(
+    CatalogSearchMixin, FieldProjectionMixin, ReplicaReadMixin, generics.ListAPIView
+):
+    """
+    Ranked full-text search over catalog names and descriptions.
+
+    Query parameters: ``q`` (the last term matches as a prefix unless
+    ``prefix=false``), ``category`` and ``in_stock``.
+    """
+
+
+class AsyncCatalogSearchView(
+    CatalogSearchMixin, FieldProjectionMixin, ReplicaReadMixin, AsyncListAPIView
+):
+    """
+    Async-native ``CatalogSearchView`` for the ASGI entry point.
+    """
@@ -0,0 +1,35 @@
+# core/admin.py
+
+from django.contrib import admin
+from .models import IdempotencyRecord, OutboxEvent
+
+
+@admin.register(OutboxEvent)
+class OutboxEventAdmin(admin.ModelAdmin):
+    list_display = (
+        'id',
+        'aggregate_type',
+        'aggregate_id',
+        'event_type',
+        'status',
+        'attempts',
+        'created_at',
+    )
+    list_filter = ('status', 'aggregate_type', 'event_type')
+    search_fields = ('aggregate_id',)
+    readonly_fields = [field.name for field in OutboxEvent._meta.fields]
+
+
+@admin.register(IdempotencyRecord)
+class IdempotencyRecordAdmin(admin.ModelAdmin):
+    list_display = (
+        'scope',
+        'key',
+        'status',
+        'response_status',
+        'created_at',
+        'expires_at',
+    )
+    list_filter = ('status',)
+    search_fields = ('key',)
+    readonly_fields = [field.name for field in IdempotencyRecord._meta.fields]
@@ -0,0 +1,17 @@
+# core/apps.py
+
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'core'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+        from .querylog import get_query_log_settings, install_query_logger
+
+        if get_query_log_settings()['ENABLED']:
+            connection_created.connect(
+                install_query_logger, dispatch_uid='core.querylog'
+            )
@@ -0,0 +1,321 @@
+# core/archive.py
+"""
+Hot/cold archival.
+
+Cold rows are moved from a hot table into an archive table with the same
+columns (and the same primary keys), so the hot table and its unique indexes
+only hold rows that are still in use. Each ``Archive`` pairs a hot model with
+its archive model and decides which rows are cold.
+
+- Rows move in small batches, each in its own short transaction. Candidates
+  are claimed with ``SKIP LOCKED`` where supported, so archival never waits
+  on (or blocks for long) a row that is being written.
+- Uniqueness holds across both tables: the archive tables carry their own
+  unique constraints, and hot saves call ``ensure_unique`` after writing.
+  Because the check runs after the hot row's index entries are taken, a
+  concurrent archive or restore of the same value is either seen by the
+  check or blocked by the unique index until it commits.
+- ``get_or_restore`` moves an archived row back the first time it is
+  looked up. ``ArchiveRestoreMixin`` serves archived rows to views: reads
+  get the archived copy, and only writes move it back.
+
+Archives are registered with ``register_archive`` from the owning app's
+``ready()``; ``manage.py archive_cold_rows`` and ``archive_report`` act on
+every registered archive.
+"""
+import logging
+import statistics
+import time
+
+from django.conf import settings
+from django.db import IntegrityError, connections, models, router, transaction
+from django.db.models import Q
+from django.db.models.signals import post_save
+from django.utils import timezone
+from .outbox import build_event, record_events
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'BATCH_SIZE': 500,
+    'PAUSE': 0.05,
+    'ACCOUNT_DORMANT_DAYS': 730,
+}
+
+_archives = {}
+
+
+def get_archive_settings():
+    options = DEFAULTS.copy()
+    options.update(getattr(settings, 'ARCHIVAL', {}))
+    return options
+
+
+def register_archive(archive):
+    _archives[archive.name] = archive
+    return archive
+
+
+def get_archives():
+    return dict(_archives)
+
+
+class ArchivedModel(models.Model):
+    """
+    Base class for archive tables. Subclasses repeat the hot model's
+    columns, with a plain (not auto-incrementing) ``id`` primary key.
+    """
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        abstract = True
+
+
+class ArchiveConflict(IntegrityError):
+    """A hot row reuses a unique value held by an archived row."""
+
+    def __init__(self, fields):
+        super().__init__(f"Value already used by an archived row: {', '.join(fields)}")
+        self.fields = fields
+
+
+class Archive:
+    """
+    Moves cold rows of ``hot_model`` to ``archive_model`` and back.
+
+    ``cold`` returns the queryset of rows to archive. ``unique_fields`` are
+    the hot model's unique columns that must stay unique across both tables.
+    ``on_restore``, if given, is called with each restored instance before
+    it is written back, e.g. to mark it as active so it is not archived
+    again by the next run.
+    """
+
+    def __init__(
+        self, name, hot_model, archive_model, cold, unique_fields=(), on_restore=None
+    ):
+        self.name = name
+        self.hot_model = hot_model
+        self.archive_model = archive_model
+        self.cold = cold
+        self.unique_fields = tuple(unique_fields)
+        self.on_restore = on_restore
+        self.fields = [field.attname for field in hot_model._meta.concrete_fields]
+
+    def _to_archive(self, obj, archived_at):
+        return self.archive_model(
+            archived_at=archived_at,
+            **{name: getattr(obj, name) for name in self.fields}
+        )
+
+    def _to_hot(self, row):
+        return self.hot_model(**{name: getattr(row, name) for name in self.fields})
+
+    def _events(self, pks, event_type):
+        aggregate = getattr(self.hot_model, 'outbox_aggregate', None)
+        if aggregate is None:
+            return []
+        return [build_event(aggregate, pk, event_type, {'id': pk}) for pk in pks]
+
+    def archive_batch(self, batch_size=500, using=None):
+        """Archive up to ``batch_size`` cold rows. Returns how many moved."""
+        using = using or router.db_for_write(self.hot_model)
+        with transaction.atomic(using=using):
+            candidates = self.cold().using(using).order_by('pk')
+            if connections[using].features.has_select_for_update_skip_locked:
+                candidates = candidates.select_for_update(skip_locked=True)
+            rows = list(candidates[:batch_size])
+            if not rows:
+                return 0
+
+            now = timezone.now()
+            pks = [row.pk for row in rows]
+            self.archive_model.objects.using(using).bulk_create(
+                [self._to_archive(row, now) for row in rows]
+            )
+            self.hot_model._base_manager.using(using).filter(pk__in=pks).delete()
+            record_events(self._events(pks, 'archived'), using=using)
+        return len(rows)
+
+    def archive(self, batch_size=500, pause=0.05, limit=None, using=None):
+        """Archive cold rows batch by batch until none are left (or ``limit``)."""
+        total = 0
+        while limit is None or total < limit:
+            size = batch_size if limit is None else min(batch_size, limit - total)
+            moved = self.archive_batch(size, using=using)
+            total += moved
+            if moved < size:
+                break
+            # Let waiting writers in between batches.
+            time.sleep(pause)
+        return total
+
+    def restore(self, using=None, **lookup):
+        """
+        Move the archived row matching ``lookup`` back to the hot table.
+        Returns the hot instance, or None if no archived row matches.
+        """
+        using = using or router.db_for_write(self.hot_model)
+        with transaction.atomic(using=using):
+            row = (
+                self.archive_model.objects.using(using)
+                .select_for_update()
+                .filter(**lookup)
+                .first()
+            )
+            if row is None:
+                return None
+            obj = self._to_hot(row)
+            if self.on_restore is not None:
+                self.on_restore(obj)
+            # bulk_create skips save(): the row is unchanged, not new.
+            self.hot_model._base_manager.using(using).bulk_create([obj])
+            row.delete()
+            record_events(self._events([obj.pk], 'restored'), using=using)
+            obj._state.adding = False
+            obj._state.db = using
+        post_save.send(
+            sender=self.hot_model, instance=obj, created=False,
+            update_fields=None, raw=False, using=using,
+        )
+        logger.info(f"Restored archived {self.name} {obj.pk}")
+        return obj
+
+    def get_archived(self, using=None, **lookup):
+        """
+        The archived row matching ``lookup`` as an unsaved hot instance, or
+        None. Nothing is moved.
+        """
+        manager = self.archive_model._default_manager
+        if using:
+            manager = manager.db_manager(using)
+        row = manager.filter(**lookup).first()
+        return None if row is None else self._to_hot(row)
+
+    def get_or_restore(self, using=None, **lookup):
+        """``get(**lookup)`` on the hot table, restoring from the archive on a miss."""
+        manager = self.hot_model._default_manager
+        if using:
+            manager = manager.db_manager(using)
+        try:
+            return manager.get(**lookup)
+        except self.hot_model.DoesNotExist:
+            if self.restore(using=using, **lookup) is None:
+                raise
+        return manager.get(**lookup)
+
+    def conflicts(self, obj, using=None, fields=None):
+        """The ``unique_fields`` whose value in ``obj`` an archived row holds."""
+        names = self.unique_fields
+        if fields is not None:
+            names = [name for name in names if name in fields]
+        values = {
+            name: getattr(obj, name) for name in names
+            if getattr(obj, name) not in (None, '')
+        }
+        if not values:
+            return []
+        query = Q()
+        for name, value in values.items():
+            query |= Q(**{name: value})
+        using = using or router.db_for_write(self.hot_model)
+        taken = (
+            self.archive_model.objects.using(using)
+            .filter(query)
+            .exclude(pk=obj.pk)
+            .values_list(*values)
+        )
+        found = set()
+        for row in taken:
+            found.update(
+                name for name, value in zip(values, row) if value == values[name]
+            )
+        return sorted(found)
+
+    def ensure_unique(self, obj, using=None, update_fields=None):
+        """
+        Raise ``ArchiveConflict`` if ``obj`` reuses an archived row's unique
+        value. Call inside the transaction that saved ``obj``.
+        """
+        found = self.conflicts(obj, using, fields=update_fields)
+        if found:
+            raise ArchiveConflict(found)
+
+    def is_archived(self, using=None, **lookup):
+        using = using or router.db_for_read(self.archive_model)
+        return self.archive_model.objects.using(using).filter(**lookup).exists()
+
+    def report(self, using='default', samples=200):
+        """Row counts, index sizes and lookup latency for both tables."""
+        hot = self.hot_model._base_manager.using(using)
+        cold = self.archive_model.objects.using(using)
+        result = {
+            'name': self.name,
+            'hot_rows': hot.count(),
+            'archived_rows': cold.count(),
+            'hot_index_bytes': index_sizes(self.hot_model, using),
+            'archive_index_bytes': index_sizes(self.archive_model, using),
+        }
+        field = self.unique_fields[0] if self.unique_fields else 'pk'
+        result['lookup_field'] = field
+        result['hot_lookup_ms'] = _lookup_latency(hot, field, samples)
+        result['archive_lookup_ms'] = _lookup_latency(cold, field, samples)
+        hot_bytes = _total(result['hot_index_bytes'])
+        cold_bytes = _total(result['archive_index_bytes'])
+        if not result['archived_rows']:
+            # An empty table still has a root page per index.
+            cold_bytes = 0 if cold_bytes is not None else None
+        result['index_bytes_saved'] = cold_bytes
+        result['index_share_saved'] = (
+            cold_bytes / (hot_bytes + cold_bytes)
+            if hot_bytes is not None and cold_bytes
+            else None
+        )
+        return result
+
+
+def _total(sizes):
+    if sizes is None:
+        return None
+    return sum(sizes.values())
+
+
+def _lookup_latency(queryset, field, samples):
+    """Median milliseconds to fetch one row by ``field``, over existing values."""
+    values = list(queryset.order_by('?').values_list(field, flat=True)[:samples])
+    if not values:
+        return None
+    timings = []
+    for value in values:
+        started = time.perf_counter()
+        list(queryset.filter(**{field: value})[:1])
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def index_sizes(model, using='default'):
+    """``{index name: bytes}`` for ``model``'s table, or None if unknown."""
+    connection = connections[using]
+    table = model._meta.db_table
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute(
+                    "SELECT indexname, "
+                    "pg_relation_size(quote_ident(indexname)::regclass) "
+                    "FROM pg_indexes WHERE tablename = %s",
+                    [table],
+                )
+                return dict(cursor.fetchall())
+            if connection.vendor == 'sqlite':
+                # Needs SQLITE_ENABLE_DBSTAT_VTAB, which most builds have.
+                cursor.execute(
+                    "SELECT name, SUM(pgsize) FROM dbstat WHERE name IN "
+                    "(SELECT name FROM sqlite_master "
+                    "WHERE type = 'index' AND tbl_name = %s) "
+                    "GROUP BY name",
+                    [table],
+                )
+                return dict(cursor.fetchall())
+    except Exception as e:
+        logger.debug(f"No index sizes for {table}: {str(e)}")
+    return None
@@ -0,0 +1,193 @@
+# core/async_views.py
+"""
+Async-native counterparts of DRF's generic read views.
+
+DRF dispatches synchronously, so under ASGI Django runs every APIView in a
+worker thread. ``AsyncAPIView`` dispatches as a coroutine instead. The
+authentication, permission and throttle checks still run in one
+``sync_to_async`` call, because they may read the session and user tables.
+Handlers use the async ORM (``aget``, ``async for``). List views paginate
+with ``apaginate_queryset``. With ``?stream=true`` they stream every
+matching row as NDJSON instead.
+
+These views are only routed for ASGI requests (see ``ASGI_URLCONF``); WSGI
+keeps the regular views.
+"""
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from rest_framework import generics
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.views import APIView
+
+DEFAULTS = {
+    'STREAM_CHUNK_SIZE': 500,
+}
+
+STREAM_CONTENT_TYPE = 'application/x-ndjson'
+
+
+def get_async_view_settings():
+    options = DEFAULTS.copy()
+    options.update(getattr(settings, 'ASYNC_VIEWS', {}))
+    return options
+
+
+def read_write_view(read_view, write_view):
+    """
+    Route safe methods to the async ``read_view`` and everything else to the
+    sync ``write_view``. Use this where both share one URL.
+    """
+    write = sync_to_async(write_view)
+
+    async def view(request, *args, **kwargs):
+        if request.method in SAFE_METHODS:
+            return await read_view(request, *args, **kwargs)
+        return await write(request, *args, **kwargs)
+
+    # Both views are DRF views, which do their own CSRF checks. (Django 4.2's
+    # csrf_exempt() would hide that this view is a coroutine function.)
+    view.csrf_exempt = True
+    return view
+
+
+class AsyncAPIView(APIView):
+    """
+    An ``APIView`` whose handlers are coroutines.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if asyncio.iscoroutine(response):
+                response = await response
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.render_response(self.response)
+
+    def render_response(self, response):
+        """
+        Render a DRF response here. Django would otherwise render it in a
+        worker thread after the view returns.
+        """
+        if not isinstance(response, Response):
+            return response
+        response.render()
+        rendered = HttpResponse(
+            response.content,
+            status=response.status_code,
+            headers=dict(response.items()),
+        )
+        rendered.cookies = response.cookies
+        return rendered
+
+
+class AsyncGenericAPIView(AsyncAPIView, generics.GenericAPIView):
+    """
+    ``GenericAPIView`` with async object lookup and pagination.
+    """
+
+    async def aget_object(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            obj = await queryset.aget(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+        except (queryset.model.DoesNotExist, TypeError, ValueError, ValidationError):
+            # See ``ArchiveRestoreMixin``.
+            restore = getattr(self, 'restore_archived', None)
+            obj = await sync_to_async(restore)() if restore else None
+            if obj is None:
+                raise Http404
+            return obj
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+    async def apaginate_queryset(self, queryset):
+        if self.paginator is None:
+            return None
+        if hasattr(self.paginator, 'apaginate_queryset'):
+            return await self.paginator.apaginate_queryset(
+                queryset, self.request, view=self
+            )
+        return await sync_to_async(self.paginator.paginate_queryset)(
+            queryset, self.request, view=self
+        )
+
+
+class AsyncListModelMixin:
+    """
+    List a queryset a page at a time, or stream all of it with ``?stream=true``.
+    """
+
+    async def alist(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.wants_stream(request):
+            return self.stream(queryset)
+
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = self.get_serializer([obj async for obj in queryset], many=True)
+        return Response(serializer.data)
+
+    def wants_stream(self, request):
+        return request.query_params.get('stream', '').lower() in ('1', 'true', 'yes')
+
+    def stream(self, queryset):
+        """One JSON object per line, fetched ``STREAM_CHUNK_SIZE`` rows at a time."""
+        chunk_size = get_async_view_settings()['STREAM_CHUNK_SIZE']
+        serializer = self.get_serializer()
+        # The body is sent after dispatch returns; keep the database it chose.
+        # (Routing only reads cached replica health, so this does no I/O.)
+        queryset = queryset.using(queryset.db)
+
+        async def lines():
+            async for obj in queryset.aiterator(chunk_size=chunk_size):
+                data = serializer.to_representation(obj)
+                yield json.dumps(data, cls=JSONEncoder) + '\n'
+
+        return StreamingHttpResponse(lines(), content_type=STREAM_CONTENT_TYPE)
+
+
+class AsyncRetrieveModelMixin:
+    async def aretrieve(self, request, *args, **kwargs):
+        instance = await self.aget_object()
+        serializer = self.get_serializer(instance)
+        return Response(serializer.data)
+
+
+class AsyncListAPIView(AsyncListModelMixin, AsyncGenericAPIView):
+    async def get(self, request, *args, **kwargs):
+        return await self.alist(request, *args, **kwargs)
+
+
+class AsyncRetrieveAPIView(AsyncRetrieveModelMixin, AsyncGenericAPIView):
+    async def get(self, request, *args, **kwargs):
+        return await self.aretrieve(request, *args, **kwargs)
@@ -0,0 +1,237 @@
+# core/batch.py
+"""
+Batch execution of API sub-requests.
+
+A batch is authenticated once; its sub-requests are dispatched straight to
+the resolved views with that identity, skipping middleware. Each sub-request
+still goes through its view's throttles, so a batch of N calls is charged
+like N calls (plus one for the batch itself). Sub-requests run one after
+another, in order, on the batch request's own database connection.
+
+Within a batch, identical GET sub-requests are executed once and object
+lookups made through ``BatchCacheMixin`` are shared (see ``batch_cache``).
+
+Sub-requests inherit the batch's headers except those that only make sense
+for one request (``Idempotency-Key`` and conditional headers); a sub-request
+sets its own in an optional ``headers`` object.
+"""
+import contextvars
+import io
+import json
+import logging
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.http import HttpRequest, QueryDict
+from django.urls import Resolver404, resolve
+from .idempotency import get_idempotency_settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'MAX_REQUESTS': 20,
+    'ALLOWED_PREFIXES': ['/accounts/', '/catalog/'],
+}
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+# Headers that belong to one request and are not copied from the batch.
+PER_REQUEST_HEADERS = (
+    'If-Match',
+    'If-None-Match',
+    'If-Modified-Since',
+    'If-Unmodified-Since',
+)
+
+# META each sub-request sets for itself.
+SUB_REQUEST_META = ('CONTENT_LENGTH', 'CONTENT_TYPE', 'QUERY_STRING', 'wsgi.input')
+
+_cache = contextvars.ContextVar('batch_cache', default=None)
+
+
+def header_meta_key(name):
+    return 'HTTP_' + name.upper().replace('-', '_')
+
+
+def get_batch_settings():
+    options = DEFAULTS.copy()
+    options.update(getattr(settings, 'BATCH_REQUESTS', {}))
+    return options
+
+
+class BatchCache:
+    """Query results shared by the sub-requests of one batch."""
+
+    def __init__(self):
+        self._results = {}
+        self.hits = 0
+
+    def get_or_load(self, key, loader):
+        if key in self._results:
+            self.hits += 1
+            return self._results[key]
+        return self._results.setdefault(key, loader())
+
+    def clear(self):
+        self._results.clear()
+
+
+@contextmanager
+def batch_cache():
+    token = _cache.set(BatchCache())
+    try:
+        yield _cache.get()
+    finally:
+        _cache.reset(token)
+
+
+def current_batch_cache():
+    return _cache.get()
+
+
+def queryset_key(queryset):
+    """A hashable key for the SQL ``queryset`` runs, or None."""
+    try:
+        sql, params = queryset.query.sql_with_params()
+        key = (queryset.db, sql, tuple(params))
+        hash(key)
+    except Exception:
+        return None
+    return key
+
+
+class SubRequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class BatchExecutor:
+    """
+    Runs the sub-requests of one batch on behalf of an authenticated request.
+    """
+
+    def __init__(self, request, allowed_prefixes=('/accounts/', '/catalog/')):
+        self.request = request
+        self.allowed_prefixes = tuple(allowed_prefixes)
+        header = get_idempotency_settings()['HEADER']
+        self._per_request_meta = {
+            header_meta_key(name) for name in (header, *PER_REQUEST_HEADERS)
+        }
+
+    def run(self, specs):
+        results = [None] * len(specs)
+        reads = []
+        responses = {}
+
+        with batch_cache() as cache:
+            for i, spec in enumerate(specs):
+                if spec.get('method', 'GET').upper() in SAFE_METHODS:
+                    reads.append(i)
+                    continue
+                self._run_reads(specs, reads, results, responses)
+                reads = []
+                results[i] = self._execute(spec)
+                # A write may change anything read so far.
+                cache.clear()
+                responses.clear()
+            self._run_reads(specs, reads, results, responses)
+        return results
+
+    def _run_reads(self, specs, indexes, results, responses):
+        pending = {}
+        for i in indexes:
+            key = (
+                specs[i].get('method', 'GET').upper(),
+                specs[i].get('path'),
+                json.dumps(specs[i].get('headers'), sort_keys=True, default=str),
+            )
+            if key in responses:
+                results[i] = dict(responses[key], id=specs[i].get('id'))
+            else:
+                pending.setdefault(key, []).append(i)
+
+        for key, group in pending.items():
+            responses[key] = self._execute(specs[group[0]])
+            for i in group:
+                results[i] = dict(responses[key], id=specs[i].get('id'))
+
+    def _execute(self, spec):
+        try:
+            response = self._dispatch(spec)
+        except SubRequestError as e:
+            return {
+                'id': spec.get('id'),
+                'status': e.status,
+                'body': {'error': e.message},
+            }
+        except Exception as e:
+            logger.error(f"Error in batch sub-request {spec.get('path')}: {str(e)}")
+            return {
+                'id': spec.get('id'),
+                'status': 500,
+                'body': {'error': 'Sub-request failed'},
+            }
+
+        body = getattr(response, 'data', None)
+        if body is None and response.content:
+            try:
+                body = json.loads(response.content)
+            except ValueError:
+                body = response.content.decode('utf-8', 'replace')
+        return {'id': spec.get('id'), 'status': response.status_code, 'body': body}
+
+    def _dispatch(self, spec):
+        method = str(spec.get('method', 'GET')).upper()
+        url = urlsplit(str(spec.get('path', '')))
+        if not url.path.startswith(self.allowed_prefixes):
+            raise SubRequestError(400, f"Path not allowed in a batch: {url.path}")
+        try:
+            # Sub-requests run synchronously, so never use the ASGI URLconf.
+            match = resolve(url.path, urlconf=settings.ROOT_URLCONF)
+        except Resolver404:
+            raise SubRequestError(404, 'Not found')
+
+        headers = spec.get('headers') or {}
+        if not isinstance(headers, dict) or not all(
+            isinstance(name, str) and isinstance(value, str)
+            for name, value in headers.items()
+        ):
+            raise SubRequestError(
+                400, 'Sub-request headers must be an object of strings'
+            )
+
+        sub = self._build_request(method, url, spec.get('body'), headers)
+        response = match.func(sub, *match.args, **match.kwargs)
+        if hasattr(response, 'render'):
+            response.render()
+        return response
+
+    def _build_request(self, method, url, body, headers):
+        parent = self.request._request
+        sub = HttpRequest()
+        sub.method = method
+        sub.path = sub.path_info = url.path
+        sub.META = {
+            key: value for key, value in parent.META.items()
+            if key not in SUB_REQUEST_META and key not in self._per_request_meta
+        }
+        sub.META.update(
+            {header_meta_key(name): value for name, value in headers.items()}
+        )
+        sub.META.update(
+            REQUEST_METHOD=method, PATH_INFO=url.path, QUERY_STRING=url.query
+        )
+        sub.GET = QueryDict(url.query)
+        payload = json.dumps(body).encode() if body is not None else b''
+        sub.META['CONTENT_TYPE'] = 'application/json'
+        sub.META['CONTENT_LENGTH'] = str(len(payload))
+        sub._stream = io.BytesIO(payload)
+        sub._read_started = False
+        sub.COOKIES = parent.COOKIES
+        # Reuse the batch's identity instead of authenticating again.
+        sub._force_auth_user = self.request.user
+        sub._force_auth_token = self.request.auth
+        return sub
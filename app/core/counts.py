@@ -0,0 +1,91 @@
+# core/counts.py
+"""
+Row-count estimates from the query planner's statistics.
+
+``COUNT(*)`` over a large table is a full scan on PostgreSQL. For unfiltered
+querysets the planner's own estimate (``pg_class.reltuples``, or
+``sqlite_stat1`` on SQLite) is usually close enough for pagination.
+"""
+import logging
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLD = 100000
+
+
+def get_estimate_threshold():
+    return getattr(settings, 'COUNT_ESTIMATE_THRESHOLD', DEFAULT_THRESHOLD)
+
+
+def estimated_count(model, using='default'):
+    """
+    Return the planner's row estimate for ``model``'s table, or None if the
+    database has no statistics for it.
+    """
+    connection = connections[using]
+    table = model._meta.db_table
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class "
+                    "WHERE oid = to_regclass(%s)",
+                    [connection.ops.quote_name(table)],
+                )
+                row = cursor.fetchone()
+                # reltuples is -1 for tables that were never analyzed.
+                if row is None or row[0] is None or row[0] < 0:
+                    return None
+                return int(row[0])
+
+            if connection.vendor == 'sqlite':
+                cursor.execute("SELECT stat FROM sqlite_stat1 WHERE tbl = %s", [table])
+                counts = [int(stat.split()[0]) for (stat,) in cursor.fetchall() if stat]
+                return max(counts) if counts else None
+    except Exception as e:
+        # sqlite_stat1 does not exist until ANALYZE has run once.
+        logger.debug(f"No row estimate for {table}: {str(e)}")
+    return None
+
+
+def is_unfiltered(queryset):
+    """True if ``queryset`` selects every row of its table."""
+    query = queryset.query
+    return (
+        not query.where
+        and not query.distinct
+        and not query.combinator
+        and query.low_mark == 0
+        and query.high_mark is None
+        and not query.extra
+    )
+
+
+def count_queryset(queryset, threshold=None):
+    """
+    Return ``(count, exact)``.
+
+    Unfiltered querysets over tables estimated at ``threshold`` rows or more
+    use the estimate; everything else gets an exact ``COUNT(*)``.
+    """
+    threshold = get_estimate_threshold() if threshold is None else threshold
+    if is_unfiltered(queryset):
+        estimate = estimated_count(queryset.model, using=queryset.db)
+        if estimate is not None and estimate >= threshold:
+            return estimate, False
+    return queryset.count(), True
+
+
+async def acount_queryset(queryset, threshold=None):
+    """Async version of ``count_queryset``."""
+    threshold = get_estimate_threshold() if threshold is None else threshold
+    if is_unfiltered(queryset):
+        estimate = await sync_to_async(estimated_count)(
+            queryset.model, using=queryset.db
+        )
+        if estimate is not None and estimate >= threshold:
+            return estimate, False
+    return await queryset.acount(), True
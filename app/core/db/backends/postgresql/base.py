@@ -0,0 +1,35 @@
+# core/db/backends/postgresql/base.py
+"""
+PostgreSQL backend that can hand out connections from a per-process pool.
+
+Enable it with a ``POOL`` entry on the database settings. ``close()`` then
+returns the connection to the pool instead of tearing it down, which makes
+``CONN_MAX_AGE = 0`` (the right setting under ASGI) cheap.
+"""
+from django.db.backends.postgresql import base
+from ...pool import get_pool
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+
+    @property
+    def pool_options(self):
+        return self.settings_dict.get('POOL') or {}
+
+    @property
+    def pool_enabled(self):
+        return bool(self.pool_options.get('ENABLED'))
+
+    def get_new_connection(self, conn_params):
+        if not self.pool_enabled:
+            return super().get_new_connection(conn_params)
+        pool = get_pool(self.alias, self.pool_options)
+        return pool.acquire(
+            lambda: super(DatabaseWrapper, self).get_new_connection(conn_params)
+        )
+
+    def _close(self):
+        if self.connection is None or not self.pool_enabled:
+            return super()._close()
+        with self.wrap_database_errors:
+            return get_pool(self.alias, self.pool_options).release(self.connection)
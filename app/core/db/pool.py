@@ -0,0 +1,254 @@
+# core/db/pool.py
+"""
+A small per-process database connection pool.
+
+Connections are checked for liveness when they have been idle for a while,
+recycled after ``MAX_LIFETIME`` seconds, and the pool refuses to hand out
+connections inherited across ``fork()``.
+"""
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'ENABLED': False,
+    'MAX_SIZE': 20,
+    'TIMEOUT': 10,
+    'MAX_LIFETIME': 1800,
+    'HEALTH_CHECK_AFTER': 30,
+}
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection became free within the pool timeout."""
+
+
+class _Entry:
+    __slots__ = ('raw', 'created_at', 'released_at')
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.created_at = time.monotonic()
+        self.released_at = self.created_at
+
+
+def _is_closed(raw):
+    return bool(getattr(raw, 'closed', False))
+
+
+def _ping(raw):
+    cursor = raw.cursor()
+    try:
+        cursor.execute('SELECT 1')
+        cursor.fetchone()
+    finally:
+        cursor.close()
+
+
+def _reset(raw):
+    # Never hand out a connection with a transaction still open.
+    if not getattr(raw, 'autocommit', True):
+        raw.rollback()
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of DB-API connections.
+
+    ``acquire(factory)`` returns an idle connection or creates one with
+    ``factory``; ``release(raw)`` gives it back.
+    """
+
+    def __init__(self, max_size=20, timeout=10, max_lifetime=1800,
+                 health_check_after=30, ping=_ping, reset=_reset):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.health_check_after = health_check_after
+        self.ping = ping
+        self.reset = reset
+        self._cond = threading.Condition()
+        self._init_state()
+
+    def _init_state(self):
+        self._pid = os.getpid()
+        self._idle = []
+        self._in_use = {}
+        self._size = 0
+        self._stats = {
+            'created': 0,
+            'recycled': 0,
+            'discarded': 0,
+            'health_check_failures': 0,
+            'checkouts': 0,
+            'waits': 0,
+            'timeouts': 0,
+            'total_wait_ms': 0.0,
+            'max_wait_ms': 0.0,
+        }
+
+    def _check_fork(self):
+        if self._pid != os.getpid():
+            # Sockets inherited from the parent must not be used or closed
+            # here; just forget them.
+            self._init_state()
+
+    def _expired(self, entry):
+        return (
+            self.max_lifetime is not None
+            and time.monotonic() - entry.created_at > self.max_lifetime
+        )
+
+    def _close(self, entry, reason):
+        self._stats[reason] += 1
+        try:
+            entry.raw.close()
+        except Exception:
+            pass
+
+    def acquire(self, factory):
+        started = time.monotonic()
+        deadline = started + self.timeout
+        waited = False
+
+        while True:
+            entry = None
+            create = False
+            with self._cond:
+                self._check_fork()
+                while entry is None and not create:
+                    while self._idle:
+                        candidate = self._idle.pop()
+                        if self._expired(candidate) or _is_closed(candidate.raw):
+                            self._size -= 1
+                            self._close(candidate, 'recycled')
+                            continue
+                        entry = candidate
+                        break
+                    if entry is not None:
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        create = True
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats['timeouts'] += 1
+                        raise PoolTimeout(
+                            f"No database connection free after {self.timeout}s "
+                            f"({self.max_size} in use)"
+                        )
+                    waited = True
+                    self._cond.wait(remaining)
+
+            if create:
+                try:
+                    entry = _Entry(factory())
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self._stats['created'] += 1
+            elif time.monotonic() - entry.released_at > self.health_check_after:
+                try:
+                    self.ping(entry.raw)
+                except Exception as e:
+                    logger.warning(
+                        f"Discarding pooled connection that failed health check: {e}"
+                    )
+                    self._stats['health_check_failures'] += 1
+                    with self._cond:
+                        self._size -= 1
+                        self._close(entry, 'discarded')
+                        self._cond.notify()
+                    continue
+
+            with self._cond:
+                self._in_use[id(entry.raw)] = entry
+                self._stats['checkouts'] += 1
+                if waited:
+                    wait_ms = (time.monotonic() - started) * 1000
+                    self._stats['waits'] += 1
+                    self._stats['total_wait_ms'] += wait_ms
+                    self._stats['max_wait_ms'] = max(
+                        self._stats['max_wait_ms'], wait_ms
+                    )
+            return entry.raw
+
+    def release(self, raw):
+        with self._cond:
+            if self._pid != os.getpid():
+                return
+            entry = self._in_use.pop(id(raw), None)
+        if entry is None:
+            # Not ours (e.g. opened before the pool was enabled).
+            raw.close()
+            return
+
+        keep = not _is_closed(raw) and not self._expired(entry)
+        if keep:
+            try:
+                self.reset(raw)
+            except Exception:
+                keep = False
+
+        with self._cond:
+            if keep:
+                entry.released_at = time.monotonic()
+                self._idle.append(entry)
+            else:
+                self._size -= 1
+                self._close(entry, 'recycled' if self._expired(entry) else 'discarded')
+            self._cond.notify()
+
+    def close_all(self):
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+        for entry in idle:
+            self._close(entry, 'discarded')
+
+    def stats(self):
+        with self._cond:
+            stats = dict(self._stats)
+            stats['size'] = self._size
+            stats['in_use'] = len(self._in_use)
+            stats['idle'] = len(self._idle)
+            stats['max_size'] = self.max_size
+        stats['avg_wait_ms'] = (
+            stats['total_wait_ms'] / stats['waits'] if stats['waits'] else 0.0
+        )
+        return stats
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(alias, options=None):
+    """Return the process-wide pool for a database alias."""
+    pool = _pools.get(alias)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(alias)
+            if pool is None:
+                config = DEFAULTS.copy()
+                config.update(options or {})
+                pool = ConnectionPool(
+                    max_size=config['MAX_SIZE'],
+                    timeout=config['TIMEOUT'],
+                    max_lifetime=config['MAX_LIFETIME'],
+                    health_check_after=config['HEALTH_CHECK_AFTER'],
+                )
+                _pools[alias] = pool
+    return pool
+
+
+def pool_stats():
+    """Return stats for every pool created in this process."""
+    return {alias: pool.stats() for alias, pool in _pools.items()}
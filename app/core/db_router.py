@@ -0,0 +1,259 @@
+# core/db_router.py
+"""
+Read-replica routing with read-your-writes stickiness.
+
+Reads only go to a replica inside ``replica_reads()`` (views opt in through
+``ReplicaReadMixin``), and never while the current client is pinned to the
+primary after one of its own writes. Replicas that fail a health check or lag
+too far behind are ejected until a later check passes. The checks run in a
+background thread; routing only reads their last result.
+"""
+import contextvars
+import logging
+import random
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import connections
+from django.dispatch import receiver
+
+logger = logging.getLogger(__name__)
+
+PRIMARY = 'default'
+
+DEFAULTS = {
+    'PIN_SECONDS': 5,
+    'MAX_LAG_SECONDS': 10,
+    'CHECK_INTERVAL': 5,
+    'COOKIE_NAME': 'db_pin',
+    'HEADER': 'X-DB-Pin',
+}
+
+_replica_reads = contextvars.ContextVar('replica_reads', default=False)
+_pinned = contextvars.ContextVar('pinned_to_primary', default=False)
+_wrote = contextvars.ContextVar('wrote_to_primary', default=False)
+_in_request = contextvars.ContextVar('request_routing', default=False)
+
+
+def get_routing_settings():
+    options = DEFAULTS.copy()
+    options.update(getattr(settings, 'REPLICA_ROUTING', {}))
+    return options
+
+
+def get_replica_aliases():
+    return list(getattr(settings, 'DATABASE_REPLICAS', []))
+
+
+@contextmanager
+def replica_reads():
+    """Allow reads in this block to be served by a replica."""
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+@contextmanager
+def pinned_to_primary(pinned=True):
+    """Send every read in this block to the primary."""
+    token = _pinned.set(pinned)
+    try:
+        yield
+    finally:
+        _pinned.reset(token)
+
+
+@contextmanager
+def request_routing(pinned=False):
+    """
+    Fresh routing state for one request.
+
+    Worker threads are reused across requests, so the state must be reset
+    on the way out rather than left in the thread's context.
+    """
+    request_token = _in_request.set(True)
+    pinned_token = _pinned.set(pinned)
+    wrote_token = _wrote.set(False)
+    try:
+        yield
+    finally:
+        _wrote.reset(wrote_token)
+        _pinned.reset(pinned_token)
+        _in_request.reset(request_token)
+
+
+def mark_write():
+    """
+    Record a write and pin the rest of the request to the primary.
+
+    Does nothing outside ``request_routing()``: there is no request to pin,
+    and the state would leak into later work on the same thread.
+    """
+    if not _in_request.get():
+        return
+    _wrote.set(True)
+    _pinned.set(True)
+
+
+def wrote_to_primary():
+    return _wrote.get()
+
+
+class ReplicaHealth:
+    """
+    Tracks which replicas are fit to serve reads.
+
+    ``start()`` runs the checks in a daemon thread every ``check_interval``
+    seconds, on that thread's own connections. ``healthy()`` only reads the
+    last known state, so routing a query never waits on a replica (and is
+    safe to call from an event loop).
+    """
+
+    def __init__(self, aliases, max_lag=10, check_interval=5):
+        self.aliases = list(aliases)
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._healthy = frozenset(self.aliases)
+        self._lag = {}
+        self._thread = None
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+        self.checked = threading.Event()
+
+    def healthy(self):
+        return [alias for alias in self.aliases if alias in self._healthy]
+
+    def start(self):
+        """
+        Start the check thread, unless it is running. Also restarts it in a
+        forked child, which does not inherit threads.
+        """
+        if not self.aliases:
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name='replica-health', daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        """Stop the check thread and wait for it to close its connections."""
+        self._stopped.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _run(self):
+        try:
+            while not self._stopped.is_set():
+                self.check()
+                self._stopped.wait(self.check_interval)
+        finally:
+            for alias in self.aliases:
+                connections[alias].close()
+
+    def check(self):
+        healthy = set()
+        for alias in self.aliases:
+            try:
+                lag = self.replication_lag(alias)
+            except Exception as e:
+                logger.warning(f"Replica {alias} failed health check: {str(e)}")
+                self._lag[alias] = None
+                continue
+            self._lag[alias] = lag
+            if lag <= self.max_lag:
+                healthy.add(alias)
+            else:
+                logger.warning(f"Replica {alias} ejected: {lag:.1f}s behind")
+
+        ejected = set(self.aliases) - healthy
+        recovered = healthy - self._healthy
+        if recovered:
+            logger.info(f"Replicas back in rotation: {', '.join(sorted(recovered))}")
+        self._healthy = frozenset(healthy)
+        self.checked.set()
+        return ejected
+
+    def replication_lag(self, alias):
+        """Return how many seconds ``alias`` is behind the primary."""
+        connection = connections[alias]
+        # The check thread keeps its connections; drop one that broke.
+        connection.close_if_unusable_or_obsolete()
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute(
+                    "SELECT CASE WHEN pg_is_in_recovery() THEN "
+                    "COALESCE(EXTRACT(EPOCH FROM "
+                    "now() - pg_last_xact_replay_timestamp()), 0) "
+                    "ELSE 0 END"
+                )
+                return float(cursor.fetchone()[0])
+            cursor.execute("SELECT 1")
+            return 0.0
+
+    def lag(self):
+        return dict(self._lag)
+
+
+_health = None
+_health_lock = threading.Lock()
+
+
+def get_replica_health():
+    global _health
+    if _health is None:
+        with _health_lock:
+            if _health is None:
+                options = get_routing_settings()
+                _health = ReplicaHealth(
+                    get_replica_aliases(),
+                    max_lag=options['MAX_LAG_SECONDS'],
+                    check_interval=options['CHECK_INTERVAL'],
+                )
+    _health.start()
+    return _health
+
+
+@receiver(setting_changed)
+def reset_replica_health(setting, **kwargs):
+    """Rebuild the health checks when tests change the replica settings."""
+    global _health
+    if setting not in ('DATABASE_REPLICAS', 'REPLICA_ROUTING'):
+        return
+    with _health_lock:
+        if _health is not None:
+            _health.stop()
+        _health = None
+
+
+class ReplicaRouter:
+    """
+    Database router that sends opted-in reads to healthy replicas.
+    """
+
+    def db_for_read(self, model, **hints):
+        if not _replica_reads.get() or _pinned.get():
+            return PRIMARY
+        replicas = get_replica_health().healthy()
+        if not replicas:
+            return PRIMARY
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        mark_write()
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db not in get_replica_aliases()
@@ -0,0 +1,215 @@
+# core/idempotency.py
+"""
+``Idempotency-Key`` support for endpoints that clients retry.
+
+The first request with a given key claims it by inserting an
+``IdempotencyRecord``; the unique constraint on ``(scope, key)`` makes that
+claim atomic across threads and worker processes. Its response is stored in
+the same transaction as the handler's writes and replayed to every retry
+until the record expires.
+Duplicates that arrive while it is still running wait for it, and a key
+reused for a different request body is rejected.
+"""
+import hashlib
+import json
+import logging
+import time
+from datetime import timedelta
+from functools import wraps
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+from .models import IdempotencyRecord
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'HEADER': 'Idempotency-Key',
+    'TTL': 86400,
+    'WAIT_TIMEOUT': 10,
+    'LOCK_TIMEOUT': 60,
+    'PURGE_INTERVAL': 300,
+}
+
+REPLAY_HEADER = 'Idempotent-Replayed'
+
+_last_purge = [0.0]
+
+
+def get_idempotency_settings():
+    options = DEFAULTS.copy()
+    options.update(getattr(settings, 'IDEMPOTENCY', {}))
+    return options
+
+
+def request_fingerprint(request):
+    """Hash of what makes two requests "the same": method, path and body."""
+    try:
+        body = json.dumps(request.data, sort_keys=True, default=str)
+    except Exception:
+        body = repr(request.data)
+    raw = f"{request.method}\n{request.path}\n{body}"
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def request_scope(request):
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return f"user:{user.pk}"
+    return 'anon'
+
+
+def purge_expired(limit=1000):
+    """Delete up to ``limit`` expired records; returns how many went."""
+    expired = IdempotencyRecord.objects.filter(expires_at__lt=timezone.now())
+    expired = expired.values('pk')[:limit]
+    deleted, _ = IdempotencyRecord.objects.filter(pk__in=list(expired)).delete()
+    return deleted
+
+
+class IdempotencyGuard:
+    """
+    Runs a view handler at most once per idempotency key.
+    """
+
+    def __init__(self, ttl=86400, wait_timeout=10, lock_timeout=60, purge_interval=300):
+        self.ttl = ttl
+        self.wait_timeout = wait_timeout
+        self.lock_timeout = lock_timeout
+        self.purge_interval = purge_interval
+
+    def run(self, request, key, handler):
+        self._maybe_purge()
+        scope = request_scope(request)
+        fingerprint = request_fingerprint(request)
+
+        deadline = time.monotonic() + self.wait_timeout
+        delay = 0.05
+        while True:
+            record = self._claim(scope, key, fingerprint)
+            if record is None:
+                break
+            if record.fingerprint != fingerprint:
+                return Response(
+                    {'error': 'Idempotency-Key was already used for a different '
+                              'request'},
+                    status=status.HTTP_422_UNPROCESSABLE_ENTITY
+                )
+            if record.status == IdempotencyRecord.Status.COMPLETED:
+                response = Response(record.response_body, status=record.response_status)
+                response[REPLAY_HEADER] = 'true'
+                return response
+            if time.monotonic() >= deadline:
+                return Response(
+                    {'error': 'A request with this Idempotency-Key is still in '
+                              'progress'},
+                    status=status.HTTP_409_CONFLICT
+                )
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+        # The handler's writes and the stored response commit together: a
+        # crash in between would otherwise let a retry take the key over
+        # after LOCK_TIMEOUT and apply the side effect a second time.
+        try:
+            with transaction.atomic():
+                response = handler()
+                if response.status_code >= 500:
+                    # Let the client retry failures that were not its fault,
+                    # with nothing left half-applied.
+                    transaction.set_rollback(True)
+                else:
+                    self._complete(scope, key, response)
+        except Exception:
+            self._release(scope, key)
+            raise
+
+        if response.status_code >= 500:
+            self._release(scope, key)
+        return response
+
+    def _complete(self, scope, key, response):
+        IdempotencyRecord.objects.filter(scope=scope, key=key).update(
+            status=IdempotencyRecord.Status.COMPLETED,
+            response_status=response.status_code,
+            response_body=getattr(response, 'data', None),
+        )
+
+    def _claim(self, scope, key, fingerprint):
+        """Claim the key; return None if we own it, else the existing record."""
+        now = timezone.now()
+        try:
+            with transaction.atomic():
+                IdempotencyRecord.objects.create(
+                    scope=scope,
+                    key=key,
+                    fingerprint=fingerprint,
+                    created_at=now,
+                    expires_at=now + timedelta(seconds=self.ttl),
+                )
+            return None
+        except IntegrityError:
+            pass
+
+        record = IdempotencyRecord.objects.filter(scope=scope, key=key).first()
+        if record is None:
+            # Released or purged in the meantime; try again.
+            return self._claim(scope, key, fingerprint)
+        stale = (
+            record.expires_at < now
+            or (
+                record.status == IdempotencyRecord.Status.IN_PROGRESS
+                and record.created_at < now - timedelta(seconds=self.lock_timeout)
+            )
+        )
+        if stale:
+            logger.warning(f"Taking over stale idempotency record {record}")
+            IdempotencyRecord.objects.filter(
+                pk=record.pk, created_at=record.created_at
+            ).delete()
+            return self._claim(scope, key, fingerprint)
+        return record
+
+    def _release(self, scope, key):
+        IdempotencyRecord.objects.filter(
+            scope=scope, key=key, status=IdempotencyRecord.Status.IN_PROGRESS
+        ).delete()
+
+    def _maybe_purge(self):
+        now = time.monotonic()
+        if now - _last_purge[0] < self.purge_interval:
+            return
+        _last_purge[0] = now
+        try:
+            purge_expired()
+        except Exception as e:
+            logger.error(f"Error purging idempotency records: {str(e)}")
+
+
+def idempotent(handler):
+    """
+    Honour ``Idempotency-Key`` on a DRF view handler (``create``, ``post``...).
+    Requests without the header run as usual.
+    """
+    @wraps(handler)
+    def wrapper(view, request, *args, **kwargs):
+        options = get_idempotency_settings()
+        key = request.headers.get(options['HEADER'])
+        if not key:
+            return handler(view, request, *args, **kwargs)
+        if len(key) > 255:
+            return Response(
+                {'error': f"{options['HEADER']} must be at most 255 characters"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        guard = IdempotencyGuard(
+            ttl=options['TTL'],
+            wait_timeout=options['WAIT_TIMEOUT'],
+            lock_timeout=options['LOCK_TIMEOUT'],
+            purge_interval=options['PURGE_INTERVAL'],
+        )
+        return guard.run(request, key, lambda: handler(view, request, *args, **kwargs))
+    return wrapper
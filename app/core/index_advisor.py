@@ -0,0 +1,717 @@
+# core/index_advisor.py
+"""
+Index advice from model metadata, the live schema and captured queries.
+
+- Redundant indexes. A plain btree index whose columns (and operator
+  classes) are a leading prefix of another index's can be dropped: every
+  lookup it serves, the wider index serves too. A unique index is only
+  ever redundant to an identical unique index, since it enforces
+  something. Partial indexes are only compared with the same condition.
+- Missing indexes. Logged SELECTs are grouped by shape and EXPLAINed
+  against the database. Shapes that scan or sort a whole table get a
+  composite index suggestion: equality columns, then one range column,
+  then ORDER BY columns. A column compared with the same value in every
+  logged call (e.g. ``status = 'pending'``) becomes the partial index
+  condition instead.
+- Write amplification. Each index costs a btree write per INSERT and
+  DELETE, and per UPDATE that changes a column it covers. On PostgreSQL an
+  UPDATE that changes any indexed column cannot be HOT, so it writes every
+  index of the table.
+
+Queries come from ``core.querylog`` (``QUERY_LOG``), Django's
+``django.db.backends`` debug log, or PostgreSQL's
+``log_min_duration_statement`` output.
+"""
+import ast
+import logging
+import re
+from collections import Counter, defaultdict, namedtuple
+
+from django.apps import apps
+from django.db import connections, models, transaction
+from django.db.models import UniqueConstraint
+from .archive import index_sizes
+
+logger = logging.getLogger(__name__)
+
+IndexInfo = namedtuple(
+    'IndexInfo',
+    'name table columns opclasses unique primary condition include method source size',
+)
+Redundancy = namedtuple('Redundancy', 'index covered_by reason')
+QueryRecord = namedtuple('QueryRecord', 'sql params duration_ms')
+Suggestion = namedtuple(
+    'Suggestion', 'model columns condition calls total_ms reason example',
+)
+
+# (seconds) sql; args=(...); alias=default  -- django.db.backends / core.querylog
+DJANGO_LOG = re.compile(
+    r'\((?P<seconds>\d+\.\d+)\) (?P<sql>.+?); args=(?P<args>.*); alias=\S+\s*$'
+)
+# LOG:  duration: 1.234 ms  statement: SELECT ...  -- log_min_duration_statement
+POSTGRES_LOG = re.compile(
+    r'duration: (?P<ms>\d+(?:\.\d+)?) ms\s+(?:statement|execute [^:]*): (?P<sql>.+)$'
+)
+
+LITERAL = re.compile(r"'(?:[^']|'')*'|(?<![\w\"])-?\d+(?:\.\d+)?\b|%s|\$\d+")
+PREDICATE = re.compile(
+    r'(?P<wrapped>\w+\()?"(?P<table>\w+)"\."(?P<column>\w+)"(?:::\w+)?\)?\s*'
+    r'(?P<op>NOT IN|IN|IS NOT NULL|IS NULL|LIKE|>=|<=|<>|!=|=|>|<)\s*'
+    r"(?P<value>\([^()]*\)|%s|\$\d+|'(?:[^']|'')*'|-?\d+(?:\.\d+)?)?",
+    re.IGNORECASE,
+)
+ORDER_TERM = re.compile(
+    r'"(?P<table>\w+)"\."(?P<column>\w+)"(?:\s+(?P<dir>ASC|DESC))?', re.IGNORECASE
+)
+CLAUSE_END = re.compile(
+    r'\s(?:GROUP BY|ORDER BY|HAVING|LIMIT|OFFSET|FOR UPDATE)\b', re.IGNORECASE
+)
+ORDER_BY = re.compile(
+    r'\sORDER BY\s(?P<terms>.+?)(?:\sLIMIT\b|\sOFFSET\b|\sFOR UPDATE\b|$)',
+    re.IGNORECASE,
+)
+STATEMENT_TABLE = {
+    'SELECT': re.compile(r'\bFROM\s+"(\w+)"', re.IGNORECASE),
+    'INSERT': re.compile(r'^\s*INSERT\s+INTO\s+"(\w+)"', re.IGNORECASE),
+    'UPDATE': re.compile(r'^\s*UPDATE\s+"(\w+)"', re.IGNORECASE),
+    'DELETE': re.compile(r'^\s*DELETE\s+FROM\s+"(\w+)"', re.IGNORECASE),
+}
+SET_COLUMN = re.compile(r'"(\w+)"\s*=')
+CONDITION_COLUMN = re.compile(r'"?(\w+)"?\s*(?:=|<>|!=|<|>|IS|IN|LIKE)')
+
+
+def project_models(app_labels=None):
+    """Concrete, managed models of ``app_labels`` (default: every app)."""
+    if app_labels:
+        configs = [apps.get_app_config(label) for label in app_labels]
+    else:
+        configs = apps.get_app_configs()
+    return [
+        model
+        for config in configs
+        for model in config.get_models()
+        if model._meta.managed and not model._meta.proxy
+    ]
+
+
+# Indexes ----------------------------------------------------------------
+
+def _index(name, table, columns, source, unique=False, primary=False, opclasses=(),
+           condition='', include=(), method='btree'):
+    opclasses = tuple(opclasses) or ('',) * len(columns)
+    return IndexInfo(
+        name, table, tuple(columns), opclasses, unique, primary, condition,
+        tuple(include), method, source, None,
+    )
+
+
+def _condition_sql(model, index, connection):
+    if getattr(index, 'condition', None) is None:
+        return ''
+    try:
+        schema_editor = connection.schema_editor(collect_sql=True)
+        sql = index._get_condition_sql(model, schema_editor)
+        return sql.replace(' WHERE ', '', 1).strip()
+    except Exception:
+        return str(index.condition)
+
+
+def declared_indexes(model, connection):
+    """The indexes ``model`` asks Django to create, as ``IndexInfo``s."""
+    meta = model._meta
+    table = meta.db_table
+
+    def column(name):
+        return meta.get_field(name).column
+
+    found = []
+
+    for field in meta.local_concrete_fields:
+        if field.primary_key:
+            found.append(_index(
+                'primary key', table, [field.column], 'primary key',
+                unique=True, primary=True,
+            ))
+        elif field.unique:
+            found.append(_index(
+                f'{field.name} (unique)', table, [field.column], 'unique=True',
+                unique=True,
+            ))
+        elif field.db_index:
+            found.append(_index(
+                f'{field.name} (db_index)', table, [field.column], 'db_index=True',
+            ))
+        # PostgreSQL also gets a pattern-ops index for LIKE on indexed text columns.
+        db_type = field.db_type(connection) or ''
+        if (
+            connection.vendor == 'postgresql'
+            and (field.unique or field.db_index)
+            and not getattr(field, 'db_collation', None)
+            and db_type.startswith(('varchar', 'text'))
+        ):
+            if db_type.startswith('varchar'):
+                opclass = 'varchar_pattern_ops'
+            else:
+                opclass = 'text_pattern_ops'
+            found.append(_index(
+                f'{field.name} (LIKE)', table, [field.column],
+                f'{field.name} index for LIKE', opclasses=[opclass],
+            ))
+
+    for fields in meta.unique_together:
+        found.append(_index(
+            f"unique_together {tuple(fields)}", table,
+            [column(name) for name in fields], 'unique_together', unique=True,
+        ))
+
+    for constraint in meta.constraints:
+        if not isinstance(constraint, UniqueConstraint):
+            continue
+        if constraint.expressions:
+            found.append(_index(
+                constraint.name, table, [], 'Meta.constraints', unique=True,
+                method='expression',
+            ))
+            continue
+        found.append(_index(
+            constraint.name, table, [column(name) for name in constraint.fields],
+            'Meta.constraints', unique=True, opclasses=constraint.opclasses,
+            condition=_condition_sql(model, constraint, connection),
+            include=[column(name) for name in constraint.include],
+        ))
+
+    for index in meta.indexes:
+        if index.expressions:
+            found.append(_index(
+                index.name, table, [], 'Meta.indexes', method='expression',
+            ))
+            continue
+        columns = [
+            column(name) + (' DESC' if order == 'DESC' else '')
+            for name, order in index.fields_orders
+        ]
+        method = 'btree' if type(index) is models.Index else type(index).__name__
+        found.append(_index(
+            index.name, table, columns, 'Meta.indexes',
+            opclasses=index.opclasses,
+            condition=_condition_sql(model, index, connection),
+            include=[column(name) for name in index.include],
+            method=method,
+        ))
+    return found
+
+
+def live_indexes(model, using='default'):
+    """The indexes that exist on ``model``'s table, or None if unknown."""
+    connection = connections[using]
+    table = model._meta.db_table
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == 'sqlite':
+                return _sqlite_indexes(cursor, connection, table)
+            if connection.vendor == 'postgresql':
+                return _postgres_indexes(cursor, table)
+    except Exception as e:
+        logger.debug(f"No live indexes for {table}: {str(e)}")
+    return None
+
+
+def _sqlite_indexes(cursor, connection, table):
+    cursor.execute(f"PRAGMA index_list({connection.ops.quote_name(table)})")
+    found = []
+    for _, name, unique, origin, partial in cursor.fetchall():
+        cursor.execute(f"PRAGMA index_xinfo({connection.ops.quote_name(name)})")
+        columns, include, expression = [], [], False
+        for _, _, column, desc, _, key in cursor.fetchall():
+            if column is None:
+                expression = expression or key
+                continue
+            if key:
+                columns.append(column + (' DESC' if desc else ''))
+        condition = ''
+        if partial:
+            cursor.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'index' AND name = %s",
+                [name],
+            )
+            row = cursor.fetchone()
+            condition = '?'
+            if row and ' WHERE ' in row[0]:
+                condition = row[0].split(' WHERE ', 1)[1].strip()
+        found.append(_index(
+            name, table, columns, 'database',
+            unique=bool(unique), primary=origin == 'pk',
+            condition=condition, include=include,
+            method='expression' if expression else 'btree',
+        ))
+    return found
+
+
+def _postgres_indexes(cursor, table):
+    cursor.execute(
+        """
+        SELECT c2.relname, i.indisunique, i.indisprimary, am.amname,
+               i.indexprs IS NOT NULL,
+               COALESCE(pg_get_expr(i.indpred, i.indrelid), ''),
+               ARRAY(
+                   SELECT a.attname || CASE WHEN i.indoption[k.n - 1] & 1 = 1
+                                            THEN ' DESC' ELSE '' END
+                   FROM unnest(i.indkey::int2[]) WITH ORDINALITY k(attnum, n)
+                   JOIN pg_attribute a
+                     ON a.attrelid = i.indrelid AND a.attnum = k.attnum
+                   WHERE k.n <= i.indnkeyatts ORDER BY k.n
+               ),
+               ARRAY(
+                   SELECT CASE WHEN o.opcdefault THEN '' ELSE o.opcname END
+                   FROM unnest(i.indclass::oid[]) WITH ORDINALITY k(opc, n)
+                   JOIN pg_opclass o ON o.oid = k.opc
+                   ORDER BY k.n
+               ),
+               ARRAY(
+                   SELECT a.attname
+                   FROM unnest(i.indkey::int2[]) WITH ORDINALITY k(attnum, n)
+                   JOIN pg_attribute a
+                     ON a.attrelid = i.indrelid AND a.attnum = k.attnum
+                   WHERE k.n > i.indnkeyatts ORDER BY k.n
+               ),
+               pg_relation_size(i.indexrelid)
+        FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indrelid
+        JOIN pg_class c2 ON c2.oid = i.indexrelid
+        JOIN pg_am am ON am.oid = c2.relam
+        WHERE c.relname = %s AND pg_catalog.pg_table_is_visible(c.oid)
+        """,
+        [table],
+    )
+    found = []
+    for row in cursor.fetchall():
+        name, unique, primary, method, expression, condition = row[:6]
+        columns, opclasses, include, size = row[6:]
+        found.append(_index(
+            name, table, columns, 'database', unique=unique, primary=primary,
+            opclasses=opclasses, condition=condition, include=include,
+            method='expression' if expression else method,
+        )._replace(size=size))
+    return found
+
+
+def _signature(index):
+    return (
+        index.columns,
+        index.opclasses,
+        index.unique,
+        bool(index.condition),
+        index.method,
+    )
+
+
+def model_indexes(model, using='default'):
+    """
+    ``declared_indexes`` matched against ``live_indexes``. Matched indexes
+    take the database's name and size; indexes that only exist in the
+    database (e.g. created with ``RunSQL``) are added with source
+    ``'database'``.
+    """
+    connection = connections[using]
+    declared = declared_indexes(model, connection)
+    live = live_indexes(model, using)
+    if live is None:
+        return declared
+
+    sizes = {}
+    if connection.vendor != 'postgresql':
+        sizes = index_sizes(model, using) or {}
+    unmatched = list(live)
+    merged = []
+    for index in declared:
+        match = next((other for other in unmatched if other.name == index.name), None)
+        if match is None:
+            signature = _signature(index)
+            match = next(
+                (other for other in unmatched if _signature(other) == signature), None
+            )
+        if match is None:
+            merged.append(index)
+            continue
+        unmatched.remove(match)
+        size = match.size or sizes.get(match.name)
+        merged.append(index._replace(name=match.name, size=size))
+    merged.extend(
+        index._replace(size=index.size or sizes.get(index.name)) for index in unmatched
+    )
+    return merged
+
+
+_SOURCE_RANK = {
+    'primary key': 0, 'unique=True': 1, 'unique_together': 1, 'Meta.constraints': 1,
+    'Meta.indexes': 2, 'db_index=True': 2, 'database': 3,
+}
+
+
+def _rank(index):
+    return _SOURCE_RANK.get(index.source, 2)
+
+
+def _covers(wide, narrow):
+    """True if ``wide`` serves every lookup ``narrow`` serves."""
+    if wide.method != 'btree' or narrow.method != 'btree' or not narrow.columns:
+        return False
+    if wide.condition != narrow.condition:
+        return False
+    width = len(narrow.columns)
+    if wide.columns[:width] != narrow.columns:
+        return False
+    if wide.opclasses[:width] != narrow.opclasses:
+        return False
+    if not set(narrow.include) <= set(wide.columns) | set(wide.include):
+        return False
+    if narrow.unique:
+        return wide.unique and wide.columns == narrow.columns
+    return True
+
+
+def redundant_indexes(indexes):
+    """
+    The ``indexes`` (of one table) that another index makes unnecessary.
+    Of two identical indexes, the one that backs a constraint is kept.
+    """
+    found = []
+    for position, index in enumerate(indexes):
+        if index.primary:
+            continue
+        for other_position, other in enumerate(indexes):
+            if other is index or not _covers(other, index):
+                continue
+            identical = _covers(index, other)
+            if identical and (_rank(index), position) < (_rank(other), other_position):
+                # Keep the better-ranked one, or the first.
+                continue
+            if other.columns == index.columns:
+                reason = f"duplicates {other.name} ({other.source})"
+            else:
+                reason = f"is a leading prefix of {other.name} ({other.source})"
+            found.append(Redundancy(index, other, reason))
+            break
+    return found
+
+
+# Query logs --------------------------------------------------------------
+
+def _parse_args(text):
+    try:
+        value = ast.literal_eval(text.strip())
+    except (ValueError, SyntaxError):
+        return None
+    if value is None:
+        return ()
+    return tuple(value) if isinstance(value, (list, tuple)) else None
+
+
+def parse_query_log(lines):
+    """
+    Yield a ``QueryRecord`` per statement found in ``lines``. ``params`` is
+    None when the arguments were not logged or cannot be read back.
+    """
+    for line in lines:
+        match = DJANGO_LOG.search(line)
+        if match:
+            duration_ms = float(match['seconds']) * 1000
+            yield QueryRecord(match['sql'], _parse_args(match['args']), duration_ms)
+            continue
+        match = POSTGRES_LOG.search(line)
+        if match:
+            yield QueryRecord(match['sql'].rstrip().rstrip(';'), (), float(match['ms']))
+
+
+def fingerprint(sql):
+    """``sql`` with literals and placeholders replaced by ``?``."""
+    shape = LITERAL.sub('?', sql)
+    shape = re.sub(r'\(\s*\?(?:\s*,\s*\?)*\s*\)', '(?+)', shape)
+    return ' '.join(shape.split())
+
+
+def parse_statement(sql):
+    """
+    ``{'kind', 'table', 'predicates', 'order_by', 'set_columns'}`` for a
+    Django-generated statement, or None. Predicates are
+    ``(column, op, value, placeholder)`` on the statement's own table;
+    ``placeholder`` is the position of the value's ``%s``, if it has one.
+    """
+    kind = sql.lstrip()[:6].upper()
+    if kind not in STATEMENT_TABLE:
+        return None
+    match = STATEMENT_TABLE[kind].search(sql)
+    if match is None:
+        return None
+    table = match.group(1)
+    statement = {
+        'kind': kind,
+        'table': table,
+        'predicates': [],
+        'order_by': [],
+        'set_columns': set(),
+    }
+
+    if kind == 'UPDATE':
+        rest = sql[match.end():]
+        set_clause = re.split(r'\sWHERE\s', rest, maxsplit=1, flags=re.IGNORECASE)[0]
+        statement['set_columns'] = set(SET_COLUMN.findall(set_clause))
+
+    where = re.search(r'\sWHERE\s', sql, re.IGNORECASE)
+    if where is not None:
+        start = where.end()
+        end = CLAUSE_END.search(sql, start)
+        clause = sql[start:end.start() if end else len(sql)]
+        for predicate in PREDICATE.finditer(clause):
+            if predicate['table'] != table or predicate['wrapped']:
+                continue
+            value = predicate['value'] or ''
+            position = start + predicate.start('value') if value else None
+            placeholder = sql[:position].count('%s') if value == '%s' else None
+            statement['predicates'].append(
+                (predicate['column'], predicate['op'].upper(), value, placeholder)
+            )
+
+    order = ORDER_BY.search(sql)
+    if order is not None:
+        statement['order_by'] = [
+            term['column'] + (' DESC' if (term['dir'] or '').upper() == 'DESC' else '')
+            for term in ORDER_TERM.finditer(order['terms'])
+            if term['table'] == table
+        ]
+    return statement
+
+
+class QueryShape:
+    """Every logged call of one statement shape."""
+
+    def __init__(self, fingerprint, statement):
+        self.fingerprint = fingerprint
+        self.statement = statement
+        self.calls = 0
+        self.total_ms = 0.0
+        self.example = None
+        self.values = defaultdict(set)
+
+    def add(self, record):
+        self.calls += 1
+        self.total_ms += record.duration_ms
+        if self.example is None and record.params is not None:
+            self.example = record
+        if record.params is None:
+            return
+        for _, _, _, placeholder in self.statement['predicates']:
+            if placeholder is not None and placeholder < len(record.params):
+                self.values[placeholder].add(repr(record.params[placeholder]))
+
+    def constant(self, predicate, min_calls):
+        """True if ``predicate`` compared against one value in every call."""
+        column, op, value, placeholder = predicate
+        if op in ('IS NULL', 'IS NOT NULL'):
+            return True
+        if op != '=':
+            return False
+        if placeholder is None:
+            return bool(value) and value != '%s' and not value.startswith(('$', '('))
+        return self.calls >= min_calls and len(self.values[placeholder]) == 1
+
+
+def group_queries(records):
+    """``{fingerprint: QueryShape}`` for the statements this module understands."""
+    shapes = {}
+    for record in records:
+        key = fingerprint(record.sql)
+        shape = shapes.get(key)
+        if shape is None:
+            statement = parse_statement(record.sql)
+            if statement is None:
+                continue
+            shape = shapes[key] = QueryShape(key, statement)
+        shape.add(record)
+    return shapes
+
+
+# Plans -------------------------------------------------------------------
+
+def explain(sql, params, using='default'):
+    """``{'scans': {tables}, 'sort': bool}`` from the planner, or None."""
+    connection = connections[using]
+    try:
+        with transaction.atomic(using=using), connection.cursor() as cursor:
+            if connection.vendor == 'sqlite':
+                cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+                details = [row[-1] for row in cursor.fetchall()]
+                scans = {
+                    detail.split()[1]
+                    for detail in details
+                    if detail.startswith('SCAN ')
+                }
+                return {
+                    'scans': scans,
+                    'sort': any('TEMP B-TREE' in detail for detail in details),
+                }
+            if connection.vendor == 'postgresql':
+                cursor.execute('EXPLAIN (FORMAT JSON) ' + sql, params)
+                plan = cursor.fetchone()[0]
+                return _postgres_plan(plan[0]['Plan'])
+    except Exception as e:
+        logger.debug(f"Could not EXPLAIN {sql[:80]}: {str(e)}")
+    return None
+
+
+def _postgres_plan(node, result=None):
+    result = result or {'scans': set(), 'sort': False}
+    if node.get('Node Type') == 'Seq Scan':
+        result['scans'].add(node.get('Relation Name'))
+    if node.get('Node Type') in ('Sort', 'Incremental Sort'):
+        result['sort'] = True
+    for child in node.get('Plans', []):
+        _postgres_plan(child, result)
+    return result
+
+
+# Suggestions ---------------------------------------------------------------
+
+def _leading(columns):
+    return [column.replace(' DESC', '') for column in columns]
+
+
+def suggest_index(shape, indexes, min_calls=3):
+    """
+    ``(columns, condition)`` for an index serving ``shape``, or None if the
+    shape has nothing to index or an existing index already leads with it.
+    """
+    equality, ranges, constant = [], [], []
+    for predicate in shape.statement['predicates']:
+        column, op, _, _ = predicate
+        if op in ('NOT IN', '<>', '!='):
+            continue
+        if shape.constant(predicate, min_calls):
+            constant.append(predicate)
+        elif op in ('=', 'IN'):
+            equality.append(column)
+        elif op == 'LIKE':
+            ranges.append(column)
+        elif op in ('>', '>=', '<', '<='):
+            ranges.append(column)
+
+    columns = list(dict.fromkeys(equality))
+    order_by = shape.statement['order_by']
+    if ranges:
+        columns.append(ranges[0])
+        if order_by and _leading(order_by)[0] == ranges[0]:
+            columns.extend(order_by[1:])
+    else:
+        columns.extend(column for column in order_by if column not in columns)
+    columns = list(dict.fromkeys(columns))
+    if not columns:
+        # Nothing but constants: index them rather than a partial index over nothing.
+        columns = list(dict.fromkeys(column for column, _, _, _ in constant))
+        equality, constant = columns, []
+    if not columns:
+        return None
+
+    condition = ' AND '.join(
+        f'"{column}" {op}' + (' %s' if value == '%s' else f' {value}' if value else '')
+        for column, op, value, _ in constant
+    )
+    first = _leading(columns)[:max(1, len(equality))]
+    for index in indexes:
+        if index.method != 'btree' or (index.condition and not condition):
+            continue
+        if _leading(index.columns)[:len(first)] == first:
+            return None
+    return columns, condition
+
+
+def _constant_values(shape):
+    """Condition values for a shape's constant placeholders, as literals."""
+    values = {}
+    for _, _, _, placeholder in shape.statement['predicates']:
+        if placeholder is not None and len(shape.values[placeholder]) == 1:
+            values[placeholder] = next(iter(shape.values[placeholder]))
+    return values
+
+
+def missing_indexes(shapes, models_by_table, indexes_by_table, using='default',
+                    run_explain=True, min_calls=3):
+    """``Suggestion``s for logged SELECTs, slowest (by total time) first."""
+    suggestions = []
+    for shape in shapes.values():
+        statement = shape.statement
+        model = models_by_table.get(statement['table'])
+        if statement['kind'] != 'SELECT' or model is None:
+            continue
+        indexes = indexes_by_table.get(statement['table'], [])
+        suggested = suggest_index(shape, indexes, min_calls)
+        if suggested is None:
+            continue
+        plan = None
+        if run_explain and shape.example is not None:
+            plan = explain(shape.example.sql, shape.example.params, using)
+        if plan is not None:
+            if statement['table'] not in plan['scans'] and not plan['sort']:
+                continue
+            reason = 'full scan' if statement['table'] in plan['scans'] else 'sort'
+        else:
+            reason = 'no index leads with these columns'
+        columns, condition = suggested
+        for placeholder, value in _constant_values(shape).items():
+            condition = condition.replace('%s', value, 1)
+        suggestions.append(Suggestion(
+            model, columns, condition, shape.calls, shape.total_ms, reason,
+            shape.fingerprint,
+        ))
+    suggestions.sort(key=lambda suggestion: -suggestion.total_ms)
+    return suggestions
+
+
+# Write amplification -------------------------------------------------------
+
+def table_writes(shapes):
+    """``{table: {'insert': n, 'delete': n, 'update': Counter({columns: n})}}``."""
+    writes = defaultdict(lambda: {'insert': 0, 'delete': 0, 'update': Counter()})
+    for shape in shapes.values():
+        statement = shape.statement
+        if statement['kind'] == 'INSERT':
+            writes[statement['table']]['insert'] += shape.calls
+        elif statement['kind'] == 'DELETE':
+            writes[statement['table']]['delete'] += shape.calls
+        elif statement['kind'] == 'UPDATE':
+            columns = frozenset(statement['set_columns'])
+            writes[statement['table']]['update'][columns] += shape.calls
+    return writes
+
+
+def _index_columns(index):
+    columns = set(_leading(index.columns)) | set(index.include)
+    columns.update(re.findall(CONDITION_COLUMN, index.condition))
+    return columns
+
+
+def write_amplification(indexes, writes=None, vendor='postgresql'):
+    """
+    ``(per_index, factor)``: the btree writes each index costs and the
+    table's writes per row written (1 = the table alone). Without logged
+    writes every row write is counted as an insert.
+    """
+    # A SQLite rowid table is its own primary key index.
+    indexes = [index for index in indexes if not (index.primary and vendor == 'sqlite')]
+    if not writes or not (writes['insert'] or writes['delete'] or writes['update']):
+        writes = {'insert': 1, 'delete': 0, 'update': Counter()}
+    row_writes = writes['insert'] + writes['delete'] + sum(writes['update'].values())
+    indexed = set()
+    for index in indexes:
+        indexed |= _index_columns(index)
+
+    per_index = {}
+    for index in indexes:
+        count = writes['insert'] + writes['delete']
+        for columns, calls in writes['update'].items():
+            if not columns & indexed:
+                continue  # HOT update: no index is touched.
+            if vendor == 'postgresql' or columns & _index_columns(index):
+                count += calls
+        per_index[index.name] = count
+    factor = (row_writes + sum(per_index.values())) / row_writes
+    return per_index, factor
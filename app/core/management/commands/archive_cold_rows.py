@@ -0,0 +1,54 @@
+# core/management/commands/archive_cold_rows.py
+
+from django.core.management.base import BaseCommand, CommandError
+from ...archive import get_archive_settings, get_archives
+
+
+class Command(BaseCommand):
+    help = (
+        "Move cold rows to their archive tables in small batches. "
+        "Safe to run while the site is serving traffic."
+    )
+
+    def add_arguments(self, parser):
+        options = get_archive_settings()
+        parser.add_argument(
+            '--only', action='append', default=[], help="Archive name (repeatable)."
+        )
+        parser.add_argument('--batch-size', type=int, default=options['BATCH_SIZE'])
+        parser.add_argument(
+            '--pause',
+            type=float,
+            default=options['PAUSE'],
+            help="Seconds between batches.",
+        )
+        parser.add_argument(
+            '--limit', type=int, help="Stop after this many rows per archive."
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help="Count cold rows without moving them.",
+        )
+        parser.add_argument('--database', default='default')
+
+    def handle(self, *args, **options):
+        archives = get_archives()
+        unknown = set(options['only']) - set(archives)
+        if unknown:
+            raise CommandError(f"Unknown archives: {', '.join(sorted(unknown))}")
+
+        for name, archive in sorted(archives.items()):
+            if options['only'] and name not in options['only']:
+                continue
+            if options['dry_run']:
+                cold = archive.cold().using(options['database']).count()
+                self.stdout.write(f"{name}: {cold} cold rows")
+                continue
+            moved = archive.archive(
+                batch_size=options['batch_size'],
+                pause=options['pause'],
+                limit=options['limit'],
+                using=options['database'],
+            )
+            self.stdout.write(self.style.SUCCESS(f"{name}: archived {moved} rows"))
@@ -0,0 +1,54 @@
+# core/management/commands/archive_report.py
+
+from django.core.management.base import BaseCommand
+from ...archive import get_archives
+
+
+def _bytes(value):
+    return 'n/a' if value is None else f"{value / 1024:.0f} KiB"
+
+
+def _ms(value):
+    return 'n/a' if value is None else f"{value:.3f} ms"
+
+
+class Command(BaseCommand):
+    help = (
+        "Report hot and archived row counts, index sizes and lookup latency "
+        "for every archive. Index sizes shrink once the hot table has been "
+        "vacuumed/reindexed after archival."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--samples', type=int, default=200, help="Lookups timed per table."
+        )
+        parser.add_argument('--database', default='default')
+
+    def handle(self, *args, **options):
+        for name, archive in sorted(get_archives().items()):
+            result = archive.report(
+                using=options['database'], samples=options['samples']
+            )
+            hot_indexes = result['hot_index_bytes']
+            hot_indexes = hot_indexes and sum(hot_indexes.values())
+            cold_indexes = result['archive_index_bytes']
+            cold_indexes = cold_indexes and sum(cold_indexes.values())
+            share = result['index_share_saved']
+            self.stdout.write(f"{name}:")
+            self.stdout.write(
+                f"  rows: hot={result['hot_rows']} archived={result['archived_rows']}"
+            )
+            self.stdout.write(
+                f"  index size: hot={_bytes(hot_indexes)} "
+                f"archived={_bytes(cold_indexes)}"
+            )
+            self.stdout.write(
+                f"  lookup by {result['lookup_field']} (median): "
+                f"hot={_ms(result['hot_lookup_ms'])} "
+                f"archived={_ms(result['archive_lookup_ms'])}"
+            )
+            self.stdout.write(
+                f"  kept out of hot indexes: {_bytes(result['index_bytes_saved'])}"
+                + ('' if share is None else f" ({share:.0%})")
+            )
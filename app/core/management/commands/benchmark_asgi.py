@@ -0,0 +1,247 @@
+# core/management/commands/benchmark_asgi.py
+
+import asyncio
+import json
+import statistics
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
+from multiprocessing import get_context
+from urllib.parse import urlsplit
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from rest_framework.views import APIView
+
+
+def _disable_throttles():
+    # Rate limits would end the run long before the server does. Views share
+    # DRF's default throttle list, and workers are throwaway processes.
+    APIView.throttle_classes.clear()
+
+
+def _wsgi_worker(path, headers, clients, requests, threads):
+    """
+    One sync worker: ``threads`` handler threads (1 = a classic prefork
+    worker) shared by ``clients`` closed-loop clients.
+    """
+    _disable_throttles()
+    app = WSGIHandler()
+    url = urlsplit(path)
+    statuses = {}
+
+    def call():
+        environ = {
+            'REQUEST_METHOD': 'GET',
+            'PATH_INFO': url.path,
+            'QUERY_STRING': url.query,
+            'SERVER_NAME': headers.get('host', 'localhost'),
+            'SERVER_PORT': '80',
+            'SERVER_PROTOCOL': 'HTTP/1.1',
+            'wsgi.url_scheme': 'http',
+            'wsgi.input': BytesIO(),
+            'wsgi.errors': BytesIO(),
+        }
+        for name, value in headers.items():
+            environ['HTTP_' + name.upper().replace('-', '_')] = value
+        status = []
+        body = app(
+            environ, lambda s, h, exc_info=None: status.append(int(s.split()[0]))
+        )
+        b''.join(body)
+        if hasattr(body, 'close'):
+            body.close()
+        return status[0]
+
+    pool = ThreadPoolExecutor(max_workers=threads)
+    in_flight = [0, 0]
+    lock = threading.Lock()
+
+    def handle():
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+        try:
+            return call()
+        finally:
+            with lock:
+                in_flight[0] -= 1
+
+    call()  # warm up
+    latencies = []
+    counter = iter(range(requests))
+
+    def client():
+        for _ in counter:
+            started = time.perf_counter()
+            status = pool.submit(handle).result()
+            latencies.append((time.perf_counter() - started) * 1000)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    started = time.perf_counter()
+    workers = [threading.Thread(target=client) for _ in range(clients)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+    pool.shutdown()
+    connections.close_all()
+    return {
+        'latencies': latencies,
+        'elapsed': elapsed,
+        'peak': in_flight[1],
+        'statuses': statuses,
+    }
+
+
+def _asgi_worker(path, headers, clients, requests, threads):
+    """One async worker: a single event loop shared by ``clients`` clients."""
+    _disable_throttles()
+    app = ASGIHandler()
+    url = urlsplit(path)
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': url.path,
+        'raw_path': url.path.encode(),
+        'query_string': url.query.encode(),
+        'headers': [
+            (name.lower().encode(), value.encode()) for name, value in headers.items()
+        ],
+        'client': ('127.0.0.1', 0),
+        'server': (headers.get('host', 'localhost'), 80),
+    }
+    statuses = {}
+    in_flight = [0, 0]
+
+    async def call():
+        status = []
+
+        async def receive():
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+        async def send(message):
+            if message['type'] == 'http.response.start':
+                status.append(message['status'])
+
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight[1], in_flight[0])
+        try:
+            await app(dict(scope), receive, send)
+        finally:
+            in_flight[0] -= 1
+        return status[0]
+
+    async def main():
+        await call()  # warm up
+        in_flight[1] = 0
+        latencies = []
+        remaining = [requests]
+
+        async def client():
+            while remaining[0] > 0:
+                remaining[0] -= 1
+                started = time.perf_counter()
+                status = await call()
+                latencies.append((time.perf_counter() - started) * 1000)
+                statuses[status] = statuses.get(status, 0) + 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(clients)))
+        return latencies, time.perf_counter() - started
+
+    latencies, elapsed = asyncio.run(main())
+    connections.close_all()
+    return {
+        'latencies': latencies,
+        'elapsed': elapsed,
+        'peak': in_flight[1],
+        'statuses': statuses,
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare how many concurrent requests WSGI and ASGI workers keep in "
+        "flight, and at what latency, for the same number of worker processes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', default='/catalog/search/?q=a')
+        parser.add_argument('--workers', type=int, default=4)
+        parser.add_argument(
+            '--threads', type=int, default=1,
+            help="Handler threads per WSGI worker (1 = prefork).",
+        )
+        parser.add_argument(
+            '--concurrency', default='10,50,200',
+            help="Comma-separated numbers of concurrent clients.",
+        )
+        parser.add_argument('--requests', type=int, default=1000)
+        parser.add_argument(
+            '--header', action='append', default=[], help="Extra 'Name: value' header."
+        )
+
+    def handle(self, *args, **options):
+        headers = {'host': 'localhost'}
+        for header in options['header']:
+            name, sep, value = header.partition(':')
+            if not sep:
+                raise CommandError(f"Headers look like 'Name: value', got {header!r}")
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            levels = [int(level) for level in options['concurrency'].split(',')]
+        except ValueError:
+            raise CommandError("--concurrency takes comma-separated integers")
+
+        workers = options['workers']
+        self.stdout.write(
+            f"{options['path']}: {workers} workers, {options['threads']} thread(s) "
+            f"per WSGI worker, {options['requests']} requests per run"
+        )
+        # Forked workers must open their own connections.
+        connections.close_all()
+        for level in levels:
+            for mode, target in (('wsgi', _wsgi_worker), ('asgi', _asgi_worker)):
+                self.report(mode, level, self.run(target, options, headers, level))
+
+    def run(self, target, options, headers, concurrency):
+        workers = options['workers']
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=get_context('fork')
+        ) as pool:
+            futures = [
+                pool.submit(
+                    target,
+                    options['path'],
+                    headers,
+                    max(1, concurrency // workers + (i < concurrency % workers)),
+                    options['requests'] // workers,
+                    options['threads'],
+                )
+                for i in range(workers)
+            ]
+            return [future.result() for future in futures]
+
+    def report(self, mode, concurrency, results):
+        latencies = [ms for result in results for ms in result['latencies']]
+        elapsed = max(result['elapsed'] for result in results)
+        statuses = {}
+        for result in results:
+            for status, count in result['statuses'].items():
+                statuses[status] = statuses.get(status, 0) + count
+        self.stdout.write(
+            f"{mode} c={concurrency:<4} "
+            f"rps={len(latencies) / elapsed:8.1f}  "
+            f"p50={statistics.median(latencies):7.2f} ms  "
+            f"p95={statistics.quantiles(latencies, n=20)[-1]:7.2f} ms  "
+            f"in-flight={sum(result['peak'] for result in results):<4} "
+            f"statuses={json.dumps(statuses, sort_keys=True)}"
+        )
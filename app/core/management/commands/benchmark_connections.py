@@ -0,0 +1,87 @@
+# core/management/commands/benchmark_connections.py
+
+import statistics
+import time
+from types import SimpleNamespace
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from rest_framework.test import APIRequestFactory, force_authenticate
+from accounts.models import Account
+from accounts.views import AccountViewSet
+from ...db.pool import get_pool
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare AccountViewSet.retrieve latency with a new connection per "
+        "request, a persistent connection, and the connection pool."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=500)
+
+    def handle(self, *args, **options):
+        account = Account.objects.order_by('pk').first()
+        if account is None:
+            raise CommandError("Create at least one account to benchmark against.")
+
+        view = AccountViewSet.as_view({'get': 'retrieve'}, throttle_classes=[])
+        factory = APIRequestFactory()
+        user = SimpleNamespace(pk=0, is_authenticated=True)
+
+        def request():
+            req = factory.get(f'/accounts/{account.pk}/')
+            force_authenticate(req, user=user)
+            response = view(req, pk=account.pk)
+            if response.status_code != 200:
+                raise CommandError(f"retrieve returned {response.status_code}")
+
+        modes = [('new connection', False, True), ('persistent', False, False)]
+        if hasattr(connection, 'pool_enabled'):
+            modes.append(('pooled', True, True))
+        else:
+            self.stdout.write(
+                f"{connection.vendor} backend has no pool; skipping pooled mode"
+            )
+
+        original = connection.settings_dict.get('POOL')
+        connection.close()
+        try:
+            results = {}
+            for label, pooled, close_each in modes:
+                connection.settings_dict['POOL'] = {
+                    **(original or {}),
+                    'ENABLED': pooled,
+                }
+                results[label] = self._run(request, options['requests'], close_each)
+                connection.close()
+        finally:
+            if original is None:
+                connection.settings_dict.pop('POOL', None)
+            else:
+                connection.settings_dict['POOL'] = original
+
+        baseline = statistics.median(results['new connection'])
+        for label, timings in results.items():
+            median = statistics.median(timings)
+            self.stdout.write(
+                f"{label:<15} median={median:.2f} ms  "
+                f"p95={statistics.quantiles(timings, n=20)[-1]:.2f} ms  "
+                f"saved={baseline - median:+.2f} ms/request"
+            )
+        if 'pooled' in results:
+            self.stdout.write(f"pool stats: {get_pool(connection.alias).stats()}")
+
+    def _run(self, request, count, close_each):
+        request()  # warm up imports and caches
+        if close_each:
+            connection.close()
+        timings = []
+        for _ in range(count):
+            started = time.perf_counter()
+            request()
+            if close_each:
+                # What the request_finished handler does with CONN_MAX_AGE = 0.
+                connection.close()
+            timings.append((time.perf_counter() - started) * 1000)
+        return timings
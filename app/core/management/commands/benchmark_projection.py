@@ -0,0 +1,89 @@
+# core/management/commands/benchmark_projection.py
+
+import statistics
+import time
+import tracemalloc
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from accounts.models import Account
+from accounts.serializers import AccountDetailSerializer
+from ...mixins import serializer_model_fields
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare loading and serializing pages of accounts with every column "
+        "against the serializer-derived projection. All data is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5000)
+        parser.add_argument('--page-size', type=int, default=100)
+        parser.add_argument('--address-length', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        page_size = options['page_size']
+        fields = sorted(serializer_model_fields(AccountDetailSerializer(), Account))
+
+        with transaction.atomic():
+            self._load(options['rows'], options['address_length'])
+            querysets = [
+                ('all columns', Account.objects.order_by('pk')),
+                ('projected', Account.objects.order_by('pk').only(*fields)),
+            ]
+            results = {
+                label: self._measure(qs, options['rows'], page_size)
+                for label, qs in querysets
+            }
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"database:  {connection.vendor}")
+        self.stdout.write(f"projected: {', '.join(fields)}")
+        for label, (sizes, peaks, timings) in results.items():
+            self.stdout.write(
+                f"{label:<12} bytes/page={statistics.mean(sizes) / 1024:.1f} KiB  "
+                f"memory/page={statistics.mean(peaks) / 1024:.1f} KiB  "
+                f"median={statistics.median(timings):.2f} ms/page"
+            )
+
+    def _load(self, rows, address_length):
+        Account.objects.bulk_create(
+            [
+                Account(
+                    username=f'bench{i}',
+                    email=f'bench{i}@example.com',
+                    password='pbkdf2_sha256$600000$' + 'x' * 66,
+                    first_name='Bench',
+                    last_name=f'User{i}',
+                    address='x' * address_length,
+                )
+                for i in range(rows)
+            ],
+            batch_size=1000,
+        )
+
+    def _measure(self, queryset, rows, page_size):
+        sizes, peaks, timings = [], [], []
+        for offset in range(0, rows, page_size):
+            page = queryset[offset:offset + page_size]
+
+            # Bytes the driver hands back for the page's rows.
+            sql, params = page.query.sql_with_params()
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                sizes.append(
+                    sum(
+                        len(str(value).encode())
+                        for row in cursor.fetchall()
+                        for value in row
+                        if value is not None
+                    )
+                )
+
+            tracemalloc.start()
+            started = time.perf_counter()
+            AccountDetailSerializer(list(page), many=True).data
+            timings.append((time.perf_counter() - started) * 1000)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        return sizes, peaks, timings
@@ -0,0 +1,67 @@
+# core/management/commands/drain_outbox.py
+
+import time
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from ...outbox import OutboxDispatcher, get_outbox_settings, outbox_stats, purge_outbox
+
+# Seconds between purges of old delivered and dead events.
+PURGE_INTERVAL = 3600
+
+
+class Command(BaseCommand):
+    help = "Deliver pending outbox events to their handlers."
+
+    def add_arguments(self, parser):
+        options = get_outbox_settings()
+        parser.add_argument('--batch-size', type=int, default=options['BATCH_SIZE'])
+        parser.add_argument(
+            '--poll-interval', type=float, default=options['POLL_INTERVAL']
+        )
+        parser.add_argument(
+            '--retention-days', type=float, default=options['RETENTION_DAYS'],
+            help="Delete delivered and dead events processed longer ago than this.",
+        )
+        parser.add_argument(
+            '--once', action='store_true', help="Drain what is pending, then exit."
+        )
+        parser.add_argument('--database', default='default')
+
+    def handle(self, *args, **options):
+        settings = get_outbox_settings()
+        dispatcher = OutboxDispatcher(
+            batch_size=options['batch_size'],
+            max_attempts=settings['MAX_ATTEMPTS'],
+            retry_backoff=settings['RETRY_BACKOFF'],
+            max_backoff=settings['MAX_BACKOFF'],
+            lease_seconds=settings['LEASE_SECONDS'],
+            using=options['database'],
+        )
+        purged_at = None
+
+        while True:
+            close_old_connections()
+            started = time.perf_counter()
+            delivered, failed = dispatcher.drain_once()
+            elapsed = (time.perf_counter() - started) * 1000
+
+            if delivered or failed:
+                stats = outbox_stats(options['database'])
+                self.stdout.write(
+                    f"delivered={delivered} failed={failed} batch_ms={elapsed:.0f} "
+                    f"pending={stats['pending']} dead={stats['dead']} "
+                    f"lag_s={stats['lag_seconds']:.1f}"
+                )
+
+            if delivered + failed < options['batch_size']:
+                # Purge while idle, so it never delays a backlog.
+                if purged_at is None or time.monotonic() - purged_at > PURGE_INTERVAL:
+                    purged = purge_outbox(
+                        options['retention_days'], options['database']
+                    )
+                    purged_at = time.monotonic()
+                    if purged:
+                        self.stdout.write(f"purged={purged}")
+                if options['once']:
+                    break
+                time.sleep(options['poll_interval'])
@@ -0,0 +1,141 @@
+# core/management/commands/index_advisor.py
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from ...index_advisor import (
+    group_queries,
+    missing_indexes,
+    model_indexes,
+    parse_query_log,
+    project_models,
+    redundant_indexes,
+    table_writes,
+    write_amplification,
+)
+
+
+def _size(value):
+    return '' if value is None else f" {value / 1024:.0f} KiB"
+
+
+def _fields(model, columns):
+    by_column = {field.column: field.name for field in model._meta.concrete_fields}
+    names = []
+    for column in columns:
+        name, _, order = column.partition(' ')
+        names.append(('-' if order == 'DESC' else '') + by_column.get(name, name))
+    return names
+
+
+class Command(BaseCommand):
+    help = (
+        "Flag indexes that duplicate another index, suggest composite or "
+        "partial indexes for logged queries that scan or sort whole tables, "
+        "and estimate the write amplification of each table's indexes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'app_label', nargs='*', help="Apps to check (default: all).",
+        )
+        parser.add_argument(
+            '--log', action='append', default=[],
+            help="Query log to read (core.querylog, django.db.backends or PostgreSQL "
+                 "duration log). Repeatable.",
+        )
+        parser.add_argument(
+            '--no-explain', action='store_true', help="Do not EXPLAIN logged queries.",
+        )
+        parser.add_argument(
+            '--min-calls', type=int, default=3,
+            help="Calls with one value before a column is suggested as a partial "
+                 "index condition.",
+        )
+        parser.add_argument(
+            '--top', type=int, default=20,
+            help="Most missing-index suggestions to show.",
+        )
+        parser.add_argument('--database', default='default')
+
+    def handle(self, *args, **options):
+        using = options['database']
+        try:
+            models = project_models(options['app_label'])
+        except LookupError as e:
+            raise CommandError(str(e))
+
+        records = []
+        for path in options['log']:
+            try:
+                with open(path, encoding='utf-8', errors='replace') as log:
+                    records.extend(parse_query_log(log))
+            except OSError as e:
+                raise CommandError(f"Cannot read {path}: {e}")
+        shapes = group_queries(records)
+        writes = table_writes(shapes)
+
+        indexes_by_table = {
+            model._meta.db_table: model_indexes(model, using) for model in models
+        }
+        models_by_table = {model._meta.db_table: model for model in models}
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Redundant indexes"))
+        redundant = 0
+        for model in models:
+            for found in redundant_indexes(indexes_by_table[model._meta.db_table]):
+                redundant += 1
+                self.stdout.write(
+                    f"  {model._meta.label} {found.index.name} ({found.index.source}) "
+                    f"{found.reason}{_size(found.index.size)}"
+                )
+        if not redundant:
+            self.stdout.write("  none")
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Missing indexes"))
+        if not records:
+            self.stdout.write("  no query log given (--log)")
+        else:
+            self.stdout.write(f"  {len(records)} statements, {len(shapes)} shapes")
+            suggestions = missing_indexes(
+                shapes, models_by_table, indexes_by_table, using,
+                run_explain=not options['no_explain'], min_calls=options['min_calls'],
+            )
+            for suggestion in suggestions[:options['top']]:
+                index = f"fields={_fields(suggestion.model, suggestion.columns)}"
+                if suggestion.condition:
+                    index += f" WHERE {suggestion.condition}"
+                self.stdout.write(
+                    f"  {suggestion.model._meta.label}: {index} -- "
+                    f"{suggestion.reason}, {suggestion.calls} calls, "
+                    f"{suggestion.total_ms:.1f} ms total"
+                )
+                self.stdout.write(f"      {suggestion.example[:160]}")
+            if not suggestions:
+                self.stdout.write("  none")
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Write amplification"))
+        vendor = connections[using].vendor
+        for model in models:
+            table = model._meta.db_table
+            per_index, factor = write_amplification(
+                indexes_by_table[table], writes.get(table), vendor,
+            )
+            if not per_index:
+                continue
+            sizes = {index.name: index.size for index in indexes_by_table[table]}
+            if table not in writes:
+                self.stdout.write(
+                    f"  {model._meta.label}: {len(per_index)} indexes, "
+                    f"{factor:.1f}x writes per inserted row (no logged writes)"
+                )
+                for name in per_index:
+                    self.stdout.write(f"      {name}{_size(sizes.get(name))}")
+                continue
+            self.stdout.write(
+                f"  {model._meta.label}: {len(per_index)} indexes, "
+                f"{factor:.1f}x writes per logged row write"
+            )
+            for name, count in sorted(per_index.items(), key=lambda item: -item[1]):
+                self.stdout.write(
+                    f"      {name}: {count} btree writes{_size(sizes.get(name))}"
+                )
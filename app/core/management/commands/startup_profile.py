@@ -0,0 +1,63 @@
+# core/management/commands/startup_profile.py
+
+from django.core.management.base import BaseCommand, CommandError
+from ...startup import ENTRY_POINTS, by_package, get_startup_settings, profile_boot
+
+
+class Command(BaseCommand):
+    help = (
+        "Boot the WSGI/ASGI entry points in fresh interpreters and report "
+        "per-module import time and memory against the cold-start target."
+    )
+
+    def add_arguments(self, parser):
+        options = get_startup_settings()
+        parser.add_argument('--entry', choices=sorted(ENTRY_POINTS), action='append')
+        parser.add_argument('--runs', type=int, default=options['RUNS'])
+        parser.add_argument('--top', type=int, default=options['TOP'])
+        parser.add_argument('--target-ms', type=float, default=options['TARGET_MS'])
+
+    def handle(self, *args, **options):
+        over = []
+        for entry in options['entry'] or sorted(ENTRY_POINTS):
+            try:
+                profile = profile_boot(entry, runs=options['runs'])
+            except RuntimeError as e:
+                raise CommandError(str(e))
+            self._report(profile, options['top'], options['target_ms'])
+            if profile['boot_ms'] > options['target_ms']:
+                over.append(entry)
+
+        if over:
+            raise CommandError(
+                f"Cold start over the {options['target_ms']:.0f} ms target: "
+                f"{', '.join(over)}"
+            )
+
+    def _report(self, profile, top, target_ms):
+        status = 'ok' if profile['boot_ms'] <= target_ms else 'OVER'
+        self.stdout.write(f"{profile['entry']} ({profile['module']})")
+        self.stdout.write(
+            f"  boot: {profile['boot_ms']:.0f} ms median "
+            f"(target {target_ms:.0f} ms, {status})  "
+            f"peak RSS: {profile['rss_kb'] / 1024:.1f} MiB"
+        )
+
+        packages = by_package(profile['modules'])
+        packages = sorted(packages.items(), key=lambda p: -p[1]['self_ms'])
+        self.stdout.write("  packages by import time:")
+        for name, stats in packages[:top]:
+            self.stdout.write(
+                f"    {name:<32} {stats['self_ms']:8.1f} ms  "
+                f"{stats['memory_kb']:8.0f} KiB  "
+                f"({stats['modules']} modules)"
+            )
+
+        modules = sorted(profile['modules'].items(), key=lambda m: -m[1]['self_ms'])
+        self.stdout.write("  slowest modules (self / cumulative):")
+        for name, stats in modules[:top]:
+            self.stdout.write(
+                f"    {name:<48} {stats['self_ms']:7.1f} / "
+                f"{stats['cumulative_ms']:7.1f} ms  "
+                f"{stats['memory_kb']:7.0f} KiB"
+            )
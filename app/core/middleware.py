@@ -0,0 +1,89 @@
+# core/middleware.py
+
+import time
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from .db_router import get_routing_settings, request_routing, wrote_to_primary
+
+
+class ReplicaPinningMiddleware:
+    """
+    Pins a client to the primary database for a short window after it writes.
+
+    The pin expiry is returned as a cookie and an ``X-DB-Pin`` header; clients
+    that do not keep cookies can echo the header back instead.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        options = get_routing_settings()
+        now = time.time()
+
+        with request_routing(pinned=self._pinned_until(request, options) > now):
+            response = self.get_response(request)
+            self._pin(response, options, now)
+
+        return response
+
+    async def __acall__(self, request):
+        options = get_routing_settings()
+        now = time.time()
+
+        with request_routing(pinned=self._pinned_until(request, options) > now):
+            response = await self.get_response(request)
+            self._pin(response, options, now)
+
+        return response
+
+    def _pin(self, response, options, now):
+        if wrote_to_primary():
+            until = now + options['PIN_SECONDS']
+            response.set_cookie(
+                options['COOKIE_NAME'],
+                f"{until:.3f}",
+                max_age=options['PIN_SECONDS'],
+                httponly=True,
+                samesite='Lax',
+            )
+            response[options['HEADER']] = f"{until:.3f}"
+
+    def _pinned_until(self, request, options):
+        header = 'HTTP_' + options['HEADER'].upper().replace('-', '_')
+        value = request.COOKIES.get(options['COOKIE_NAME']) or request.META.get(header)
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return 0.0
+
+
+class ASGIURLConfMiddleware:
+    """
+    Resolves requests that arrive over ASGI with ``settings.ASGI_URLCONF``,
+    which routes read endpoints to their async-native views.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.urlconf = getattr(settings, 'ASGI_URLCONF', None)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        self._route(request)
+        return self.get_response(request)
+
+    def _route(self, request):
+        if self.urlconf and isinstance(request, ASGIRequest):
+            request.urlconf = self.urlconf
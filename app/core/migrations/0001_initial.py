@@ -0,0 +1,85 @@
+# Generated by Django 4.2 on 2024-12-02 10:00
+
+import core.models
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxEvent',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('aggregate_type', models.CharField(max_length=50)),
+                ('aggregate_id', models.CharField(max_length=64)),
+                ('event_type', models.CharField(max_length=50)),
+                (
+                    'payload',
+                    models.JSONField(
+                        default=dict, encoder=core.models.OutboxJSONEncoder
+                    ),
+                ),
+                (
+                    'status',
+                    models.CharField(
+                        choices=[
+                            ('pending', 'Pending'),
+                            ('done', 'Done'),
+                            ('dead', 'Dead'),
+                        ],
+                        default='pending',
+                        max_length=10,
+                    ),
+                ),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True, default='')),
+                (
+                    'created_at',
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, editable=False
+                    ),
+                ),
+                (
+                    'available_at',
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Outbox Event',
+                'verbose_name_plural': 'Outbox Events',
+                'ordering': ['id'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='outboxevent',
+            index=models.Index(
+                condition=models.Q(('status', 'pending')),
+                fields=['available_at', 'id'],
+                name='idx_outbox_pending',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='outboxevent',
+            index=models.Index(
+                condition=models.Q(('status', 'pending')),
+                fields=['aggregate_type', 'aggregate_id', 'id'],
+                name='idx_outbox_aggregate',
+            ),
+        ),
+    ]
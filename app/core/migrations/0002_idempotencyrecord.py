@@ -0,0 +1,74 @@
+# Generated by Django 4.2 on 2024-12-12 10:00
+
+import core.models
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IdempotencyRecord',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('scope', models.CharField(max_length=100)),
+                ('key', models.CharField(max_length=255)),
+                ('fingerprint', models.CharField(max_length=64)),
+                (
+                    'status',
+                    models.CharField(
+                        choices=[
+                            ('in_progress', 'In progress'),
+                            ('completed', 'Completed'),
+                        ],
+                        default='in_progress',
+                        max_length=12,
+                    ),
+                ),
+                (
+                    'response_status',
+                    models.PositiveSmallIntegerField(blank=True, null=True),
+                ),
+                (
+                    'response_body',
+                    models.JSONField(
+                        blank=True, encoder=core.models.OutboxJSONEncoder, null=True
+                    ),
+                ),
+                (
+                    'created_at',
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, editable=False
+                    ),
+                ),
+                ('expires_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Idempotency Record',
+                'verbose_name_plural': 'Idempotency Records',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='idempotencyrecord',
+            index=models.Index(fields=['expires_at'], name='idx_idempotency_expires'),
+        ),
+        migrations.AddConstraint(
+            model_name='idempotencyrecord',
+            constraint=models.UniqueConstraint(
+                fields=('scope', 'key'), name='uniq_idempotency_scope_key'
+            ),
+        ),
+    ]
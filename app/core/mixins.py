@@ -0,0 +1,193 @@
+# core/mixins.py
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.http import Http404
+from rest_framework.permissions import SAFE_METHODS
+from .batch import current_batch_cache, queryset_key
+from .db_router import replica_reads
+
+
+class ReplicaReadMixin:
+    """
+    Lets safe requests to a view read from a replica.
+
+    Set ``replica_actions`` on a viewset to limit this to some actions, e.g.
+    ``('list', 'retrieve')``.
+    """
+    replica_actions = None
+
+    def dispatch(self, request, *args, **kwargs):
+        if not self._reads_from_replica(request):
+            return super().dispatch(request, *args, **kwargs)
+        if self.view_is_async:
+            return self._dispatch_async(request, *args, **kwargs)
+        with replica_reads():
+            return super().dispatch(request, *args, **kwargs)
+
+    async def _dispatch_async(self, request, *args, **kwargs):
+        with replica_reads():
+            return await super().dispatch(request, *args, **kwargs)
+
+    def _reads_from_replica(self, request):
+        if request.method not in SAFE_METHODS:
+            return False
+        if self.replica_actions is None:
+            return True
+        # DRF only sets ``self.action`` inside dispatch(); look it up the same way.
+        action_map = getattr(self, 'action_map', None) or {}
+        return action_map.get(request.method.lower()) in self.replica_actions
+
+
+def serializer_model_fields(serializer, model, annotations=()):
+    """
+    Return the model fields ``serializer`` reads, or None if that cannot be
+    worked out (e.g. a ``SerializerMethodField`` without a hint).
+
+    Serializers can name the model fields behind computed fields in
+    ``Meta.projection_requires``, e.g. ``{'full_name': ['first_name', 'last_name']}``.
+    """
+    serializer = getattr(serializer, 'child', serializer)
+    requires = getattr(getattr(serializer, 'Meta', None), 'projection_requires', {})
+    names = {model._meta.pk.name}
+
+    for field_name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if field_name in requires:
+            names.update(requires[field_name])
+            continue
+        if field.source == '*':
+            return None
+        attr = field.source_attrs[0]
+        if attr in annotations:
+            continue
+        try:
+            model_field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            # A property or method: no telling what it reads.
+            return None
+        if model_field.concrete and not model_field.many_to_many:
+            names.add(model_field.name)
+
+    return names
+
+
+class FieldProjectionMixin:
+    """
+    Loads only the columns the serializer renders on safe requests.
+
+    The field list comes from the active serializer, so columns such as
+    ``password`` are never fetched for views that do not show them. Set
+    ``field_projection = False`` to opt out, or ``projection_actions`` to
+    limit it to some viewset actions.
+    """
+    field_projection = True
+    projection_actions = None
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if not self._projects_fields():
+            return queryset
+        fields = self.get_projected_fields(queryset)
+        if fields is None:
+            return queryset
+        return queryset.only(*sorted(fields))
+
+    def get_projected_fields(self, queryset):
+        annotations = tuple(queryset.query.annotations)
+        cache = self.__class__.__dict__.get('_projection_cache')
+        if cache is None:
+            cache = {}
+            type(self)._projection_cache = cache
+        key = (self.get_serializer_class(), annotations)
+        if key not in cache:
+            cache[key] = serializer_model_fields(
+                self.get_serializer(), queryset.model, annotations
+            )
+        return cache[key]
+
+    def _projects_fields(self):
+        request = getattr(self, 'request', None)
+        if (
+            not self.field_projection
+            or request is None
+            or request.method not in SAFE_METHODS
+        ):
+            return False
+        if self.projection_actions is None:
+            return True
+        return getattr(self, 'action', None) in self.projection_actions
+
+
+class BatchCacheMixin:
+    """
+    Shares ``get_object()`` lookups between the sub-requests of a batch (see
+    ``core.batch``). Outside a batch, and for unsafe methods, it does nothing.
+    """
+
+    def get_object(self):
+        cache = current_batch_cache()
+        if cache is None or self.request.method not in SAFE_METHODS:
+            return super().get_object()
+
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            queryset = self.filter_queryset(self.get_queryset()).filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+        except (TypeError, ValueError, ValidationError):
+            return super().get_object()
+        key = queryset_key(queryset)
+        if key is None:
+            return super().get_object()
+        obj = cache.get_or_load(key, super().get_object)
+        # Object permissions depend on the requester, so check them every time.
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+
+class ArchiveRestoreMixin:
+    """
+    Finds archived rows on lookup. When ``get_object()`` finds nothing, the
+    row is looked up in ``archive`` (a ``core.archive.Archive``) and object
+    permissions are checked against it. Safe requests get the archived copy
+    as an unsaved instance, so a read never writes; other requests (updates,
+    password changes) move it back to the hot table first.
+    """
+    archive = None
+
+    def get_object(self):
+        try:
+            return super().get_object()
+        except Http404:
+            obj = self.restore_archived()
+            if obj is None:
+                raise
+            return obj
+
+    def restore_archived(self):
+        if self.archive is None:
+            return None
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            archived = self.archive.get_archived(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+        except (TypeError, ValueError, ValidationError):
+            return None
+        if archived is None:
+            return None
+        # Check before anything moves: a denied request must not restore.
+        self.check_object_permissions(self.request, archived)
+        if self.request.method in SAFE_METHODS:
+            return archived
+
+        restored = self.archive.restore(pk=archived.pk)
+        if restored is None:
+            return None
+        # Read it back from the primary: a replica may not have it yet.
+        queryset = self.filter_queryset(self.get_queryset()).using(restored._state.db)
+        obj = queryset.filter(pk=restored.pk).first()
+        if obj is not None:
+            self.check_object_permissions(self.request, obj)
+        return obj
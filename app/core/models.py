@@ -0,0 +1,103 @@
+# core/models.py
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class OutboxJSONEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        try:
+            return super().default(o)
+        except TypeError:
+            # e.g. PhoneNumber; events only need the display value.
+            return str(o)
+
+
+class OutboxEvent(models.Model):
+    """
+    A change to an aggregate, written in the same transaction as the change
+    and delivered later by ``manage.py drain_outbox``.
+    """
+    class Status(models.TextChoices):
+        PENDING = 'pending', _('Pending')
+        DONE = 'done', _('Done')
+        DEAD = 'dead', _('Dead')
+
+    aggregate_type = models.CharField(max_length=50)
+    aggregate_id = models.CharField(max_length=64)
+    event_type = models.CharField(max_length=50)
+    payload = models.JSONField(default=dict, encoder=OutboxJSONEncoder)
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
+    available_at = models.DateTimeField(default=timezone.now)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = _("Outbox Event")
+        verbose_name_plural = _("Outbox Events")
+        indexes = [
+            models.Index(
+                fields=['available_at', 'id'],
+                name='idx_outbox_pending',
+                condition=Q(status='pending'),
+            ),
+            models.Index(
+                fields=['aggregate_type', 'aggregate_id', 'id'],
+                name='idx_outbox_aggregate',
+                condition=Q(status='pending'),
+            ),
+        ]
+        ordering = ['id']
+
+    def __str__(self):
+        return (
+            f"{self.aggregate_type}:{self.aggregate_id} "
+            f"{self.event_type} ({self.status})"
+        )
+
+
+class IdempotencyRecord(models.Model):
+    """
+    The outcome of a request sent with an ``Idempotency-Key`` header, kept
+    until ``expires_at`` so retries get the same reply.
+    """
+    class Status(models.TextChoices):
+        IN_PROGRESS = 'in_progress', _('In progress')
+        COMPLETED = 'completed', _('Completed')
+
+    scope = models.CharField(max_length=100)
+    key = models.CharField(max_length=255)
+    fingerprint = models.CharField(max_length=64)
+    status = models.CharField(
+        max_length=12,
+        choices=Status.choices,
+        default=Status.IN_PROGRESS
+    )
+    response_status = models.PositiveSmallIntegerField(null=True, blank=True)
+    response_body = models.JSONField(null=True, blank=True, encoder=OutboxJSONEncoder)
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
+    expires_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name = _("Idempotency Record")
+        verbose_name_plural = _("Idempotency Records")
+        constraints = [
+            models.UniqueConstraint(
+                fields=['scope', 'key'], name='uniq_idempotency_scope_key'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['expires_at'], name='idx_idempotency_expires'),
+        ]
+
+    def __str__(self):
+        return f"{self.scope}:{self.key} ({self.status})"
@@ -0,0 +1,296 @@
+# core/outbox.py
+"""
+Transactional outbox for account, user and catalog changes.
+
+Models that use ``OutboxMixin`` write an ``OutboxEvent`` in the same
+transaction as every save and delete, so an event exists if and only if the
+change committed. ``OutboxDispatcher`` (run by ``manage.py drain_outbox``)
+delivers pending events to registered handlers in batches, in order per
+aggregate, retrying failures with exponential backoff. Delivered and dead
+events are purged once they are older than ``RETENTION_DAYS``.
+
+Set-based writes (``QuerySet.update``/``bulk_create``) do not go through
+``save()``; code that uses them records events with ``record_events``.
+"""
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.db.models import Exists, Min, OuterRef
+from django.utils import timezone
+from .models import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'BATCH_SIZE': 100,
+    'MAX_ATTEMPTS': 10,
+    'RETRY_BACKOFF': 5,
+    'MAX_BACKOFF': 3600,
+    'POLL_INTERVAL': 1,
+    'LEASE_SECONDS': 300,
+    'RETENTION_DAYS': 7,
+}
+
+_handlers = defaultdict(list)
+
+
+def get_outbox_settings():
+    options = DEFAULTS.copy()
+    options.update(getattr(settings, 'OUTBOX', {}))
+    return options
+
+
+def outbox_handler(aggregate_type, event_type='*'):
+    """
+    Register a handler for events of an aggregate type.
+
+    Handlers receive the ``OutboxEvent``; raising marks it for retry, so they
+    must be idempotent.
+    """
+    def register(func):
+        _handlers[(aggregate_type, event_type)].append(func)
+        return func
+    return register
+
+
+def handlers_for(event):
+    return (
+        _handlers[(event.aggregate_type, event.event_type)]
+        + _handlers[(event.aggregate_type, '*')]
+    )
+
+
+def build_event(aggregate_type, aggregate_id, event_type, payload=None):
+    return OutboxEvent(
+        aggregate_type=aggregate_type,
+        aggregate_id=str(aggregate_id),
+        event_type=event_type,
+        payload=payload or {},
+    )
+
+
+def record_events(events, using='default'):
+    """Write unsaved ``OutboxEvent`` objects in one statement."""
+    if events:
+        OutboxEvent.objects.using(using).bulk_create(events)
+
+
+class OutboxMixin:
+    """
+    Records a ``created``/``updated``/``deleted`` event with every save.
+
+    Set ``outbox_aggregate`` to the aggregate name and list fields that must
+    not leave the database (password hashes and the like) in
+    ``outbox_exclude``.
+    """
+    outbox_aggregate = None
+    outbox_exclude = ()
+
+    def outbox_payload(self):
+        return {
+            field.attname: field.value_from_object(self)
+            for field in self._meta.concrete_fields
+            if field.name not in self.outbox_exclude
+        }
+
+    def save(self, *args, **kwargs):
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using, savepoint=False):
+            event_type = 'created' if self._state.adding else 'updated'
+            super().save(*args, **kwargs)
+            record_events(
+                [
+                    build_event(
+                        self.outbox_aggregate,
+                        self.pk,
+                        event_type,
+                        self.outbox_payload(),
+                    )
+                ],
+                using=using,
+            )
+
+    def delete(self, *args, **kwargs):
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        pk = self.pk
+        with transaction.atomic(using=using, savepoint=False):
+            result = super().delete(*args, **kwargs)
+            record_events(
+                [build_event(self.outbox_aggregate, pk, 'deleted', {'id': pk})],
+                using=using,
+            )
+        return result
+
+
+class OutboxDispatcher:
+    """
+    Delivers pending outbox events in batches.
+
+    Several dispatchers can run at once: on PostgreSQL rows are claimed with
+    ``SKIP LOCKED``. An event is only delivered once every earlier pending
+    event for the same aggregate has been delivered.
+
+    A claimed batch is leased (its ``available_at`` pushed ``lease_seconds``
+    ahead) and the row locks are released before any handler runs, so slow
+    handlers do not hold locks. Each event's handlers run in their own
+    transaction; events of a dispatcher that dies are picked up again when
+    the lease runs out.
+    """
+
+    def __init__(self, batch_size=100, max_attempts=10, retry_backoff=5,
+                 max_backoff=3600, lease_seconds=300, using='default'):
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.max_backoff = max_backoff
+        self.lease_seconds = lease_seconds
+        self.using = using
+
+    def _claim(self, now):
+        events = OutboxEvent.objects.using(self.using)
+        # Leave out aggregates held back by an earlier event waiting to be
+        # retried; otherwise a busy one can fill every batch with events that
+        # are only skipped.
+        waiting = events.filter(
+            status=OutboxEvent.Status.PENDING,
+            available_at__gt=now,
+            aggregate_type=OuterRef('aggregate_type'),
+            aggregate_id=OuterRef('aggregate_id'),
+            id__lt=OuterRef('id'),
+        )
+        queryset = (
+            events.filter(status=OutboxEvent.Status.PENDING, available_at__lte=now)
+            .exclude(Exists(waiting))
+            .order_by('id')
+        )
+        if connections[self.using].features.has_select_for_update_skip_locked:
+            queryset = queryset.select_for_update(skip_locked=True)
+        return list(queryset[:self.batch_size])
+
+    def _blockers(self, events):
+        """
+        Return the lowest id of any pending event, outside this batch, that
+        precedes events of the same aggregate in it: held back for retry, or
+        claimed by another dispatcher.
+        """
+        claimed = {event.pk for event in events}
+        keys = {(event.aggregate_type, event.aggregate_id) for event in events}
+        earlier = (
+            OutboxEvent.objects.using(self.using)
+            .filter(
+                status=OutboxEvent.Status.PENDING,
+                id__lt=max(claimed),
+                aggregate_type__in={key[0] for key in keys},
+                aggregate_id__in={key[1] for key in keys},
+            )
+            .exclude(pk__in=claimed)
+            .values_list('aggregate_type', 'aggregate_id', 'id')
+        )
+        blockers = {}
+        for aggregate_type, aggregate_id, pk in earlier:
+            key = (aggregate_type, aggregate_id)
+            if key in keys:
+                blockers[key] = min(pk, blockers.get(key, pk))
+        return blockers
+
+    def drain_once(self):
+        """Deliver one batch. Returns ``(delivered, failed)``."""
+        now = timezone.now()
+        events = OutboxEvent.objects.using(self.using)
+        with transaction.atomic(using=self.using):
+            batch = self._claim(now)
+            if not batch:
+                return 0, 0
+            blockers = self._blockers(batch)
+            events.filter(pk__in=[event.pk for event in batch]).update(
+                available_at=now + timedelta(seconds=self.lease_seconds)
+            )
+
+        delivered = []
+        skipped = []
+        failed = 0
+        blocked = set()
+        for event in batch:
+            key = (event.aggregate_type, event.aggregate_id)
+            if key in blocked or blockers.get(key, event.pk) < event.pk:
+                # Keep per-aggregate order: an earlier event is not done.
+                skipped.append(event.pk)
+                continue
+            try:
+                # A handler's database error only rolls back its own event.
+                with transaction.atomic(using=self.using):
+                    for handler in handlers_for(event):
+                        handler(event)
+            except Exception as e:
+                blocked.add(key)
+                failed += 1
+                self._mark_failed(event, e, now)
+            else:
+                delivered.append(event.pk)
+
+        if delivered:
+            events.filter(pk__in=delivered).update(
+                status=OutboxEvent.Status.DONE,
+                processed_at=now,
+            )
+        if skipped:
+            events.filter(pk__in=skipped).update(available_at=now)
+        return len(delivered), failed
+
+    def _mark_failed(self, event, error, now):
+        event.attempts += 1
+        event.last_error = f"{type(error).__name__}: {error}"
+        if event.attempts >= self.max_attempts:
+            event.status = OutboxEvent.Status.DEAD
+            event.processed_at = now
+            logger.error(
+                f"Outbox event {event.pk} gave up after {event.attempts} "
+                f"attempts: {error}"
+            )
+        else:
+            delay = min(
+                self.retry_backoff * 2 ** (event.attempts - 1), self.max_backoff
+            )
+            event.available_at = now + timedelta(seconds=delay)
+            logger.warning(
+                f"Outbox event {event.pk} failed, retrying in {delay}s: {error}"
+            )
+        event.save(
+            using=self.using,
+            update_fields=[
+                'attempts',
+                'last_error',
+                'status',
+                'processed_at',
+                'available_at',
+            ],
+        )
+
+
+def purge_outbox(retention_days, using='default'):
+    """Delete delivered and dead events processed more than ``retention_days`` ago."""
+    cutoff = timezone.now() - timedelta(days=retention_days)
+    deleted, _ = (
+        OutboxEvent.objects.using(using)
+        .filter(
+            status__in=[OutboxEvent.Status.DONE, OutboxEvent.Status.DEAD],
+            processed_at__lt=cutoff,
+        )
+        .delete()
+    )
+    return deleted
+
+
+def outbox_stats(using='default'):
+    """Pending/dead counts and the age of the oldest pending event."""
+    events = OutboxEvent.objects.using(using)
+    pending = events.filter(status=OutboxEvent.Status.PENDING)
+    oldest = pending.aggregate(oldest=Min('created_at'))['oldest']
+    return {
+        'pending': pending.count(),
+        'dead': events.filter(status=OutboxEvent.Status.DEAD).count(),
+        'lag_seconds': (timezone.now() - oldest).total_seconds() if oldest else 0.0,
+    }
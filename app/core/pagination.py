@@ -0,0 +1,134 @@
+# core/pagination.py
+
+from collections import OrderedDict
+from django.core.paginator import (
+    EmptyPage,
+    InvalidPage,
+    Page,
+    PageNotAnInteger,
+    Paginator,
+)
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from .counts import acount_queryset, count_queryset
+
+
+class EstimatedPage(Page):
+    def has_next(self):
+        if self.paginator.count_is_exact:
+            return super().has_next()
+        # The estimate may undercount; a full page means there may be more.
+        return len(self.object_list) >= self.paginator.per_page
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that uses planner estimates for large, unfiltered querysets.
+
+    ``count_is_exact`` says which kind of count was used. With an estimate,
+    only the lower page bound is enforced and the last page is not clamped.
+    """
+    count_is_exact = True
+
+    @cached_property
+    def count(self):
+        if not hasattr(self.object_list, 'query'):
+            return len(self.object_list)
+        count, self.count_is_exact = count_queryset(self.object_list)
+        return count
+
+    def validate_number(self, number):
+        self.count  # evaluating the count sets count_is_exact
+        if self.count_is_exact:
+            return super().validate_number(number)
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(_("That page number is not an integer"))
+        if number < 1:
+            raise EmptyPage(_("That page number is less than 1"))
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if self.count_is_exact:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        return self._get_page(self.object_list[bottom:top], number, self)
+
+    async def acount(self):
+        """Fill in ``count`` with the async ORM."""
+        if 'count' not in self.__dict__:
+            if hasattr(self.object_list, 'query'):
+                self.count, self.count_is_exact = await acount_queryset(
+                    self.object_list
+                )
+            else:
+                self.count = len(self.object_list)
+        return self.count
+
+    async def apage(self, number):
+        """Async version of ``page``; the rows are fetched with ``async for``."""
+        await self.acount()
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if self.count_is_exact and top + self.orphans >= self.count:
+            top = self.count
+        object_list = self.object_list[bottom:top]
+        if hasattr(object_list, 'query'):
+            object_list = [obj async for obj in object_list]
+        return self._get_page(object_list, number, self)
+
+    def _get_page(self, *args, **kwargs):
+        return EstimatedPage(*args, **kwargs)
+
+
+class EstimatedCountPagination(PageNumberPagination):
+    """
+    Page-number pagination that reports whether ``count`` is exact.
+    """
+    django_paginator_class = EstimatedCountPaginator
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """Async version of ``paginate_queryset`` for ``core.async_views``."""
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        await paginator.acount()
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = await paginator.apage(page_number)
+        except InvalidPage as exc:
+            msg = self.invalid_page_message.format(
+                page_number=page_number, message=str(exc)
+            )
+            raise NotFound(msg)
+
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+
+        self.request = request
+        return list(self.page)
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('count', self.page.paginator.count),
+            ('count_is_exact', self.page.paginator.count_is_exact),
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        schema = super().get_paginated_response_schema(schema)
+        schema['properties']['count_is_exact'] = {'type': 'boolean', 'example': True}
+        return schema
@@ -0,0 +1,73 @@
+# core/querylog.py
+"""
+Sampled SQL logging for ``manage.py index_advisor``.
+
+Django's ``django.db.backends`` logger only sees queries when ``DEBUG`` is
+on. With ``QUERY_LOG['ENABLED']`` every database connection gets an execute
+wrapper that logs a ``SAMPLE_RATE`` share of its statements to the
+``core.querylog`` logger, in the same ``(seconds) sql; args=...; alias=...``
+format, so production traffic can be captured without debug cursors.
+
+Bound parameters hold password hashes, emails and phone numbers, so by
+default only the statement's fingerprint is logged, with
+``args=<redacted>``. Set ``QUERY_LOG['LOG_PARAMS']`` to log them too; the
+index advisor then also EXPLAINs the logged statements and can spot
+constant values for partial indexes.
+"""
+import logging
+import random
+import time
+
+from django.conf import settings
+from .index_advisor import fingerprint
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'ENABLED': False,
+    'SAMPLE_RATE': 0.01,
+    'LOG_PARAMS': False,
+}
+
+REDACTED = '<redacted>'
+
+
+def get_query_log_settings():
+    options = DEFAULTS.copy()
+    options.update(getattr(settings, 'QUERY_LOG', {}))
+    return options
+
+
+class QueryLogger:
+    """Execute wrapper that logs a sample of single statements."""
+
+    def __init__(self, alias, sample_rate, log_params=False):
+        self.alias = alias
+        self.sample_rate = sample_rate
+        self.log_params = log_params
+
+    def __call__(self, execute, sql, params, many, context):
+        if many or random.random() >= self.sample_rate:
+            return execute(sql, params, many, context)
+        started = time.monotonic()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.monotonic() - started
+            if self.log_params:
+                statement, args = sql, params
+            else:
+                statement, args = fingerprint(sql), REDACTED
+            logger.info(
+                f"({duration:.3f}) {statement}; args={args}; alias={self.alias}"
+            )
+
+
+def install_query_logger(sender, connection, **kwargs):
+    """``connection_created`` receiver; wraps each connection once."""
+    if any(isinstance(wrapper, QueryLogger) for wrapper in connection.execute_wrappers):
+        return
+    options = get_query_log_settings()
+    connection.execute_wrappers.append(
+        QueryLogger(connection.alias, options['SAMPLE_RATE'], options['LOG_PARAMS'])
+    )
@@ -0,0 +1,141 @@
+# core/server.py
+"""
+Gunicorn hooks that share the preloaded application between workers.
+
+``config/gunicorn.conf.py`` runs gunicorn with ``preload_app`` and calls in
+here: once the master has imported the application, ``when_ready`` warms it
+(see ``core.startup.warm_up``) and stops the collector; ``pre_fork`` freezes
+everything allocated so far with ``gc.freeze()`` so the collector never
+writes to those pages, and ``post_fork`` turns collection back on in the
+worker. Gunicorn recycles workers after ``max_requests``; ``post_request``
+also retires a worker whose RSS passes ``MAX_RSS_MB`` and logs its shared
+and private memory every ``STATS_INTERVAL`` seconds.
+"""
+import gc
+import logging
+import os
+import time
+
+from django.conf import settings
+from django.db import connections
+from .startup import warm_up
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'MAX_RSS_MB': 512,
+    'STATS_INTERVAL': 60,
+    'WARM_INDEXES': False,
+}
+
+_last_report = 0.0
+
+
+def get_server_settings():
+    options = DEFAULTS.copy()
+    options.update(getattr(settings, 'PREFORK_SERVER', {}))
+    return options
+
+
+def parse_smaps_rollup(text):
+    """Return ``{field: kB}`` from the contents of ``/proc/<pid>/smaps_rollup``."""
+    fields = {}
+    for line in text.splitlines():
+        name, _, rest = line.partition(':')
+        parts = rest.split()
+        if len(parts) == 2 and parts[1] == 'kB':
+            fields[name.strip()] = int(parts[0])
+    return fields
+
+
+def memory_usage(pid):
+    """
+    Return RSS, PSS and shared/private memory of ``pid`` in kB, or None where
+    ``/proc/<pid>/smaps_rollup`` is not available.
+    """
+    try:
+        with open(f'/proc/{pid}/smaps_rollup') as f:
+            fields = parse_smaps_rollup(f.read())
+    except OSError:
+        return None
+    return {
+        'rss_kb': fields.get('Rss', 0),
+        'pss_kb': fields.get('Pss', 0),
+        'shared_kb': (
+            fields.get('Shared_Clean', 0) + fields.get('Shared_Dirty', 0)
+        ),
+        'private_kb': (
+            fields.get('Private_Clean', 0) + fields.get('Private_Dirty', 0)
+        ),
+    }
+
+
+def current_rss_kb():
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+    except (OSError, ValueError):
+        return None
+    return pages * os.sysconf('SC_PAGE_SIZE') // 1024
+
+
+def report_memory(role, pid):
+    """Log shared vs private memory of one process."""
+    usage = memory_usage(pid)
+    if usage is None:
+        logger.info(f"{role} {pid}: memory breakdown unavailable")
+        return
+    logger.info(
+        f"{role} {pid}: rss={usage['rss_kb'] / 1024:.1f} MiB "
+        f"shared={usage['shared_kb'] / 1024:.1f} MiB "
+        f"private={usage['private_kb'] / 1024:.1f} MiB "
+        f"pss={usage['pss_kb'] / 1024:.1f} MiB"
+    )
+
+
+def when_ready(server):
+    """Warm the preloaded application in the master, before the first fork."""
+    started = time.perf_counter()
+    warmed = warm_up(indexes=get_server_settings()['WARM_INDEXES'])
+    # Workers must open their own database connections.
+    connections.close_all()
+    gc.collect()
+    # Objects the master allocates from here on are frozen at the next
+    # fork instead of being collected; workers re-enable collection.
+    gc.disable()
+    logger.info(
+        f"Warmed application in "
+        f"{(time.perf_counter() - started) * 1000:.0f} ms ({warmed})"
+    )
+    report_memory('master', os.getpid())
+
+
+def pre_fork(server, worker):
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    global _last_report
+    gc.enable()
+    _last_report = time.monotonic()
+    logger.info(
+        f"Worker {worker.pid} started with "
+        f"{gc.get_freeze_count()} frozen objects"
+    )
+
+
+def post_request(worker, req, environ, resp):
+    """Retire a worker over the RSS ceiling; report memory periodically."""
+    global _last_report
+    options = get_server_settings()
+    rss = current_rss_kb() if options['MAX_RSS_MB'] else None
+    if rss is not None and rss > options['MAX_RSS_MB'] * 1024:
+        logger.warning(
+            f"Worker {worker.pid} recycling at {rss / 1024:.0f} MiB RSS"
+        )
+        # Gunicorn finishes the current request and starts a replacement.
+        worker.alive = False
+    interval = options['STATS_INTERVAL']
+    if interval and time.monotonic() - _last_report > interval:
+        _last_report = time.monotonic()
+        report_memory('worker', worker.pid)
@@ -0,0 +1,199 @@
+# core/startup.py
+"""
+Cold-start profiling for the WSGI/ASGI entry points.
+
+Each measurement runs in a fresh interpreter, since imports are only slow
+the first time. A boot is the entry point's module import plus loading the
+URL resolver, which is what a worker does before serving its first request.
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+
+DEFAULTS = {
+    'TARGET_MS': 500,
+    'RUNS': 3,
+    'TOP': 20,
+}
+
+ENTRY_POINTS = {
+    'wsgi': 'config.wsgi',
+    'asgi': 'config.asgi',
+}
+
+BOOT = '''
+import importlib, json, os, sys, time
+started = time.perf_counter()
+importlib.import_module({module!r})
+from django.urls import get_resolver
+get_resolver().url_patterns
+result = {{'boot_ms': (time.perf_counter() - started) * 1000}}
+try:
+    import resource
+    result['rss_kb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+except ImportError:
+    pass
+'''
+
+MEMORY = '''
+snapshot = tracemalloc.take_snapshot()
+files = {}
+for module in list(sys.modules.values()):
+    path = getattr(module, '__file__', None)
+    if path:
+        files[os.path.abspath(path)] = module.__name__
+result['memory'] = {}
+for stat in snapshot.statistics('filename'):
+    name = files.get(os.path.abspath(stat.traceback[0].filename))
+    if name:
+        result['memory'][name] = result['memory'].get(name, 0) + stat.size
+'''
+
+
+def get_startup_settings():
+    options = DEFAULTS.copy()
+    options.update(getattr(settings, 'STARTUP_PROFILE', {}))
+    return options
+
+
+def parse_importtime(output):
+    """
+    Parse ``-X importtime`` output into ``{module: (self_us, cumulative_us)}``.
+    """
+    modules = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+            modules[name.strip()] = (int(self_us), int(cumulative_us))
+        except ValueError:
+            continue
+    return modules
+
+
+def _run(module, flags=(), prelude='', epilogue=''):
+    boot = BOOT.format(module=module)
+    code = prelude + boot + epilogue + '\nprint(json.dumps(result))\n'
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    completed = subprocess.run(
+        [sys.executable, *flags, '-c', code],
+        capture_output=True, text=True, env=env,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Booting {module} failed:\n{completed.stderr.strip()}")
+    return json.loads(completed.stdout.strip().splitlines()[-1]), completed.stderr
+
+
+def profile_boot(entry, runs=3):
+    """
+    Boot ``entry`` in fresh interpreters and return timings, peak RSS and
+    per-module import time and retained memory.
+    """
+    module = ENTRY_POINTS.get(entry, entry)
+    boots = [_run(module)[0] for _ in range(max(runs, 1))]
+
+    _, stderr = _run(module, flags=('-X', 'importtime'))
+    memory, _ = _run(
+        module,
+        prelude='import tracemalloc\ntracemalloc.start()\n',
+        epilogue=MEMORY,
+    )
+
+    imports = parse_importtime(stderr)
+    retained = memory['memory']
+    return {
+        'entry': entry,
+        'module': module,
+        'boot_ms': statistics.median(b['boot_ms'] for b in boots),
+        'rss_kb': max((b.get('rss_kb', 0) for b in boots), default=0),
+        'modules': {
+            name: {
+                'self_ms': self_us / 1000,
+                'cumulative_ms': cumulative_us / 1000,
+                'memory_kb': retained.get(name, 0) / 1024,
+            }
+            for name, (self_us, cumulative_us) in imports.items()
+        },
+    }
+
+
+def by_package(modules):
+    """Sum self import time and memory per top-level package."""
+    packages = {}
+    for name, stats in modules.items():
+        package = packages.setdefault(
+            name.split('.')[0], {'self_ms': 0.0, 'memory_kb': 0.0, 'modules': 0}
+        )
+        package['self_ms'] += stats['self_ms']
+        package['memory_kb'] += stats['memory_kb']
+        package['modules'] += 1
+    return packages
+
+
+def _view_serializers(callback):
+    """Serializer classes a resolved view callback can use."""
+    view_class = getattr(callback, 'cls', None)
+    if view_class is None:
+        return set()
+    actions = getattr(callback, 'actions', None) or {}
+    found = set()
+    for action in set(actions.values()) or {None}:
+        view = view_class(**getattr(callback, 'initkwargs', {}))
+        view.action = action
+        view.request = None
+        view.format_kwarg = None
+        try:
+            found.add(view.get_serializer_class())
+        except Exception:
+            continue
+    return found
+
+
+def warm_up(indexes=False):
+    """
+    Do the per-process work a first request would otherwise pay for: model
+    metadata, the URL resolver and serializer field maps. With ``indexes``,
+    also build the in-memory account indexes.
+
+    Meant to run in a master process before it forks, so workers share the
+    result copy-on-write.
+    """
+    from django.apps import apps
+    from django.urls import URLPattern, URLResolver, get_resolver
+
+    for model in apps.get_models():
+        model._meta.get_fields()
+
+    resolver = get_resolver()
+    resolver.reverse_dict  # populates the resolver
+
+    serializers = set()
+    stack = list(resolver.url_patterns)
+    while stack:
+        pattern = stack.pop()
+        if isinstance(pattern, URLResolver):
+            stack.extend(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern):
+            serializers |= _view_serializers(pattern.callback)
+
+    warmed = 0
+    for serializer_class in serializers:
+        try:
+            serializer_class().fields
+            warmed += 1
+        except Exception:
+            continue
+
+    if indexes:
+        from accounts.autocomplete import get_account_autocomplete
+        from accounts.availability import get_availability_index
+
+        get_availability_index().build()
+        get_account_autocomplete().load()
+
+    return f"{len(apps.get_models())} models, {warmed} serializers"
@@ -0,0 +1,23 @@
+# core/tests/__init__.py
+
+from .test_counts import EstimatedCountTest  # noqa: F401
+from .test_db_router import (  # noqa: F401
+    ReplicaRouterTest,
+    ReplicaHealthTest,
+    ReplicaHealthDatabaseTest,
+    ReplicaPinningMiddlewareTest,
+    ReplicaReadMixinTest,
+)
+from .test_pool import ConnectionPoolTest  # noqa: F401
+from .test_outbox import OutboxTest, OutboxDispatcherTest  # noqa: F401
+from .test_projection import FieldProjectionTest  # noqa: F401
+from .test_startup import StartupProfileTest  # noqa: F401
+from .test_server import ServerHooksTest  # noqa: F401
+from .test_batch import BatchViewTest  # noqa: F401
+from .test_idempotency import (  # noqa: F401
+    IdempotencyKeyTest,
+    ConcurrentIdempotencyTest,
+)
+from .test_async_views import AsyncViewsTest, AsyncReplicaReadsTest  # noqa: F401
+from .test_archive import ArchiveTest  # noqa: F401
+from .test_index_advisor import IndexAdvisorTest  # noqa: F401
@@ -0,0 +1,130 @@
+# core/tests/test_archive.py
+
+from datetime import timedelta
+from io import StringIO
+from types import SimpleNamespace
+from unittest import mock
+from django.core.management import call_command
+from django.db import transaction
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.test import APITestCase
+from accounts.archive import account_archive
+from accounts.models import Account, ArchivedAccount
+from accounts.views import AccountViewSet
+from myapp.archive import user_archive
+from myapp.models import ArchivedUser, User
+from myapp.rollups import rebuild_rollups
+from ..archive import ArchiveConflict
+from ..models import OutboxEvent
+
+
+def make_account(username, days_idle=0):
+    account = Account(
+        username=username,
+        email=f'{username}@example.com',
+        first_name='Test',
+        last_name='User',
+    )
+    account.set_password('secure-password')
+    account.save()
+    Account.objects.filter(pk=account.pk).update(
+        updated_at=timezone.now() - timedelta(days=days_idle)
+    )
+    return account
+
+
+# Data written inside a TestCase is not visible on a replica's connection.
+@override_settings(DATABASE_REPLICAS=[])
+class ArchiveTest(APITestCase):
+    def setUp(self):
+        self.dormant = make_account('sleeper', days_idle=1000)
+        self.active = make_account('regular')
+
+    def test_dormant_accounts_move_to_archive(self):
+        out = StringIO()
+        call_command(
+            'archive_cold_rows', '--only', 'accounts', '--pause', '0', stdout=out
+        )
+        self.assertIn('accounts: archived 1 rows', out.getvalue())
+        self.assertFalse(Account.objects.filter(pk=self.dormant.pk).exists())
+        archived = ArchivedAccount.objects.get(pk=self.dormant.pk)
+        self.assertEqual(archived.username, 'sleeper')
+        self.assertTrue(Account.objects.filter(pk=self.active.pk).exists())
+        self.assertTrue(
+            OutboxEvent.objects.filter(
+                aggregate_id=str(self.dormant.pk), event_type='archived'
+            ).exists()
+        )
+
+    def test_archived_values_stay_unique(self):
+        account_archive.archive(pause=0)
+        with self.assertRaises(ArchiveConflict), transaction.atomic():
+            make_account('sleeper')
+        self.assertFalse(Account.objects.filter(username='sleeper').exists())
+
+        response = self.client.post('/accounts/accounts/', {
+            'username': 'sleeper',
+            'email': 'sleeper@example.com',
+            'password': 'secure-password',
+            'confirm_password': 'secure-password',
+            'first_name': 'New',
+            'last_name': 'Comer',
+        }, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('username', response.data)
+        self.assertIn('email', response.data)
+
+    def test_lookup_reads_archived_account_and_write_restores_it(self):
+        account_archive.archive(pause=0)
+        self.client.force_authenticate(
+            user=SimpleNamespace(pk=1, is_authenticated=True, is_staff=True)
+        )
+        url = reverse('account-detail', args=[self.dormant.pk])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['username'], 'sleeper')
+        # Reading does not move the row back.
+        self.assertTrue(ArchivedAccount.objects.filter(pk=self.dormant.pk).exists())
+
+        response = self.client.patch(url, {'first_name': 'Awake'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(ArchivedAccount.objects.exists())
+        # Restored accounts count as active again.
+        self.assertFalse(account_archive.cold().filter(pk=self.dormant.pk).exists())
+
+        missing = self.client.get(
+            reverse('account-detail', args=[self.dormant.pk + 100])
+        )
+        self.assertEqual(missing.status_code, 404)
+
+    def test_denied_request_does_not_restore(self):
+        account_archive.archive(pause=0)
+        self.client.force_authenticate(
+            user=SimpleNamespace(pk=1, is_authenticated=True)
+        )
+        with mock.patch.object(
+            AccountViewSet, 'check_object_permissions', side_effect=PermissionDenied
+        ):
+            response = self.client.delete(
+                reverse('account-detail', args=[self.dormant.pk])
+            )
+        self.assertEqual(response.status_code, 403)
+        self.assertTrue(ArchivedAccount.objects.filter(pk=self.dormant.pk).exists())
+
+    def test_archived_users_still_counted(self):
+        for name, status in (('ann', 'active'), ('ben', 'inactive')):
+            User.objects.create(
+                name=name, email=f'{name}@example.com', password='secret',
+                user_type='customer', account_status=status,
+            )
+        self.assertEqual(user_archive.archive(pause=0), 1)
+        self.assertEqual(
+            list(ArchivedUser.objects.values_list('name', flat=True)), ['ben']
+        )
+        self.assertEqual(rebuild_rollups(dry_run=True), {})
+        self.assertEqual(
+            user_archive.get_or_restore(email='ben@example.com').name, 'ben'
+        )
@@ -0,0 +1,136 @@
+# core/tests/test_async_views.py
+
+import json
+from contextlib import ExitStack
+from unittest import mock, skipUnless
+from asgiref.sync import async_to_sync, sync_to_async
+from django.contrib.auth.models import User
+from django.db import connections
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from accounts.archive import account_archive
+from accounts.models import Account
+from ..db_router import ReplicaHealth, get_replica_aliases
+
+
+# Data written inside a TestCase is not visible on a replica's connection.
+@override_settings(ALLOWED_HOSTS=['testserver'], DATABASE_REPLICAS=[])
+class AsyncViewsTest(TestCase):
+    def setUp(self):
+        for i in range(12):
+            Account.objects.create(
+                username=f'async{i}',
+                email=f'async{i}@example.com',
+                password='x',
+                first_name='Async',
+                last_name=str(i),
+            )
+        self.account = Account.objects.get(username='async3')
+        user = User.objects.create_user('reader', 'reader@example.com', 'pw')
+        self.async_client.force_login(user)
+
+    async def test_list_is_paginated(self):
+        response = await self.async_client.get('/accounts/accounts/', {'page': 2})
+        self.assertEqual(response.status_code, 200)
+        body = json.loads(response.content)
+        self.assertEqual((body['count'], len(body['results'])), (12, 2))
+        self.assertIsNone(body['next'])
+
+    async def test_retrieve_and_missing(self):
+        response = await self.async_client.get(f'/accounts/accounts/{self.account.pk}/')
+        self.assertEqual(json.loads(response.content)['username'], 'async3')
+        response = await self.async_client.get('/accounts/accounts/0/')
+        self.assertEqual(response.status_code, 404)
+
+    async def test_retrieve_reads_archived_account(self):
+        await Account.objects.filter(pk=self.account.pk).aupdate(
+            updated_at='2000-01-01T00:00Z'
+        )
+        self.assertEqual(await sync_to_async(account_archive.archive)(pause=0), 1)
+        response = await self.async_client.get(f'/accounts/accounts/{self.account.pk}/')
+        self.assertEqual(json.loads(response.content)['username'], 'async3')
+        self.assertFalse(await Account.objects.filter(pk=self.account.pk).aexists())
+
+    async def test_search_streams_ndjson(self):
+        response = await self.async_client.get(
+            '/accounts/accounts/search/', {'search': 'async1', 'stream': 'true'}
+        )
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        chunks = [chunk async for chunk in response.streaming_content]
+        lines = b''.join(chunks).splitlines()
+        usernames = sorted(json.loads(line)['username'] for line in lines)
+        self.assertEqual(usernames, ['async1', 'async10', 'async11'])
+
+    async def test_permissions_still_apply(self):
+        self.async_client.cookies.clear()
+        response = await self.async_client.get('/accounts/accounts/')
+        self.assertIn(response.status_code, (401, 403))
+
+    async def test_writes_fall_through_to_the_viewset(self):
+        response = await self.async_client.patch(
+            f'/accounts/accounts/{self.account.pk}/',
+            {'first_name': 'Changed'},
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)['first_name'], 'Changed')
+
+
+@skipUnless(get_replica_aliases(), "Set DB_REPLICA_HOSTS to test replicas")
+@override_settings(ALLOWED_HOSTS=['testserver'])
+class AsyncReplicaReadsTest(TransactionTestCase):
+    # Committed rows, so the replicas (test mirrors) can see them.
+    databases = '__all__'
+
+    def setUp(self):
+        for i in range(3):
+            Account.objects.create(
+                username=f'replica{i}',
+                email=f'replica{i}@example.com',
+                password='x',
+                first_name='Replica',
+                last_name=str(i),
+            )
+        user = User.objects.create_user('reader', 'reader@example.com', 'pw')
+        self.async_client.force_login(user)
+        # The real health checks, run against the configured replicas.
+        health = ReplicaHealth(get_replica_aliases(), check_interval=60)
+        health.start()
+        self.addCleanup(health.stop)
+        self.assertTrue(health.checked.wait(5))
+        patcher = mock.patch('core.db_router._health', health)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def replica_queries(self, request):
+        """Run ``request``; return its result and the replicas' account reads."""
+        with ExitStack() as stack:
+            captured = [
+                stack.enter_context(CaptureQueriesContext(connections[alias]))
+                for alias in get_replica_aliases()
+            ]
+            response = async_to_sync(request)()
+        return response, [
+            query['sql']
+            for queries in captured
+            for query in queries
+            if 'accounts_account' in query['sql']
+        ]
+
+    def test_list_and_stream_read_from_a_replica(self):
+        async def get_list():
+            return await self.async_client.get('/accounts/accounts/')
+
+        response, queries = self.replica_queries(get_list)
+        self.assertEqual(json.loads(response.content)['count'], 3)
+        self.assertTrue(queries)
+
+        async def stream_search():
+            response = await self.async_client.get(
+                '/accounts/accounts/search/', {'search': 'replica', 'stream': 'true'}
+            )
+            return b''.join([chunk async for chunk in response.streaming_content])
+
+        body, queries = self.replica_queries(stream_search)
+        self.assertEqual(len(body.splitlines()), 3)
+        self.assertTrue(queries)
@@ -0,0 +1,130 @@
+# core/tests/test_batch.py
+
+from types import SimpleNamespace
+from unittest import mock
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework.throttling import AnonRateThrottle
+from accounts.models import Account
+
+
+# Data written inside a TestCase is not visible on a replica's connection.
+@override_settings(DATABASE_REPLICAS=[])
+class BatchViewTest(APITestCase):
+    def setUp(self):
+        self.account = Account.objects.create(
+            username='batcher',
+            email='batcher@example.com',
+            password='x',
+            first_name='Batch',
+            last_name='User',
+        )
+        self.url = reverse('batch')
+        self.detail = f'/accounts/accounts/{self.account.pk}/'
+
+    def batch(self, *requests):
+        response = self.client.post(
+            self.url, {'requests': list(requests)}, format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.data['responses']
+
+    def test_runs_sub_requests_with_batch_identity(self):
+        self.client.force_authenticate(
+            user=SimpleNamespace(pk=0, is_authenticated=True)
+        )
+        detail, search, other = self.batch(
+            {'id': 'me', 'path': self.detail},
+            {'id': 'shop', 'path': '/catalog/search/?q=lamp'},
+            {'id': 'admin', 'path': '/internal/outbox/'},
+        )
+        self.assertEqual((detail['id'], detail['status']), ('me', 200))
+        self.assertEqual(detail['body']['username'], 'batcher')
+        self.assertEqual(search['status'], 200)
+        self.assertEqual(other['status'], 400)
+
+    def test_sub_requests_keep_their_permissions(self):
+        (detail,) = self.batch({'path': self.detail})
+        self.assertIn(detail['status'], (401, 403))
+
+    def test_repeated_lookups_hit_the_database_once(self):
+        self.client.force_authenticate(
+            user=SimpleNamespace(pk=0, is_authenticated=True)
+        )
+        with CaptureQueriesContext(connection) as queries:
+            responses = self.batch(
+                {'path': self.detail},
+                {'path': self.detail},
+                {'path': f'{self.detail}?format=json'},
+            )
+        self.assertEqual([r['status'] for r in responses], [200, 200, 200])
+        lookups = [
+            q for q in queries.captured_queries if 'FROM "accounts_account"' in q['sql']
+        ]
+        self.assertEqual(len(lookups), 1)
+
+    def test_write_is_visible_to_later_reads(self):
+        self.client.force_authenticate(
+            user=SimpleNamespace(pk=0, is_authenticated=True)
+        )
+        created, listing = self.batch(
+            {'method': 'POST', 'path': '/accounts/accounts/', 'body': {
+                'username': 'newbie',
+                'email': 'newbie@example.com',
+                'password': 'secure-password',
+                'confirm_password': 'secure-password',
+                'first_name': 'New',
+                'last_name': 'User',
+            }},
+            {'path': '/accounts/accounts/?username=newbie'},
+        )
+        self.assertEqual(created['status'], 201)
+        self.assertEqual(listing['body']['results'][0]['username'], 'newbie')
+
+    def new_account(self, username):
+        return {'method': 'POST', 'path': '/accounts/accounts/', 'body': {
+            'username': username,
+            'email': f'{username}@example.com',
+            'password': 'secure-password',
+            'confirm_password': 'secure-password',
+            'first_name': 'New',
+            'last_name': 'User',
+        }}
+
+    def test_batch_idempotency_key_is_not_shared_by_sub_requests(self):
+        response = self.client.post(
+            self.url,
+            {'requests': [self.new_account('first'), self.new_account('second')]},
+            format='json',
+            HTTP_IDEMPOTENCY_KEY='batch-key',
+        )
+        self.assertEqual([r['status'] for r in response.data['responses']], [201, 201])
+
+    def test_sub_request_headers(self):
+        create = dict(
+            self.new_account('once'), headers={'Idempotency-Key': 'create-once'}
+        )
+        first, retry, bad = self.batch(
+            create, create, dict(self.new_account('other'), headers=['nope']),
+        )
+        self.assertEqual((first['status'], retry['status']), (201, 201))
+        self.assertEqual(first['body'], retry['body'])
+        self.assertEqual(Account.objects.filter(username='once').count(), 1)
+        self.assertEqual(bad['status'], 400)
+
+    def test_each_sub_request_is_throttled(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        searches = [{'path': f'/catalog/search/?q=lamp{i}'} for i in range(4)]
+        with mock.patch.object(AnonRateThrottle, 'get_rate', return_value='3/min'):
+            responses = self.batch(*searches)
+        # The batch itself takes one of the three requests.
+        self.assertEqual([r['status'] for r in responses], [200, 200, 429, 429])
+
+    def test_rejects_malformed_batches(self):
+        response = self.client.post(self.url, {'requests': 'nope'}, format='json')
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,42 @@
+# core/tests/test_counts.py
+
+from unittest import skipUnless
+from django.db import connection
+from django.test import TestCase
+from accounts.models import Account
+from ..counts import count_queryset, estimated_count
+from ..pagination import EstimatedCountPaginator
+
+
+@skipUnless(connection.vendor in ('postgresql', 'sqlite'), "Needs planner statistics")
+class EstimatedCountTest(TestCase):
+    def setUp(self):
+        for i in range(5):
+            Account.objects.create(
+                username=f'user{i}',
+                email=f'user{i}@example.com',
+                password='securepassword123',
+                first_name='Test',
+                last_name='User',
+            )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def test_estimate_reads_planner_statistics(self):
+        self.assertEqual(estimated_count(Account), 5)
+
+    def test_estimate_used_above_threshold(self):
+        count, exact = count_queryset(Account.objects.all(), threshold=1)
+        self.assertEqual((count, exact), (5, False))
+
+    def test_exact_below_threshold_or_filtered(self):
+        self.assertEqual(count_queryset(Account.objects.all(), threshold=10), (5, True))
+        filtered = Account.objects.filter(username='user1')
+        self.assertEqual(count_queryset(filtered, threshold=1), (1, True))
+
+    def test_paginator_reports_exactness(self):
+        paginator = EstimatedCountPaginator(Account.objects.order_by('pk'), 2)
+        page = paginator.page(1)
+        self.assertEqual(paginator.count, 5)
+        self.assertTrue(paginator.count_is_exact)
+        self.assertTrue(page.has_next())
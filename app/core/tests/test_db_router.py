@@ -0,0 +1,151 @@
+# core/tests/test_db_router.py
+
+import contextvars
+from types import SimpleNamespace
+from unittest import mock, skipUnless
+from django.http import HttpResponse
+from django.test import SimpleTestCase, RequestFactory
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from accounts.views import AccountViewSet
+from ..db_router import (
+    ReplicaHealth,
+    ReplicaRouter,
+    get_replica_aliases,
+    pinned_to_primary,
+    replica_reads,
+    request_routing,
+    wrote_to_primary,
+)
+from ..middleware import ReplicaPinningMiddleware
+
+
+class FakeHealth:
+    def healthy(self):
+        return ['replica_0']
+
+
+@mock.patch('core.db_router.get_replica_health', return_value=FakeHealth())
+class ReplicaRouterTest(SimpleTestCase):
+    def setUp(self):
+        self.router = ReplicaRouter()
+        routing = request_routing()
+        routing.__enter__()
+        self.addCleanup(routing.__exit__, None, None, None)
+
+    def test_reads_use_primary_unless_opted_in(self, _):
+        self.assertEqual(self.router.db_for_read(None), 'default')
+        with replica_reads():
+            self.assertEqual(self.router.db_for_read(None), 'replica_0')
+
+    def test_pinned_reads_use_primary(self, _):
+        with replica_reads(), pinned_to_primary():
+            self.assertEqual(self.router.db_for_read(None), 'default')
+
+    def test_write_pins_rest_of_request(self, _):
+        with request_routing(), replica_reads():
+            self.assertEqual(self.router.db_for_write(None), 'default')
+            self.assertEqual(self.router.db_for_read(None), 'default')
+        with request_routing(), replica_reads():
+            self.assertEqual(self.router.db_for_read(None), 'replica_0')
+
+    def test_write_outside_a_request_does_not_pin(self, _):
+        def outside_request():
+            self.router.db_for_write(None)
+            with replica_reads():
+                return wrote_to_primary(), self.router.db_for_read(None)
+
+        self.assertEqual(
+            contextvars.Context().run(outside_request), (False, 'replica_0')
+        )
+
+
+class ReplicaHealthTest(SimpleTestCase):
+    def test_lagging_and_failing_replicas_are_ejected(self):
+        health = ReplicaHealth(['fast', 'slow', 'down'], max_lag=10, check_interval=60)
+        lags = {'fast': 0.5, 'slow': 30.0}
+
+        def replication_lag(alias):
+            if alias not in lags:
+                raise ConnectionError("unreachable")
+            return lags[alias]
+
+        with mock.patch.object(health, 'replication_lag', side_effect=replication_lag):
+            self.assertEqual(health.healthy(), ['fast', 'slow', 'down'])
+            self.assertEqual(health.check(), {'slow', 'down'})
+        self.assertEqual(health.healthy(), ['fast'])
+
+
+@skipUnless(get_replica_aliases(), "Set DB_REPLICA_HOSTS to test replicas")
+class ReplicaHealthDatabaseTest(SimpleTestCase):
+    databases = '__all__'
+
+    def test_background_checks_query_the_replicas(self):
+        health = ReplicaHealth(get_replica_aliases(), max_lag=10, check_interval=0.05)
+        health.start()
+        self.addCleanup(health.stop)
+        self.assertTrue(health.checked.wait(5))
+        self.assertEqual(health.lag(), {alias: 0.0 for alias in get_replica_aliases()})
+
+        with mock.patch('core.db_router._health', health), request_routing():
+            with replica_reads():
+                self.assertIn(ReplicaRouter().db_for_read(None), get_replica_aliases())
+
+
+class ReplicaPinningMiddlewareTest(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def test_write_sets_pin_cookie(self):
+        def view(request):
+            ReplicaRouter().db_for_write(None)
+            return HttpResponse()
+
+        response = ReplicaPinningMiddleware(view)(self.factory.post('/'))
+        self.assertIn('db_pin', response.cookies)
+        self.assertIn('X-DB-Pin', response)
+
+    def test_pin_cookie_pins_reads(self):
+        seen = {}
+
+        def view(request):
+            with replica_reads(), mock.patch(
+                'core.db_router.get_replica_health', return_value=FakeHealth()
+            ):
+                seen['db'] = ReplicaRouter().db_for_read(None)
+            return HttpResponse()
+
+        request = self.factory.get('/')
+        request.COOKIES['db_pin'] = '9999999999'
+        response = ReplicaPinningMiddleware(view)(request)
+        self.assertEqual(seen['db'], 'default')
+        self.assertNotIn('db_pin', response.cookies)
+
+
+class ReplicaReadMixinTest(APITestCase):
+    def setUp(self):
+        self.client.force_authenticate(
+            user=SimpleNamespace(pk=1, is_authenticated=True)
+        )
+        # Stands in for a healthy replica; it is only asked for replicas when
+        # the request is allowed to read from one.
+        self.health = mock.Mock()
+        self.health.healthy.return_value = ['default']
+        patcher = mock.patch(
+            'core.db_router.get_replica_health', return_value=self.health
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_list_reads_from_replica(self):
+        response = self.client.get(reverse('account-list'))
+        self.assertEqual(response.status_code, 200)
+        self.health.healthy.assert_called()
+
+    def test_only_listed_safe_actions_read_from_replica(self):
+        factory = RequestFactory()
+        view = AccountViewSet(action_map={'get': 'list', 'post': 'create'})
+        self.assertTrue(view._reads_from_replica(factory.get('/')))
+        self.assertFalse(view._reads_from_replica(factory.post('/')))
+        # OPTIONS is not routed to an action.
+        self.assertFalse(view._reads_from_replica(factory.options('/')))
@@ -0,0 +1,134 @@
+# core/tests/test_idempotency.py
+
+import threading
+import time
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest import mock
+from django.db import connection
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.response import Response
+from rest_framework.test import APITestCase
+from accounts.models import Account
+from catalog.models import Catalog
+from ..idempotency import IdempotencyGuard, REPLAY_HEADER
+from ..models import IdempotencyRecord
+
+
+class IdempotencyKeyTest(APITestCase):
+    def setUp(self):
+        self.payload = {
+            'username': 'retrier',
+            'email': 'retrier@example.com',
+            'password': 'secure-password',
+            'confirm_password': 'secure-password',
+            'first_name': 'Re',
+            'last_name': 'Trier',
+        }
+        self.url = '/accounts/accounts/'
+
+    def test_retried_create_is_replayed(self):
+        first = self.client.post(
+            self.url, self.payload, format='json', HTTP_IDEMPOTENCY_KEY='k1'
+        )
+        second = self.client.post(
+            self.url, self.payload, format='json', HTTP_IDEMPOTENCY_KEY='k1'
+        )
+        self.assertEqual((first.status_code, second.status_code), (201, 201))
+        self.assertEqual(first.data['id'], second.data['id'])
+        self.assertEqual(second[REPLAY_HEADER], 'true')
+        self.assertEqual(Account.objects.count(), 1)
+
+    def test_key_reused_for_different_request(self):
+        self.client.post(
+            self.url, self.payload, format='json', HTTP_IDEMPOTENCY_KEY='k2'
+        )
+        other = dict(self.payload, username='someone')
+        response = self.client.post(
+            self.url, other, format='json', HTTP_IDEMPOTENCY_KEY='k2'
+        )
+        self.assertEqual(response.status_code, 422)
+
+    @override_settings(IDEMPOTENCY={'WAIT_TIMEOUT': 0.1})
+    def test_duplicate_of_in_flight_request_conflicts(self):
+        first = self.client.post(
+            self.url, self.payload, format='json', HTTP_IDEMPOTENCY_KEY='k3'
+        )
+        IdempotencyRecord.objects.filter(key='k3').update(
+            status=IdempotencyRecord.Status.IN_PROGRESS, created_at=timezone.now()
+        )
+        response = self.client.post(
+            self.url, self.payload, format='json', HTTP_IDEMPOTENCY_KEY='k3'
+        )
+        self.assertEqual((first.status_code, response.status_code), (201, 409))
+
+    def test_side_effect_commits_with_stored_response(self):
+        # Dying between the handler and storing its response must not leave
+        # the account behind for a retry to create again.
+        with mock.patch.object(
+            IdempotencyGuard, '_complete', side_effect=RuntimeError("worker died")
+        ):
+            with self.assertRaises(RuntimeError):
+                self.client.post(
+                    self.url, self.payload, format='json', HTTP_IDEMPOTENCY_KEY='k4'
+                )
+        self.assertFalse(Account.objects.exists())
+        self.assertFalse(IdempotencyRecord.objects.filter(key='k4').exists())
+
+        response = self.client.post(
+            self.url, self.payload, format='json', HTTP_IDEMPOTENCY_KEY='k4'
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Account.objects.count(), 1)
+
+    def test_stock_adjustment_applied_once(self):
+        item = Catalog.objects.create(
+            name='Lamp', description='Desk lamp', price=Decimal('20.00'),
+            category=Catalog.CategoryChoices.ELECTRONICS, stock=5,
+        )
+        self.client.force_authenticate(
+            user=SimpleNamespace(pk=1, is_authenticated=True, is_staff=True)
+        )
+        url = reverse('catalog-stock', args=[item.pk])
+        for _ in range(2):
+            response = self.client.post(
+                url, {'quantity': -2}, format='json', HTTP_IDEMPOTENCY_KEY='s1'
+            )
+            self.assertEqual(response.data['stock'], 3)
+        item.refresh_from_db()
+        self.assertEqual(item.stock, 3)
+
+
+class ConcurrentIdempotencyTest(TransactionTestCase):
+    def test_concurrent_duplicates_execute_once(self):
+        calls = []
+        request = SimpleNamespace(
+            method='POST',
+            path='/x/',
+            data={'a': 1},
+            user=SimpleNamespace(is_authenticated=False),
+        )
+        guard = IdempotencyGuard(wait_timeout=5)
+
+        def handler():
+            calls.append(1)
+            time.sleep(0.2)
+            return Response({'ok': True}, status=201)
+
+        results = []
+
+        def worker():
+            try:
+                results.append(guard.run(request, 'same', handler).status_code)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [201, 201, 201])
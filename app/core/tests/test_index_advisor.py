@@ -0,0 +1,126 @@
+# core/tests/test_index_advisor.py
+
+from io import StringIO
+from types import SimpleNamespace
+from django.core.management import call_command
+from django.db import connection
+from django.db.backends.postgresql.base import DatabaseWrapper as PostgresWrapper
+from django.test import TestCase
+from accounts.models import Account
+from myapp.models import User
+from ..index_advisor import (
+    IndexInfo,
+    declared_indexes,
+    group_queries,
+    missing_indexes,
+    model_indexes,
+    parse_query_log,
+    redundant_indexes,
+    table_writes,
+    write_amplification,
+)
+from ..querylog import QueryLogger
+
+
+class IndexAdvisorTest(TestCase):
+    def capture(self, queries, log_params=True):
+        """Run ``queries`` under the query logger and return its log lines."""
+        with self.assertLogs('core.querylog', level='INFO') as logs:
+            with connection.execute_wrapper(QueryLogger('default', 1.0, log_params)):
+                queries()
+        return [record.getMessage() for record in logs.records]
+
+    def test_query_log_redacts_parameters_by_default(self):
+        def queries():
+            list(Account.objects.filter(email='secret@example.com'))
+
+        lines = self.capture(queries, log_params=False)
+        self.assertNotIn('secret@example.com', lines[0])
+        self.assertIn('args=<redacted>', lines[0])
+        (record,) = parse_query_log(lines)
+        self.assertIsNone(record.params)
+        self.assertEqual(len(group_queries([record])), 1)
+
+    def test_duplicate_indexes_are_flagged(self):
+        flagged = {
+            found.index.name: found.reason
+            for model in (Account, User)
+            for found in redundant_indexes(model_indexes(model))
+        }
+        self.assertEqual(
+            set(flagged), {'idx_accounts_email', 'idx_accounts_username', 'idx_email'}
+        )
+        self.assertIn('unique=True', flagged['idx_email'])
+
+        out = StringIO()
+        call_command('index_advisor', 'myapp', stdout=out)
+        self.assertIn('idx_email (Meta.indexes) duplicates', out.getvalue())
+        self.assertNotIn('idx_user_type (Meta.indexes) duplicates', out.getvalue())
+
+    def test_logged_scans_get_composite_and_partial_suggestions(self):
+        def queries():
+            for i in range(3):
+                accounts = Account.objects.filter(last_name=f'name{i}')
+                list(accounts.order_by('-created_at')[:10])
+                list(Account.objects.filter(email=f'user{i}@example.com'))
+                list(User.objects.filter(account_status='inactive', name__gt=f'n{i}'))
+
+        shapes = group_queries(parse_query_log(self.capture(queries)))
+        self.assertEqual(len(shapes), 3)
+        models = {'accounts_account': Account, 'myapp_user': User}
+        indexes = {table: model_indexes(model) for table, model in models.items()}
+        suggested = {
+            (suggestion.model, tuple(suggestion.columns), suggestion.condition)
+            for suggestion in missing_indexes(shapes, models, indexes)
+        }
+        self.assertEqual(suggested, {
+            (Account, ('last_name', 'created_at DESC'), ''),
+            (User, ('name',), "\"account_status\" = 'inactive'"),
+        })
+
+    def test_write_amplification_follows_updated_columns(self):
+        lines = [
+            '(0.001) UPDATE "myapp_user" SET "name" = %s WHERE "myapp_user"."id" = %s; '
+            "args=('a', 1); alias=default",
+            '(0.001) UPDATE "myapp_user" SET "user_type" = %s '
+            'WHERE "myapp_user"."id" = %s; '
+            "args=('a', 1); alias=default",
+            'LOG:  duration: 0.5 ms  statement: '
+            'INSERT INTO "myapp_user" ("name") VALUES (\'b\')',
+        ]
+        writes = table_writes(group_queries(parse_query_log(lines)))['myapp_user']
+        self.assertEqual((writes['insert'], sum(writes['update'].values())), (1, 2))
+
+        indexes = model_indexes(User)
+        per_index, factor = write_amplification(indexes, writes, vendor='sqlite')
+        self.assertEqual((per_index['idx_user_type'], per_index['idx_email']), (2, 1))
+        # On PostgreSQL the non-HOT user_type update rewrites every index.
+        per_index, _ = write_amplification(indexes, writes, vendor='postgresql')
+        self.assertEqual(per_index['idx_email'], 2)
+        self.assertGreater(factor, 1)
+
+    def test_postgresql_like_indexes_are_declared_and_compared(self):
+        # Enough of a PostgreSQL connection for field.db_type().
+        postgres = SimpleNamespace(
+            vendor='postgresql',
+            data_types=PostgresWrapper.data_types,
+            ops=connection.ops,
+        )
+        indexes = declared_indexes(Account, postgres)
+        like = {
+            index.name: index.opclasses for index in indexes if '(LIKE)' in index.name
+        }
+        self.assertEqual(like['username (LIKE)'], ('varchar_pattern_ops',))
+        self.assertEqual(like['email (LIKE)'], ('varchar_pattern_ops',))
+
+        # A prefix index created by hand duplicates the one Django adds.
+        prefix = IndexInfo(
+            'idx_accounts_username_prefix', Account._meta.db_table, ('username',),
+            ('varchar_pattern_ops',), False, False, '', (), 'btree', 'database', None,
+        )
+        flagged = {
+            found.index.name: found.covered_by.name
+            for found in redundant_indexes(indexes + [prefix])
+        }
+        self.assertEqual(flagged['idx_accounts_username_prefix'], 'username (LIKE)')
+        self.assertNotIn('username (LIKE)', flagged)
@@ -0,0 +1,149 @@
+# core/tests/test_outbox.py
+
+from datetime import timedelta
+from unittest import mock
+from django.db import DatabaseError, transaction
+from django.test import TestCase
+from accounts.models import Account
+from ..models import OutboxEvent
+from django.utils import timezone
+from ..outbox import OutboxDispatcher, build_event, purge_outbox, record_events
+
+
+class OutboxTest(TestCase):
+    def create_account(self, username='outboxuser'):
+        return Account.objects.create(
+            username=username,
+            email=f'{username}@example.com',
+            password='securepassword123',
+            first_name='Test',
+            last_name='User',
+        )
+
+    def test_save_records_event_without_password(self):
+        account = self.create_account()
+        event = OutboxEvent.objects.get()
+        self.assertEqual(
+            (event.aggregate_type, event.aggregate_id, event.event_type),
+            ('account', str(account.pk), 'created'),
+        )
+        self.assertEqual(event.payload['username'], 'outboxuser')
+        self.assertNotIn('password', event.payload)
+
+    def test_rolled_back_change_leaves_no_event(self):
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                self.create_account()
+                raise RuntimeError
+        self.assertFalse(OutboxEvent.objects.exists())
+
+    def test_delete_records_event(self):
+        account = self.create_account()
+        pk = account.pk
+        account.delete()
+        self.assertEqual(OutboxEvent.objects.last().event_type, 'deleted')
+        self.assertEqual(OutboxEvent.objects.last().aggregate_id, str(pk))
+
+
+class OutboxDispatcherTest(TestCase):
+    def setUp(self):
+        record_events([
+            build_event('catalog', 1, 'updated'),
+            build_event('catalog', 1, 'updated'),
+            build_event('catalog', 2, 'updated'),
+        ])
+        self.dispatcher = OutboxDispatcher(max_attempts=2)
+
+    def test_delivers_batch(self):
+        handler = mock.Mock()
+        with mock.patch('core.outbox.handlers_for', return_value=[handler]):
+            self.assertEqual(self.dispatcher.drain_once(), (3, 0))
+        self.assertEqual(handler.call_count, 3)
+        self.assertFalse(
+            OutboxEvent.objects.filter(status=OutboxEvent.Status.PENDING).exists()
+        )
+
+    def test_failure_blocks_later_events_for_same_aggregate(self):
+        def handler(event):
+            if event.aggregate_id == '1':
+                raise ValueError("downstream unavailable")
+
+        with mock.patch('core.outbox.handlers_for', return_value=[handler]):
+            self.assertEqual(self.dispatcher.drain_once(), (1, 1))
+
+        first, second = OutboxEvent.objects.filter(aggregate_id='1')
+        self.assertEqual(
+            (first.status, first.attempts), (OutboxEvent.Status.PENDING, 1)
+        )
+        self.assertEqual(second.attempts, 0)
+        self.assertGreater(first.available_at, first.created_at)
+
+    def test_event_waiting_for_retry_holds_back_its_aggregate(self):
+        first = OutboxEvent.objects.filter(aggregate_id='1').first()
+        first.available_at = first.created_at + timedelta(hours=1)
+        first.save()
+
+        handler = mock.Mock()
+        with mock.patch('core.outbox.handlers_for', return_value=[handler]):
+            self.assertEqual(self.dispatcher.drain_once(), (1, 0))
+        self.assertEqual(handler.call_args[0][0].aggregate_id, '2')
+
+    def test_handler_database_error_only_rolls_back_its_event(self):
+        def handler(event):
+            # Runs with the batch leased and unlocked.
+            self.assertGreater(
+                OutboxEvent.objects.get(pk=event.pk).available_at, event.available_at
+            )
+            if event.aggregate_id == '2':
+                record_events([build_event('catalog', 9, 'partial')])
+                raise DatabaseError("handler query failed")
+
+        with mock.patch('core.outbox.handlers_for', return_value=[handler]):
+            self.assertEqual(self.dispatcher.drain_once(), (2, 1))
+
+        failed = OutboxEvent.objects.get(aggregate_id='2')
+        self.assertEqual(failed.last_error, "DatabaseError: handler query failed")
+        self.assertFalse(OutboxEvent.objects.filter(aggregate_id='9').exists())
+        self.assertEqual(
+            OutboxEvent.objects.filter(status=OutboxEvent.Status.DONE).count(), 2
+        )
+
+    def test_gives_up_after_max_attempts(self):
+        event = OutboxEvent.objects.first()
+        with mock.patch(
+            'core.outbox.handlers_for', return_value=[mock.Mock(side_effect=ValueError)]
+        ):
+            self.dispatcher._mark_failed(event, ValueError("boom"), event.created_at)
+            self.dispatcher._mark_failed(event, ValueError("boom"), event.created_at)
+        event.refresh_from_db()
+        self.assertEqual(event.status, OutboxEvent.Status.DEAD)
+
+    def test_blocked_aggregate_larger_than_batch_does_not_starve_others(self):
+        first = OutboxEvent.objects.filter(aggregate_id='1').first()
+        first.available_at = first.created_at + timedelta(hours=1)
+        first.save()
+        record_events([build_event('catalog', 1, 'updated') for _ in range(5)])
+        record_events([build_event('catalog', 3, 'updated')])
+
+        handler = mock.Mock()
+        dispatcher = OutboxDispatcher(batch_size=2)
+        with mock.patch('core.outbox.handlers_for', return_value=[handler]):
+            self.assertEqual(dispatcher.drain_once(), (2, 0))
+        delivered = sorted(call[0][0].aggregate_id for call in handler.call_args_list)
+        self.assertEqual(delivered, ['2', '3'])
+
+    def test_purge_keeps_pending_and_recent_events(self):
+        now = timezone.now()
+        OutboxEvent.objects.filter(aggregate_id='1').update(
+            status=OutboxEvent.Status.DONE, processed_at=now - timedelta(days=8),
+        )
+        OutboxEvent.objects.filter(aggregate_id='2').update(
+            status=OutboxEvent.Status.DEAD, processed_at=now - timedelta(days=1),
+        )
+        record_events([build_event('catalog', 3, 'updated')])
+
+        self.assertEqual(purge_outbox(retention_days=7), 2)
+        self.assertEqual(
+            sorted(OutboxEvent.objects.values_list('aggregate_id', flat=True)),
+            ['2', '3'],
+        )
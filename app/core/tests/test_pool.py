@@ -0,0 +1,79 @@
+# core/tests/test_pool.py
+
+import threading
+from unittest import mock
+from django.test import SimpleTestCase
+from ..db.pool import ConnectionPool, PoolTimeout
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = 0
+        self.autocommit = True
+        self.rollbacks = 0
+
+    def close(self):
+        self.closed = 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+class ConnectionPoolTest(SimpleTestCase):
+    def setUp(self):
+        self.pool = ConnectionPool(max_size=2, timeout=0.05, health_check_after=60)
+
+    def test_released_connections_are_reused(self):
+        raw = self.pool.acquire(FakeConnection)
+        self.pool.release(raw)
+        self.assertIs(self.pool.acquire(FakeConnection), raw)
+        stats = self.pool.stats()
+        self.assertEqual(
+            (stats['created'], stats['checkouts'], stats['in_use']), (1, 2, 1)
+        )
+
+    def test_open_transaction_is_rolled_back_on_release(self):
+        raw = self.pool.acquire(FakeConnection)
+        raw.autocommit = False
+        self.pool.release(raw)
+        self.assertEqual(raw.rollbacks, 1)
+
+    def test_timeout_when_exhausted(self):
+        self.pool.acquire(FakeConnection)
+        self.pool.acquire(FakeConnection)
+        with self.assertRaises(PoolTimeout):
+            self.pool.acquire(FakeConnection)
+        self.assertEqual(self.pool.stats()['timeouts'], 1)
+
+    def test_waiter_gets_released_connection(self):
+        pool = ConnectionPool(max_size=1, timeout=5)
+        raw = pool.acquire(FakeConnection)
+        threading.Timer(0.05, pool.release, args=(raw,)).start()
+        self.assertIs(pool.acquire(FakeConnection), raw)
+        self.assertEqual(pool.stats()['waits'], 1)
+
+    def test_expired_connections_are_recycled(self):
+        pool = ConnectionPool(max_size=2, max_lifetime=0)
+        raw = pool.acquire(FakeConnection)
+        pool.release(raw)
+        self.assertTrue(raw.closed)
+        self.assertIsNot(pool.acquire(FakeConnection), raw)
+        self.assertEqual(pool.stats()['recycled'], 1)
+
+    def test_failed_health_check_discards_connection(self):
+        pool = ConnectionPool(
+            max_size=2,
+            health_check_after=0,
+            ping=mock.Mock(side_effect=[OSError, None]),
+        )
+        raw = pool.acquire(FakeConnection)
+        pool.release(raw)
+        self.assertIsNot(pool.acquire(FakeConnection), raw)
+        self.assertEqual(pool.stats()['health_check_failures'], 1)
+
+    def test_connections_are_not_shared_across_fork(self):
+        raw = self.pool.acquire(FakeConnection)
+        self.pool.release(raw)
+        with mock.patch('core.db.pool.os.getpid', return_value=-1):
+            self.assertIsNot(self.pool.acquire(FakeConnection), raw)
+        self.assertFalse(raw.closed)
@@ -0,0 +1,81 @@
+# core/tests/test_projection.py
+
+from types import SimpleNamespace
+from unittest import mock
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import serializers
+from rest_framework.test import APIRequestFactory, force_authenticate
+from accounts.models import Account
+from accounts.serializers import AccountDetailSerializer
+from accounts.views import AccountViewSet
+from ..mixins import serializer_model_fields
+
+
+# Data written inside a TestCase is not visible on a replica's connection.
+@override_settings(DATABASE_REPLICAS=[])
+class FieldProjectionTest(TestCase):
+    def setUp(self):
+        for i in range(3):
+            Account.objects.create(
+                username=f'user{i}',
+                email=f'user{i}@example.com',
+                password='pbkdf2_sha256$hash',
+                first_name='Test',
+                last_name=f'User{i}',
+                address='1 Long Street',
+            )
+        self.factory = APIRequestFactory()
+        self.user = SimpleNamespace(pk=0, is_authenticated=True)
+        AccountViewSet._projection_cache = {}
+
+    def get(self, actions, path, **kwargs):
+        request = self.factory.get(path)
+        force_authenticate(request, user=self.user)
+        view = AccountViewSet.as_view(actions, throttle_classes=[])
+        # Touching a deferred field would reload the row.
+        deferred_load = mock.patch.object(
+            Account, 'refresh_from_db', side_effect=AssertionError("deferred load")
+        )
+        with CaptureQueriesContext(connection) as queries, deferred_load:
+            response = view(request, **kwargs)
+        self.assertEqual(response.status_code, 200)
+        return response, ' '.join(q['sql'] for q in queries.captured_queries)
+
+    def test_serializer_fields(self):
+        fields = serializer_model_fields(AccountDetailSerializer(), Account)
+        self.assertIn('first_name', fields)
+        self.assertNotIn('password', fields)
+
+    def test_unknown_computed_field_disables_projection(self):
+        class Opaque(serializers.ModelSerializer):
+            label = serializers.SerializerMethodField()
+
+            class Meta:
+                model = Account
+                fields = ['id', 'label']
+
+            def get_label(self, obj):
+                return str(obj)
+
+        self.assertIsNone(serializer_model_fields(Opaque(), Account))
+
+    def test_list_skips_unrendered_columns_without_deferred_loads(self):
+        response, sql = self.get({'get': 'list'}, '/accounts/')
+        self.assertEqual(len(response.data['results']), 3)
+        self.assertEqual(response.data['results'][0]['full_name'], 'Test User0')
+        self.assertNotIn('password', sql)
+
+    def test_retrieve_skips_unrendered_columns(self):
+        account = Account.objects.get(username='user1')
+        response, sql = self.get(
+            {'get': 'retrieve'}, f'/accounts/{account.pk}/', pk=account.pk
+        )
+        self.assertEqual(response.data['address'], '1 Long Street')
+        self.assertNotIn('password', sql)
+
+    def test_opt_out_loads_every_column(self):
+        with mock.patch.object(AccountViewSet, 'field_projection', False):
+            _, sql = self.get({'get': 'list'}, '/accounts/')
+        self.assertIn('password', sql)
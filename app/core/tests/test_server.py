@@ -0,0 +1,48 @@
+# core/tests/test_server.py
+
+import gc
+from types import SimpleNamespace
+from unittest import mock
+from django.test import SimpleTestCase, override_settings
+from .. import server
+from ..startup import warm_up
+
+
+class ServerHooksTest(SimpleTestCase):
+    def test_parse_smaps_rollup(self):
+        fields = server.parse_smaps_rollup(
+            "55d0c0a00000-7ffd1b5fe000 ---p 00000000 00:00 0    [rollup]\n"
+            "Rss:               46080 kB\n"
+            "Pss:               17203 kB\n"
+            "Shared_Clean:      40960 kB\n"
+            "Private_Dirty:      2048 kB\n"
+        )
+        self.assertEqual(fields['Rss'], 46080)
+        self.assertEqual(fields['Private_Dirty'], 2048)
+        self.assertNotIn('55d0c0a00000-7ffd1b5fe000 ---p 00000000 00', fields)
+
+    def test_warm_up_builds_serializer_fields(self):
+        summary = warm_up()
+        self.assertRegex(summary, r'[1-9]\d* serializers')
+
+    def test_master_freezes_before_fork_and_worker_collects_again(self):
+        self.addCleanup(gc.enable)
+        self.addCleanup(gc.unfreeze)
+        with mock.patch('core.server.warm_up', return_value=''):
+            server.when_ready(None)
+        self.assertFalse(gc.isenabled())
+
+        server.pre_fork(None, None)
+        self.assertGreater(gc.get_freeze_count(), 0)
+        server.post_fork(None, SimpleNamespace(pid=1))
+        self.assertTrue(gc.isenabled())
+
+    @override_settings(PREFORK_SERVER={'MAX_RSS_MB': 100})
+    def test_worker_over_rss_ceiling_is_retired(self):
+        worker = SimpleNamespace(pid=1, alive=True)
+        with mock.patch('core.server.current_rss_kb', return_value=50 * 1024):
+            server.post_request(worker, None, {}, None)
+        self.assertTrue(worker.alive)
+        with mock.patch('core.server.current_rss_kb', return_value=200 * 1024):
+            server.post_request(worker, None, {}, None)
+        self.assertFalse(worker.alive)
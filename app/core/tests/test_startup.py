@@ -0,0 +1,31 @@
+# core/tests/test_startup.py
+
+from django.test import SimpleTestCase
+from ..startup import _run, by_package, parse_importtime
+
+
+class StartupProfileTest(SimpleTestCase):
+    def test_parse_importtime(self):
+        modules = parse_importtime(
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   django.utils.version\n"
+            "import time:      2000 |       2120 | django\n"
+        )
+        self.assertEqual(modules['django'], (2000, 2120))
+        packages = by_package(
+            {
+                name: {'self_ms': s / 1000, 'memory_kb': 0.0}
+                for name, (s, _) in modules.items()
+            }
+        )
+        self.assertAlmostEqual(packages['django']['self_ms'], 2.12)
+
+    def test_worker_boot_does_not_load_phone_metadata(self):
+        result, _ = _run(
+            'config.wsgi',
+            epilogue=(
+                "result['loaded'] = sorted(\n"
+                "    m for m in sys.modules if m.startswith('phonenumbers'))\n"
+            ),
+        )
+        self.assertEqual(result['loaded'], [])
@@ -0,0 +1,9 @@
+# core/urls.py
+
+from django.urls import path
+from .views import DatabasePoolStatsView, OutboxStatsView
+
+urlpatterns = [
+    path('db-pool/', DatabasePoolStatsView.as_view(), name='db-pool-stats'),
+    path('outbox/', OutboxStatsView.as_view(), name='outbox-stats'),
+]
@@ -0,0 +1,63 @@
+# core/views.py
+
+from rest_framework import status
+from rest_framework.permissions import AllowAny, IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from .batch import BatchExecutor, get_batch_settings
+from .db.pool import pool_stats
+from .outbox import outbox_stats
+
+
+class DatabasePoolStatsView(APIView):
+    """
+    Connection pool stats (in use, idle, wait time) for this process.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response(pool_stats())
+
+
+class OutboxStatsView(APIView):
+    """
+    Outbox backlog and delivery lag.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response(outbox_stats())
+
+
+class BatchView(APIView):
+    """
+    Run several account/catalog API calls in one round trip.
+
+    Body: ``{"requests": [{"id": "...", "method": "GET",
+    "path": "/accounts/accounts/1/", "body": {...}, "headers": {...}}, ...]}``.
+    Each sub-request is checked against its own view's permissions and
+    throttles; responses come back in request order. ``Idempotency-Key`` goes
+    in a sub-request's own ``headers``.
+    """
+    permission_classes = [AllowAny]
+
+    def post(self, request, *args, **kwargs):
+        options = get_batch_settings()
+        specs = request.data.get('requests') if isinstance(request.data, dict) else None
+        if not isinstance(specs, list) or not all(isinstance(s, dict) for s in specs):
+            return Response(
+                {'error': 'Expected a list of sub-requests in "requests"'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(specs) > options['MAX_REQUESTS']:
+            limit = options['MAX_REQUESTS']
+            return Response(
+                {'error': f"A batch may contain at most {limit} requests"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        executor = BatchExecutor(
+            request,
+            allowed_prefixes=options['ALLOWED_PREFIXES'],
+        )
+        return Response({'responses': executor.run(specs)})
@@ -0,0 +1,43 @@
+"""
+URL configuration for requests served over ASGI (see ASGI_URLCONF).
+
+Account and catalog reads go to async-native views; writes on the same URLs
+and every other route fall through to the regular URL configuration.
+"""
+from django.urls import path
+from accounts.views import (
+    AccountViewSet,
+    AsyncAccountDetailView,
+    AsyncAccountListView,
+    AsyncAccountSearchView,
+)
+from catalog.views import AsyncCatalogSearchView
+from core.async_views import read_write_view
+from .urls import urlpatterns as sync_urlpatterns
+
+urlpatterns = [
+    path(
+        'accounts/accounts/',
+        read_write_view(
+            AsyncAccountListView.as_view(),
+            AccountViewSet.as_view({'post': 'create'}),
+        ),
+        name='account-list',
+    ),
+    path(
+        'accounts/accounts/search/',
+        AsyncAccountSearchView.as_view(),
+        name='account-search',
+    ),
+    path(
+        'accounts/accounts/<int:pk>/',
+        read_write_view(
+            AsyncAccountDetailView.as_view(),
+            AccountViewSet.as_view(
+                {'put': 'update', 'patch': 'partial_update', 'delete': 'destroy'}
+            ),
+        ),
+        name='account-detail',
+    ),
+    path('catalog/search/', AsyncCatalogSearchView.as_view(), name='catalog-search'),
+] + sync_urlpatterns
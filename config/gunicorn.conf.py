@@ -0,0 +1,34 @@
+# config/gunicorn.conf.py
+"""
+Gunicorn configuration for production.
+
+Run from the project root with ``gunicorn -c config/gunicorn.conf.py``. The
+application is imported once in the master and shared copy-on-write with
+the workers; the hooks live in ``core/server.py``.
+"""
+import os
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(BASE_DIR), str(BASE_DIR / 'app')]
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+wsgi_app = 'config.wsgi:application'
+preload_app = True
+
+bind = os.getenv('SERVER_BIND', '127.0.0.1:8000')
+workers = int(os.getenv('SERVER_WORKERS', 4))
+# Stagger restarts so workers do not all recycle at once.
+max_requests = int(os.getenv('SERVER_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.getenv('SERVER_MAX_REQUESTS_JITTER', 100))
+timeout = int(os.getenv('SERVER_TIMEOUT', 30))
+graceful_timeout = int(os.getenv('SERVER_GRACEFUL_TIMEOUT', 30))
+
+
+from core import server as hooks  # noqa: E402
+
+when_ready = hooks.when_ready
+pre_fork = hooks.pre_fork
+post_fork = hooks.post_fork
+post_request = hooks.post_request
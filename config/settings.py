@@ -64,12 +64,13 @@ INSTALLED_APPS = [
     # Third-party apps
     'django_filters',
     'rest_framework',
-    'rest_framework_simplejwt'
-    'phonenumber_field',
+    'rest_framework_simplejwt',
 
     # Local apps
+    'core',
     'myapp',
     'accounts',
+    'catalog',
 ]
 
 MIDDLEWARE = [
@@ -80,10 +81,21 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.middleware.ReplicaPinningMiddleware',
+    'core.middleware.ASGIURLConfMiddleware',
 ]
 
 ROOT_URLCONF = 'gshop.urls'
 
+# Requests that arrive through config/asgi.py are resolved with this URLconf,
+# which serves account and catalog reads from async-native views.
+ASGI_URLCONF = 'config.asgi_urls'
+
+# NDJSON streaming (?stream=true) on the async list views
+ASYNC_VIEWS = {
+    'STREAM_CHUNK_SIZE': int(os.getenv('ASYNC_STREAM_CHUNK_SIZE', '500')),
+}
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
@@ -106,15 +118,56 @@ WSGI_APPLICATION = 'gshop.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
+# With DB_POOL=True connections come from a per-process pool (see
+# core/db/pool.py) and are returned to it at the end of every request, which
+# is what the ASGI entry point wants. Without it, DB_CONN_MAX_AGE keeps one
+# persistent connection per worker thread.
+DB_POOL_ENABLED = os.getenv('DB_POOL', 'False') == 'True'
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
+        'ENGINE': 'core.db.backends.postgresql',
         'NAME': os.getenv('DB_NAME'),
         'USER': os.getenv('DB_USER'),
         'PASSWORD': os.getenv('DB_PASSWORD'),
         'HOST': os.getenv('DB_HOST'),
         'PORT': os.getenv('DB_PORT'),
+        'CONN_MAX_AGE': (
+            0 if DB_POOL_ENABLED else int(os.getenv('DB_CONN_MAX_AGE', '60'))
+        ),
+        'CONN_HEALTH_CHECKS': True,
+        'POOL': {
+            'ENABLED': DB_POOL_ENABLED,
+            'MAX_SIZE': int(os.getenv('DB_POOL_MAX_SIZE', '20')),
+            'TIMEOUT': 10,
+            'MAX_LIFETIME': 1800,
+            'HEALTH_CHECK_AFTER': 5,
+        },
+    }
+}
+
+# Read replicas, e.g. DB_REPLICA_HOSTS=replica-1.internal,replica-2.internal.
+# Under test they mirror `default`, so any local database setup works.
+DATABASE_REPLICAS = []
+replica_hosts = filter(None, os.getenv('DB_REPLICA_HOSTS', '').split(','))
+for index, host in enumerate(replica_hosts):
+    alias = f'replica_{index}'
+    DATABASES[alias] = {
+        **DATABASES['default'],
+        'HOST': host.strip(),
+        'TEST': {'MIRROR': 'default'},
     }
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ['core.db_router.ReplicaRouter']
+
+# Read-your-writes pinning and replica ejection (see core/db_router.py)
+REPLICA_ROUTING = {
+    'PIN_SECONDS': 5,
+    'MAX_LAG_SECONDS': 10,
+    'CHECK_INTERVAL': 5,
+    'COOKIE_NAME': 'db_pin',
+    'HEADER': 'X-DB-Pin',
 }
 
 # Password validation
@@ -169,7 +222,7 @@ REST_FRAMEWORK = {
         'rest_framework.authentication.SessionAuthentication',
         'rest_framework.authentication.BasicAuthentication',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'core.pagination.EstimatedCountPagination',
     'PAGE_SIZE': 10,
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
@@ -185,9 +238,86 @@ REST_FRAMEWORK = {
     ],
     'DEFAULT_THROTTLE_RATES': {
         'user': '1000/day',
-        'anon': '100/day'
+        'anon': '100/day',
+        'availability': '60/min',
     }
 }
+# Unfiltered list/changelist counts use planner estimates above this many rows
+COUNT_ESTIMATE_THRESHOLD = 100000
+# Cold-start budget for a worker boot (see `manage.py startup_profile`)
+STARTUP_PROFILE = {
+    'TARGET_MS': 500,
+}
+# Gunicorn worker hooks (see config/gunicorn.conf.py and core/server.py)
+PREFORK_SERVER = {
+    'MAX_RSS_MB': int(os.getenv('SERVER_MAX_RSS_MB', 512)),
+}
+# Multiplexed sub-requests (see core/batch.py and /batch/)
+BATCH_REQUESTS = {
+    'MAX_REQUESTS': 20,
+    'ALLOWED_PREFIXES': ['/accounts/', '/catalog/'],
+}
+# Replayed replies for retried requests (see core/idempotency.py)
+IDEMPOTENCY = {
+    'TTL': 86400,
+    'WAIT_TIMEOUT': 10,
+    'LOCK_TIMEOUT': 60,
+}
+# Hot/cold archival (see core/archive.py and `manage.py archive_cold_rows`)
+ARCHIVAL = {
+    'BATCH_SIZE': int(os.getenv('ARCHIVE_BATCH_SIZE', '500')),
+    'PAUSE': float(os.getenv('ARCHIVE_PAUSE', '0.05')),
+    'ACCOUNT_DORMANT_DAYS': int(os.getenv('ACCOUNT_DORMANT_DAYS', '730')),
+}
+# Sampled SQL log for `manage.py index_advisor --log logs/queries.log`
+# (see core/querylog.py)
+QUERY_LOG = {
+    'ENABLED': os.getenv('QUERY_LOG_ENABLED', 'False') == 'True',
+    'SAMPLE_RATE': float(os.getenv('QUERY_LOG_SAMPLE_RATE', '0.01')),
+    # Bound parameters include password hashes and emails; off by default.
+    'LOG_PARAMS': os.getenv('QUERY_LOG_PARAMS', 'False') == 'True',
+}
+# Outbox delivery (see core/outbox.py and `manage.py drain_outbox`)
+OUTBOX = {
+    'BATCH_SIZE': 100,
+    'MAX_ATTEMPTS': 10,
+    'RETRY_BACKOFF': 5,
+    'MAX_BACKOFF': 3600,
+    'POLL_INTERVAL': 1,
+    # A claimed batch is redelivered if not finished within this many seconds.
+    'LEASE_SECONDS': 300,
+    # Delivered and dead events are deleted this long after processing.
+    'RETENTION_DAYS': 7,
+}
+
+# Write-behind buffer for Catalog.update_stock (see catalog/buffers.py)
+CATALOG_STOCK_BUFFER = {
+    'ENABLED': os.getenv('CATALOG_STOCK_BUFFER_ENABLED', 'False') == 'True',
+    'MAX_ITEMS': 500,
+    'FLUSH_INTERVAL': 0.5,
+    'DATABASE': 'default',
+}
+
+# Bloom filters behind /accounts/availability/ (see accounts/availability.py)
+ACCOUNT_AVAILABILITY = {
+    'FALSE_POSITIVE_RATE': 0.01,
+    'REBUILD_INTERVAL': 3600,
+    'CAPACITY_HEADROOM': 1.5,
+    'MIN_CAPACITY': 10000,
+}
+
+# PATCH /accounts/accounts/bulk/ (see accounts/bulk.py)
+ACCOUNT_BULK_UPDATE = {
+    'MAX_ITEMS': 10000,
+    'BATCH_SIZE': 1000,
+}
+
+# Prefix index behind /accounts/autocomplete/ (see accounts/autocomplete.py)
+ACCOUNT_AUTOCOMPLETE = {
+    'LIMIT': 10,
+    'MAX_LIMIT': 50,
+    'LATENCY_BUDGET_MS': 20,
+}
 
 
 # Logging configuration
@@ -215,6 +345,13 @@ LOGGING = {
             'class': 'logging.StreamHandler',
             'formatter': 'simple',
         },
+        'querylog': {
+            'level': 'INFO',
+            'class': 'logging.FileHandler',
+            'filename': os.path.join(BASE_DIR, 'logs/queries.log'),
+            'formatter': 'verbose',
+            'delay': True,
+        },
     },
     'loggers': {
         '': {
@@ -232,6 +369,11 @@ LOGGING = {
             'level': 'DEBUG',
             'propagate': False,
         },
+        'core.querylog': {
+            'handlers': ['querylog'],
+            'level': 'INFO',
+            'propagate': False,
+        },
     },
     'root': {
         'handlers': ['console', 'file'],
@@ -16,8 +16,13 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
+from core.views import BatchView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('accounts/', include('accounts.urls')),
+    path('catalog/', include('catalog.urls')),
+    path('internal/', include('core.urls')),
+    path('users/', include('myapp.urls')),
+    path('batch/', BatchView.as_view(), name='batch'),
 ]
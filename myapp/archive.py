@@ -0,0 +1,26 @@
+# archive.py
+"""
+Archival of inactive users: ``User`` rows with ``AccountStatus.INACTIVE``
+move to ``ArchivedUser``. They still count in the daily rollups.
+
+Users have no login or lookup view of their own, so nothing restores them
+implicitly: code that looks a user up should use
+``user_archive.get_or_restore``. A restored user is still inactive and goes
+back at the next run unless it is reactivated.
+"""
+from core.archive import Archive, register_archive
+from .models import ArchivedUser, User
+from .models.user import AccountStatus
+
+
+def inactive_users():
+    return User.objects.filter(account_status=AccountStatus.INACTIVE)
+
+
+user_archive = register_archive(Archive(
+    'users',
+    User,
+    ArchivedUser,
+    cold=inactive_users,
+    unique_fields=('email',),
+))
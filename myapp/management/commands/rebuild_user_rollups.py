@@ -0,0 +1,47 @@
+# management/commands/rebuild_user_rollups.py
+
+from argparse import ArgumentTypeError
+from datetime import date
+from django.core.management.base import BaseCommand
+from ...rollups import rebuild_rollups
+
+
+def _date(value):
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ArgumentTypeError(f"Not a date (YYYY-MM-DD): {value}")
+
+
+class Command(BaseCommand):
+    help = (
+        "Backfill or repair the daily user rollups from myapp.User. "
+        "Only counters that differ are rewritten."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--start', type=_date, help="First join day to check (default: all)."
+        )
+        parser.add_argument(
+            '--end', type=_date, help="Last join day to check (default: all)."
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true', help="Report drift without fixing it."
+        )
+        parser.add_argument('--database', default='default')
+
+    def handle(self, *args, **options):
+        drift = rebuild_rollups(
+            options['start'],
+            options['end'],
+            using=options['database'],
+            dry_run=options['dry_run'],
+        )
+        for (day, user_type, account_status), (stored, actual) in sorted(drift.items()):
+            self.stdout.write(
+                f"{day} {user_type}/{account_status}: {stored} -> {actual}"
+            )
+
+        verb = 'would fix' if options['dry_run'] else 'fixed'
+        self.stdout.write(self.style.SUCCESS(f"{verb} {len(drift)} counters"))
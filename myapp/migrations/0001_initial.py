@@ -0,0 +1,53 @@
+# Generated by Django 4.2 on 2024-12-13 09:00
+
+import core.outbox
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='User',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100)),
+                ('email', models.EmailField(max_length=254, unique=True)),
+                ('password', models.CharField(max_length=255)),
+                (
+                    'phone_number',
+                    models.CharField(blank=True, max_length=15, null=True),
+                ),
+                (
+                    'user_type',
+                    models.CharField(
+                        choices=[('admin', 'Admin'), ('customer', 'Customer')],
+                        max_length=10,
+                    ),
+                ),
+                (
+                    'account_status',
+                    models.CharField(
+                        choices=[('active', 'Active'), ('inactive', 'Inactive')],
+                        default='active',
+                        max_length=10,
+                    ),
+                ),
+                ('date_joined', models.DateTimeField(auto_now_add=True)),
+            ],
+            bases=(core.outbox.OutboxMixin, models.Model),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['email'], name='idx_email'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['user_type'], name='idx_user_type'),
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 4.2 on 2024-12-13 09:00
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+
+def backfill_rollups(apps, schema_editor):
+    User = apps.get_model('myapp', 'User')
+    UserDailyStat = apps.get_model('myapp', 'UserDailyStat')
+    db = schema_editor.connection.alias
+    rows = (
+        User.objects.using(db)
+        .annotate(day=TruncDate('date_joined'))
+        .values('day', 'user_type', 'account_status')
+        .annotate(users=Count('pk'))
+        .order_by()
+    )
+    UserDailyStat.objects.using(db).bulk_create(
+        [UserDailyStat(**row) for row in rows.iterator()],
+        batch_size=2000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserDailyStat',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('day', models.DateField()),
+                (
+                    'user_type',
+                    models.CharField(
+                        choices=[('admin', 'Admin'), ('customer', 'Customer')],
+                        max_length=10,
+                    ),
+                ),
+                (
+                    'account_status',
+                    models.CharField(
+                        choices=[('active', 'Active'), ('inactive', 'Inactive')],
+                        max_length=10,
+                    ),
+                ),
+                ('users', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='userdailystat',
+            constraint=models.UniqueConstraint(
+                fields=('day', 'user_type', 'account_status'),
+                name='uniq_user_daily_stat',
+            ),
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 4.2 on 2024-12-14 09:00
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0002_userdailystat'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedUser',
+            fields=[
+                (
+                    'archived_at',
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ('id', models.IntegerField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100)),
+                ('email', models.EmailField(max_length=254, unique=True)),
+                ('password', models.CharField(max_length=255)),
+                (
+                    'phone_number',
+                    models.CharField(blank=True, max_length=15, null=True),
+                ),
+                (
+                    'user_type',
+                    models.CharField(
+                        choices=[('admin', 'Admin'), ('customer', 'Customer')],
+                        max_length=10,
+                    ),
+                ),
+                (
+                    'account_status',
+                    models.CharField(
+                        choices=[('active', 'Active'), ('inactive', 'Inactive')],
+                        max_length=10,
+                    ),
+                ),
+                ('date_joined', models.DateTimeField()),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
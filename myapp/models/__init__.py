@@ -1,2 +1,4 @@
 # models/__init__.py
-from .user import User
\ No newline at end of file
+from .user import User  # noqa: F401
+from .stats import UserDailyStat  # noqa: F401
+from .archive import ArchivedUser  # noqa: F401
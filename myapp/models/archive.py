@@ -0,0 +1,23 @@
+# models/archive.py
+
+from django.db import models
+from core.archive import ArchivedModel
+from .user import AccountStatus, UserType
+
+
+class ArchivedUser(ArchivedModel):
+    """
+    An inactive ``User`` moved out of the hot table by ``myapp.archive``.
+    Same columns and primary key; restored by ``user_archive.get_or_restore``.
+    """
+    id = models.IntegerField(primary_key=True)
+    name = models.CharField(max_length=100)
+    email = models.EmailField(unique=True)
+    password = models.CharField(max_length=255)
+    phone_number = models.CharField(max_length=15, blank=True, null=True)
+    user_type = models.CharField(max_length=10, choices=UserType.choices)
+    account_status = models.CharField(max_length=10, choices=AccountStatus.choices)
+    date_joined = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.name} ({self.user_type}, archived)"
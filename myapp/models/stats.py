@@ -0,0 +1,26 @@
+# models/stats.py
+
+from django.db import models
+from .user import AccountStatus, UserType
+
+
+class UserDailyStat(models.Model):
+    """
+    Number of users who joined on ``day`` with a given type and current
+    status. Maintained by ``myapp.rollups``; never edit rows by hand.
+    """
+    day = models.DateField()  # Day the users joined (in TIME_ZONE)
+    user_type = models.CharField(max_length=10, choices=UserType.choices)
+    account_status = models.CharField(max_length=10, choices=AccountStatus.choices)
+    users = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['day', 'user_type', 'account_status'],
+                name='uniq_user_daily_stat',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.user_type}/{self.account_status}: {self.users}"
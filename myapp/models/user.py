@@ -1,7 +1,8 @@
 # models.py
 
-from django.db import models
+from django.db import models, router, transaction
 from django.core.exceptions import ValidationError
+from core.outbox import OutboxMixin
 import logging
 
 # Configure logging
@@ -15,7 +16,11 @@ class AccountStatus(models.TextChoices):
     ACTIVE = 'active', 'Active'
     INACTIVE = 'inactive', 'Inactive'
 
-class User(models.Model):
+
+class User(OutboxMixin, models.Model):
+    outbox_aggregate = 'user'
+    outbox_exclude = ('password',)
+
     id = models.AutoField(primary_key=True)  # Unique identifier for each user
     name = models.CharField(max_length=100)  # Full name of the user
     email = models.EmailField(unique=True)    # Unique email address for the user
@@ -40,13 +45,29 @@ class User(models.Model):
             raise ValidationError('Password cannot be empty.')
 
     def save(self, *args, **kwargs):
+        from ..archive import user_archive
+        from ..rollups import track_user_save
+
         self.clean()  # Validate before saving
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
         try:
-            super().save(*args, **kwargs)  # Call the original save method
+            # Keep the daily rollups in step with the row
+            with transaction.atomic(using=using, savepoint=False), \
+                    track_user_save(self, using, kwargs.get('update_fields')):
+                super().save(*args, **kwargs)  # Call the original save method
+                # Emails stay unique across archived users too
+                user_archive.ensure_unique(self, using, kwargs.get('update_fields'))
             logger.info(f'User {self.name} saved successfully.')
         except Exception as e:
             logger.error(f'Error saving user {self.name}: {e}')
             raise  # Re-raise the exception after logging
 
+    def delete(self, *args, **kwargs):
+        from ..rollups import track_user_delete
+
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        with track_user_delete(self, using):
+            return super().delete(*args, **kwargs)
+
     def __str__(self):
-        return f"{self.name} ({self.user_type})"
\ No newline at end of file
+        return f"{self.name} ({self.user_type})"
@@ -0,0 +1,249 @@
+# rollups.py
+"""
+Daily rollups of users by join day, type and status.
+
+``UserDailyStat`` holds one counter per (day joined, user type, current
+status). ``User.save`` and ``User.delete`` move users between counters in
+the same transaction as the change. Status changes made with
+``set_account_status`` do the same for many users at once. Other
+set-based writes (``QuerySet.update``/``delete``, raw SQL) bypass the
+rollups; ``rebuild_user_rollups`` repairs any drift. Archiving a user
+(``myapp.archive``) leaves its counter alone.
+
+Dashboards read the rollups with ``user_stats``. It sums pre-aggregated
+rows, so the cost depends on the number of days asked for, not the number
+of users.
+"""
+import logging
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, router, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from core.outbox import build_event, record_events
+from .models import ArchivedUser, User, UserDailyStat
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_FIELDS = {'date_joined', 'user_type', 'account_status'}
+GROUP_FIELDS = ('day', 'user_type', 'account_status')
+
+
+def join_day(value):
+    """The day ``value`` (a ``date_joined``) falls on in the current time zone."""
+    if timezone.is_aware(value):
+        value = timezone.localtime(value)
+    return value.date()
+
+
+def rollup_key(user):
+    return (join_day(user.date_joined), user.user_type, user.account_status)
+
+
+def stored_key(pk, using='default'):
+    """The rollup key of the user row as committed, locked for update."""
+    row = (
+        User._base_manager.using(using)
+        .select_for_update()
+        .filter(pk=pk)
+        .values_list('date_joined', 'user_type', 'account_status')
+        .first()
+    )
+    if row is None:
+        return None
+    return (join_day(row[0]), row[1], row[2])
+
+
+def apply_deltas(deltas, using='default'):
+    """Add ``{(day, user_type, account_status): delta}`` to the rollups."""
+    stats = UserDailyStat.objects.using(using)
+    for (day, user_type, account_status), delta in sorted(deltas.items()):
+        if not delta:
+            continue
+        key = {'day': day, 'user_type': user_type, 'account_status': account_status}
+        if stats.filter(**key).update(users=F('users') + delta):
+            continue
+        try:
+            with transaction.atomic(using=using):
+                stats.create(users=delta, **key)
+        except IntegrityError:
+            # Another transaction created the row first.
+            stats.filter(**key).update(users=F('users') + delta)
+
+
+@contextmanager
+def track_user_save(user, using, update_fields=None):
+    """Wrap ``User.save``: moves the user to the counter it now belongs to."""
+    if update_fields is not None and not ROLLUP_FIELDS & set(update_fields):
+        yield
+        return
+    with transaction.atomic(using=using, savepoint=False):
+        before = None if user._state.adding else stored_key(user.pk, using)
+        yield
+        after = rollup_key(user)
+        if before != after:
+            deltas = Counter({after: 1})
+            if before is not None:
+                deltas[before] -= 1
+            apply_deltas(deltas, using)
+
+
+@contextmanager
+def track_user_delete(user, using):
+    """Wrap ``User.delete``: takes the user out of its counter."""
+    with transaction.atomic(using=using, savepoint=False):
+        before = stored_key(user.pk, using)
+        yield
+        if before is not None:
+            apply_deltas({before: -1}, using)
+
+
+def set_account_status(users, account_status):
+    """
+    Set ``account_status`` on every user in the ``users`` queryset in one
+    ``UPDATE``, moving them between rollup counters and recording outbox
+    events. Returns the number of users whose status changed.
+    """
+    using = router.db_for_write(User)
+    with transaction.atomic(using=using):
+        changing = (
+            users.using(using)
+            .select_for_update()
+            .exclude(account_status=account_status)
+        )
+        rows = list(
+            changing.values_list('pk', 'date_joined', 'user_type', 'account_status')
+        )
+        if not rows:
+            return 0
+
+        deltas = Counter()
+        for pk, date_joined, user_type, previous in rows:
+            day = join_day(date_joined)
+            deltas[(day, user_type, previous)] -= 1
+            deltas[(day, user_type, account_status)] += 1
+
+        pks = [row[0] for row in rows]
+        User._base_manager.using(using).filter(pk__in=pks).update(
+            account_status=account_status
+        )
+        apply_deltas(deltas, using)
+        record_events(
+            [
+                build_event(
+                    User.outbox_aggregate,
+                    pk,
+                    'updated',
+                    {'id': pk, 'account_status': account_status},
+                )
+                for pk in pks
+            ],
+            using=using,
+        )
+    logger.info(f"Set account_status={account_status} on {len(rows)} users")
+    return len(rows)
+
+
+def _day_range(start, end):
+    """``date_joined`` bounds covering the days ``start``..``end`` inclusive."""
+    bounds = {}
+    if start is not None:
+        bounds['date_joined__gte'] = _day_start(start)
+    if end is not None:
+        bounds['date_joined__lt'] = _day_start(end + timedelta(days=1))
+    return bounds
+
+
+def _day_start(day):
+    value = datetime.combine(day, time.min)
+    if settings.USE_TZ:
+        value = timezone.make_aware(value)
+    return value
+
+
+def computed_rollups(start=None, end=None, using='default'):
+    """
+    Rollup counters computed with a full ``GROUP BY`` over ``User`` and
+    ``ArchivedUser`` (archived users still count).
+    """
+    counters = Counter()
+    for model in (User, ArchivedUser):
+        rows = (
+            model._base_manager.using(using)
+            .filter(**_day_range(start, end))
+            .annotate(day=TruncDate('date_joined'))
+            .values(*GROUP_FIELDS)
+            .annotate(users=Count('pk'))
+            .order_by()
+        )
+        for row in rows:
+            key = (row['day'], row['user_type'], row['account_status'])
+            counters[key] += row['users']
+    return dict(counters)
+
+
+def stored_rollups(start=None, end=None, using='default'):
+    stats = UserDailyStat.objects.using(using)
+    if start is not None:
+        stats = stats.filter(day__gte=start)
+    if end is not None:
+        stats = stats.filter(day__lte=end)
+    rows = stats.values_list(*GROUP_FIELDS, 'users')
+    return {
+        (day, user_type, account_status): users
+        for day, user_type, account_status, users in rows
+    }
+
+
+def rebuild_rollups(start=None, end=None, using='default', dry_run=False):
+    """
+    Recompute the rollups for ``start``..``end`` (all days by default) and
+    fix every counter that differs. Returns ``{key: (stored, actual)}`` for
+    the counters that were (or, with ``dry_run``, would be) changed.
+    """
+    with transaction.atomic(using=using):
+        actual = computed_rollups(start, end, using)
+        stored = stored_rollups(start, end, using)
+        drift = {
+            key: (stored.get(key, 0), actual.get(key, 0))
+            for key in set(actual) | set(stored)
+            if stored.get(key, 0) != actual.get(key, 0)
+        }
+        if dry_run or not drift:
+            return drift
+
+        stats = UserDailyStat.objects.using(using)
+        stale = [key for key, (_, count) in drift.items() if not count]
+        for day, user_type, account_status in stale:
+            stats.filter(
+                day=day, user_type=user_type, account_status=account_status
+            ).delete()
+        apply_deltas(
+            {key: count - before for key, (before, count) in drift.items() if count},
+            using,
+        )
+    return drift
+
+
+def user_stats(start=None, end=None, group_by=GROUP_FIELDS, using='default'):
+    """
+    Users who joined between ``start`` and ``end`` (inclusive), summed over
+    the rollups and grouped by any of ``day``, ``user_type`` and
+    ``account_status``.
+    """
+    stats = UserDailyStat.objects.using(using).filter(users__gt=0)
+    if start is not None:
+        stats = stats.filter(day__gte=start)
+    if end is not None:
+        stats = stats.filter(day__lte=end)
+    if not group_by:
+        return [{'users': stats.aggregate(users=Sum('users'))['users'] or 0}]
+    return list(
+        stats.values(*group_by)
+        .annotate(users=Sum('users'))
+        .order_by(*group_by)
+    )
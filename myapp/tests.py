@@ -1,3 +1,112 @@
+# tests.py
+
+from datetime import timedelta
+from functools import partial
+from io import StringIO
+from types import SimpleNamespace
+from django.core.management import call_command
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from .models import User, UserDailyStat
+from .rollups import rollup_key, set_account_status, stored_rollups, user_stats
+
+
+def make_user(name, user_type='customer', **kwargs):
+    return User.objects.create(
+        name=name,
+        email=f'{name}@example.com',
+        password='secret',
+        user_type=user_type,
+        **kwargs
+    )
+
+
+class UserRollupTest(TestCase):
+    def test_save_and_delete_keep_counters_in_step(self):
+        alice = make_user('alice')
+        make_user('bob')
+        make_user('root', user_type='admin')
+        day = rollup_key(alice)[0]
+        self.assertEqual(stored_rollups(), {
+            (day, 'customer', 'active'): 2,
+            (day, 'admin', 'active'): 1,
+        })
+
+        alice.account_status = 'inactive'
+        alice.save()
+        alice.save(update_fields=['name'])
+        User.objects.get(name='bob').delete()
+        rollups = stored_rollups()
+        self.assertEqual(rollups[(day, 'customer', 'active')], 0)
+        self.assertEqual(rollups[(day, 'customer', 'inactive')], 1)
+
+    def test_set_account_status_moves_users_in_bulk(self):
+        for name in ('carol', 'dave', 'erin'):
+            make_user(name)
+        changed = set_account_status(
+            User.objects.filter(name__in=['carol', 'dave']), 'inactive'
+        )
+        self.assertEqual(changed, 2)
+        totals = {
+            row['account_status']: row['users']
+            for row in user_stats(group_by=['account_status'])
+        }
+        self.assertEqual(totals, {'active': 1, 'inactive': 2})
+
+    def test_rebuild_repairs_drift(self):
+        make_user('frank')
+        make_user('grace')
+        # Set-based writes bypass the rollups.
+        User.objects.filter(name='frank').update(
+            date_joined=timezone.now() - timedelta(days=3),
+            account_status='inactive',
+        )
+        UserDailyStat.objects.create(
+            day=timezone.localdate() - timedelta(days=30),
+            user_type='admin',
+            account_status='active',
+            users=5,
+        )
+        out = StringIO()
+        call_command('rebuild_user_rollups', stdout=out)
+        self.assertIn('fixed 3 counters', out.getvalue())
+        self.assertEqual(
+            {key: users for key, users in stored_rollups().items() if users},
+            {
+                (timezone.localdate(), 'customer', 'active'): 1,
+                (timezone.localdate() - timedelta(days=3), 'customer', 'inactive'): 1,
+            },
+        )
+
+
+class UserStatsViewTest(APITestCase):
+    def setUp(self):
+        self.client.force_authenticate(
+            user=SimpleNamespace(pk=1, is_authenticated=True, is_staff=True)
+        )
+        self.url = reverse('user-stats')
+
+    def test_sums_rollups_over_a_range(self):
+        today = timezone.localdate()
+        stat = partial(UserDailyStat, user_type='customer', account_status='active')
+        UserDailyStat.objects.bulk_create([
+            stat(day=today - timedelta(days=10), users=4),
+            stat(day=today - timedelta(days=2), users=3),
+            stat(day=today - timedelta(days=1), account_status='inactive', users=2),
+            stat(day=today - timedelta(days=1), user_type='admin', users=1),
+        ])
+        response = self.client.get(self.url, {
+            'start': (today - timedelta(days=7)).isoformat(),
+            'group_by': 'user_type',
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(row['user_type'], row['users']) for row in response.data['results']],
+            [('admin', 1), ('customer', 5)],
+        )
 
-# Create your tests here.
+    def test_rejects_unknown_grouping(self):
+        response = self.client.get(self.url, {'group_by': 'email'})
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,8 @@
+# urls.py
+
+from django.urls import path
+from .views import UserStatsView
+
+urlpatterns = [
+    path('stats/', UserStatsView.as_view(), name='user-stats'),
+]
@@ -1,3 +1,50 @@
-from django.shortcuts import render
+# views.py
 
-# Create your views here.
+from datetime import date
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from .rollups import GROUP_FIELDS, user_stats
+
+
+class UserStatsView(APIView):
+    """
+    Signups and status counts from the daily user rollups.
+
+    Query parameters: ``start`` and ``end`` (inclusive ``YYYY-MM-DD`` join
+    days, both optional) and ``group_by``, a comma-separated subset of
+    ``day``, ``user_type`` and ``account_status`` (default: all three; empty
+    for a single total).
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        params = request.query_params
+        try:
+            start = date.fromisoformat(params['start']) if params.get('start') else None
+            end = date.fromisoformat(params['end']) if params.get('end') else None
+        except ValueError:
+            return Response(
+                {'error': 'start and end must be dates (YYYY-MM-DD)'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if start and end and start > end:
+            return Response(
+                {'error': 'start must not be after end'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        group_by = params.get('group_by', ','.join(GROUP_FIELDS))
+        group_by = [field for field in group_by.split(',') if field]
+        unknown = set(group_by) - set(GROUP_FIELDS)
+        if unknown:
+            return Response(
+                {'error': f"Cannot group by: {', '.join(sorted(unknown))}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        rows = user_stats(start, end, group_by=group_by)
+        return Response(
+            {'start': start, 'end': end, 'group_by': group_by, 'results': rows}
+        )